@@ -5,3 +5,6 @@ class CommentConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.comment"
     verbose_name = "댓글"
+
+    def ready(self):
+        from . import signals  # noqa: F401
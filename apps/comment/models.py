@@ -1,6 +1,7 @@
 from django.contrib.auth import get_user_model
 from django.contrib.contenttypes.fields import GenericRelation
-from django.db import models
+from django.db import models, transaction
+from django.db.models import F
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
@@ -41,6 +42,7 @@ class Comment(models.Model):
     )
     created_at = models.DateTimeField(auto_now_add=True, verbose_name=_("생성일"))
     updated_at = models.DateTimeField(auto_now=True, verbose_name=_("수정일"))
+    likes_count = models.PositiveIntegerField(default=0, verbose_name=_("좋아요 수"))
     is_deleted = models.BooleanField(default=False, verbose_name=_("삭제여부"))
     deleted_at = models.DateTimeField(null=True, blank=True)
     deleted_by = models.ForeignKey(
@@ -69,25 +71,31 @@ class Comment(models.Model):
         return f"{self.author.username}의 댓글: {self.content[:20]}"
 
     def soft_delete(self, user):
-        self.is_deleted = True
-        self.deleted_at = timezone.now()
-        self.deleted_by = user
-        self.save()
+        with transaction.atomic():
+            if not self.is_deleted:
+                Post.objects.filter(pk=self.post_id, comments_count__gt=0).update(
+                    comments_count=F("comments_count") - 1, activity_at=timezone.now()
+                )
+            self.is_deleted = True
+            self.deleted_at = timezone.now()
+            self.deleted_by = user
+            self.save()
 
     def restore(self):
-        self.is_deleted = False
-        self.deleted_at = None
-        self.deleted_by = None
-        self.save()
-
-    @property
-    def likes_count(self):
-        return self.likes.count()
+        with transaction.atomic():
+            if self.is_deleted:
+                Post.objects.filter(pk=self.post_id).update(
+                    comments_count=F("comments_count") + 1, activity_at=timezone.now()
+                )
+            self.is_deleted = False
+            self.deleted_at = None
+            self.deleted_by = None
+            self.save()
 
     def is_liked_by(self, user):
         if not user.is_authenticated:
             return False
-        return self.likes.filter(id=user.id).exists()
+        return self.likes.filter(user=user).exists()
 
     @property
     def replies_count(self):
@@ -1,6 +1,7 @@
 from rest_framework import serializers
 
 from apps.comment.models import Comment
+from apps.comment.threads import REPLY_PREVIEW_SIZE
 from apps.user.serializers import UsernameSerializer
 
 
@@ -10,6 +11,8 @@ class CommentSerializer(serializers.ModelSerializer):
     author = serializers.CharField(source="author.nickname", read_only=True)
     post = serializers.PrimaryKeyRelatedField(read_only=True)
     replies = serializers.SerializerMethodField()
+    replies_count = serializers.SerializerMethodField()
+    is_liked = serializers.SerializerMethodField()
     parent = serializers.PrimaryKeyRelatedField(read_only=True)
 
     class Meta:
@@ -22,6 +25,9 @@ class CommentSerializer(serializers.ModelSerializer):
             "parent",
             "created_at",
             "updated_at",
+            "likes_count",
+            "is_liked",
+            "replies_count",
             "replies",
         ]
         read_only_fields = [
@@ -31,17 +37,66 @@ class CommentSerializer(serializers.ModelSerializer):
             "parent",
             "created_at",
             "updated_at",
+            "likes_count",
+            "is_liked",
+            "replies_count",
             "replies",
         ]
 
+    def get_is_liked(self, obj):
+        """
+        요청 사용자의 좋아요 여부를 반환합니다.
+        목록에서는 attach_like_state 가 미리 채운 값을 사용합니다.
+        """
+        if hasattr(obj, "is_liked"):
+            return obj.is_liked
+        # 공유 캐시에 저장될 응답은 사용자 무관 (캐시 조회 시 덮어씀)
+        if self.context.get("shared_cache"):
+            return False
+        request = self.context.get("request")
+        if request is None:
+            return False
+        return obj.is_liked_by(request.user)
+
+    def get_replies_count(self, obj):
+        """삭제되지 않은 대댓글 수를 반환합니다."""
+        if obj.parent_id is not None:
+            return 0
+        if hasattr(obj, "prefetched_replies_count"):
+            return obj.prefetched_replies_count
+        return obj.child_comments.filter(is_deleted=False).count()
+
     def get_replies(self, obj):
-        """대댓글 목록을 반환합니다."""
+        """
+        앞쪽 대댓글(최대 REPLY_PREVIEW_SIZE 개)을 반환합니다.
+        나머지는 replies 엔드포인트에서 페이지 단위로 조회합니다.
+        """
+        # 대댓글에는 답글을 달 수 없으므로(validate_parent) 추가 조회하지 않습니다.
+        if obj.parent_id is not None:
+            return []
+        if hasattr(obj, "prefetched_replies"):
+            return CommentSerializer(
+                obj.prefetched_replies, many=True, context=self.context
+            ).data
         if hasattr(obj, "child_comments"):
-            replies = obj.child_comments.filter(is_deleted=False).order_by("created_at")
+            replies = obj.child_comments.filter(is_deleted=False).order_by(
+                "created_at", "id"
+            )[:REPLY_PREVIEW_SIZE]
             return CommentSerializer(replies, many=True, context=self.context).data
         return []
 
 
+class CommentPreviewSerializer(serializers.ModelSerializer):
+    """게시물 카드에 포함되는 댓글 미리보기 시리얼라이저 (대댓글 미포함)"""
+
+    author = serializers.CharField(source="author.nickname", read_only=True)
+
+    class Meta:
+        model = Comment
+        fields = ["id", "content", "author", "created_at"]
+        read_only_fields = fields
+
+
 class CommentCreateSerializer(serializers.ModelSerializer):
     """댓글 생성 시리얼라이저"""
 
@@ -0,0 +1,29 @@
+from django.db.models import F
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from apps.post.models import Post
+
+from .models import Comment
+
+
+@receiver(post_save, sender=Comment)
+def increase_comments_count(sender, instance, created, **kwargs):
+    """댓글이 생성되면 같은 트랜잭션 안에서 게시물의 comments_count를 1 증가시킵니다."""
+    if created and not instance.is_deleted:
+        Post.objects.filter(pk=instance.post_id).update(
+            comments_count=F("comments_count") + 1, activity_at=timezone.now()
+        )
+
+
+@receiver(post_delete, sender=Comment)
+def decrease_comments_count(sender, instance, **kwargs):
+    """
+    댓글이 실제로 삭제되면 게시물의 comments_count를 1 감소시킵니다.
+    소프트 삭제는 Comment.soft_delete 에서 처리합니다.
+    """
+    if not instance.is_deleted:
+        Post.objects.filter(pk=instance.post_id, comments_count__gt=0).update(
+            comments_count=F("comments_count") - 1, activity_at=timezone.now()
+        )
@@ -1,3 +1,194 @@
+from django.contrib.auth import get_user_model
+from django.contrib.contenttypes.models import ContentType
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from apps.comment.models import Comment
+from apps.comment.threads import REPLY_PREVIEW_SIZE, attach_like_state, load_thread
+from apps.like.models import Like
+from apps.post.models import Post
+
+User = get_user_model()
+
+
+class CommentThreadTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            email="thread@example.com",
+            password="password123",
+            name="Thread User",
+            nickname="threaduser",
+        )
+        self.client.force_authenticate(user=self.user)
+        self.post = Post.objects.create(
+            title="스레드", content="내용", author=self.user
+        )
+
+    def create_thread(self, size):
+        for index in range(size):
+            parent = Comment.objects.create(
+                post=self.post, author=self.user, content=f"댓글 {index}"
+            )
+            for reply in range(2):
+                Comment.objects.create(
+                    post=self.post,
+                    author=self.user,
+                    content=f"대댓글 {index}-{reply}",
+                    parent=parent,
+                )
+
+    def test_load_thread_builds_tree_in_one_query(self):
+        """스레드 전체를 쿼리 한 번으로 불러와 작성 순 트리로 구성하는지 테스트"""
+        self.create_thread(3)
+        deleted = (
+            Comment.objects.filter(parent__isnull=False).order_by("created_at", "id")
+        ).first()
+        deleted.soft_delete(self.user)
+
+        with CaptureQueriesContext(connection) as ctx:
+            thread = load_thread(self.post.id)
+            contents = [
+                (
+                    comment.content,
+                    [reply.content for reply in comment.prefetched_replies],
+                )
+                for comment in thread
+            ]
+            [comment.author.nickname for comment in thread]
+        self.assertEqual(len(ctx.captured_queries), 1)
+        self.assertEqual(
+            contents,
+            [
+                ("댓글 0", ["대댓글 0-1"]),
+                ("댓글 1", ["대댓글 1-0", "대댓글 1-1"]),
+                ("댓글 2", ["대댓글 2-0", "대댓글 2-1"]),
+            ],
+        )
+
+    def test_comment_list_queries_do_not_grow_with_replies(self):
+        """댓글 목록 조회 쿼리 수가 댓글/대댓글 수와 무관한지 테스트"""
+        url = f"/api/posts/{self.post.id}/comments"
+        self.create_thread(2)
+        with CaptureQueriesContext(connection) as ctx:
+            self.client.get(url, {"ordering": "created_at", "page_size": 100})
+        small = len(ctx.captured_queries)
+
+        self.create_thread(10)
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(
+                url, {"ordering": "created_at", "page_size": 100}
+            )
+        self.assertEqual(len(ctx.captured_queries), small)
+        self.assertEqual(len(response.data["results"]), 36)
+        self.assertEqual(len(response.data["results"][0]["replies"]), 2)
+        self.assertEqual(response.data["results"][1]["replies"], [])
+
+    def test_top_level_comment_includes_reply_preview_and_count(self):
+        """최상위 댓글에 대댓글 수와 앞쪽 대댓글만 포함되는지 테스트"""
+        parent = Comment.objects.create(
+            post=self.post, author=self.user, content="부모"
+        )
+        for index in range(REPLY_PREVIEW_SIZE + 2):
+            Comment.objects.create(
+                post=self.post,
+                author=self.user,
+                content=f"대댓글 {index}",
+                parent=parent,
+            )
+
+        thread = load_thread(self.post.id)
+        self.assertEqual(thread[0].prefetched_replies_count, REPLY_PREVIEW_SIZE + 2)
+        self.assertEqual(
+            [reply.content for reply in thread[0].prefetched_replies],
+            [f"대댓글 {index}" for index in range(REPLY_PREVIEW_SIZE)],
+        )
+
+        response = self.client.get(
+            f"/api/posts/{self.post.id}/comments", {"page_size": 100}
+        )
+        item = next(row for row in response.data["results"] if row["id"] == parent.id)
+        self.assertEqual(item["replies_count"], REPLY_PREVIEW_SIZE + 2)
+        self.assertEqual(len(item["replies"]), REPLY_PREVIEW_SIZE)
+
+    def test_replies_cursor_pagination(self):
+        """대댓글 엔드포인트가 작성 순으로 커서 페이지네이션되는지 테스트"""
+        parent = Comment.objects.create(
+            post=self.post, author=self.user, content="부모"
+        )
+        replies = [
+            Comment.objects.create(
+                post=self.post,
+                author=self.user,
+                content=f"대댓글 {index}",
+                parent=parent,
+            )
+            for index in range(5)
+        ]
+        url = reverse(
+            "comment-replies", kwargs={"post_id": self.post.id, "pk": parent.id}
+        )
+
+        response = self.client.get(url, {"page_size": 2})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [row["id"] for row in response.data["results"]],
+            [reply.id for reply in replies[:2]],
+        )
+        self.assertIsNone(response.data["previous"])
+
+        seen = []
+        next_url = url + "?page_size=2"
+        while next_url:
+            response = self.client.get(next_url)
+            seen += [row["id"] for row in response.data["results"]]
+            next_url = response.data["next"]
+        self.assertEqual(seen, [reply.id for reply in replies])
+
+        response = self.client.get(url, {"cursor": "invalid"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_comment_like_state_is_loaded_in_one_query(self):
+        """댓글/대댓글의 좋아요 수와 내 좋아요 여부가 Like 한 번 조회로 채워지는지 테스트"""
+        self.create_thread(3)
+        other = User.objects.create_user(
+            email="liker@example.com",
+            password="password123",
+            name="Liker",
+            nickname="liker",
+        )
+        comments = list(Comment.objects.order_by("created_at", "id"))
+        content_type = ContentType.objects.get_for_model(Comment)
+        for comment in (comments[0], comments[1]):
+            Like.objects.create(
+                user=self.user, content_type=content_type, object_id=comment.id
+            )
+        Like.objects.create(
+            user=other, content_type=content_type, object_id=comments[1].id
+        )
+        self.assertTrue(comments[0].is_liked_by(self.user))
+        self.assertFalse(comments[0].is_liked_by(other))
+
+        thread = load_thread(self.post.id)
+        with CaptureQueriesContext(connection) as ctx:
+            attach_like_state(thread, self.user)
+        self.assertEqual(len(ctx.captured_queries), 1)
+
+        response = self.client.get(
+            f"/api/posts/{self.post.id}/comments", {"ordering": "created_at"}
+        )
+        first = response.data["results"][0]
+        self.assertTrue(first["is_liked"])
+        self.assertEqual(first["likes_count"], 1)
+        self.assertTrue(first["replies"][0]["is_liked"])
+        self.assertEqual(first["replies"][0]["likes_count"], 2)
+        self.assertFalse(first["replies"][1]["is_liked"])
+
+
 # from django.contrib.auth import get_user_model
 # from django.contrib.contenttypes.models import ContentType
 # from django.test import TestCase
@@ -0,0 +1,150 @@
+from django.contrib.contenttypes.models import ContentType
+from django.db.models import Count, F, Window
+from django.db.models.functions import Coalesce, RowNumber
+
+from apps.like.models import Like
+
+from .models import Comment
+
+# 댓글 스레드 로더
+#
+# 댓글마다 child_comments 를 조회하고 author 를 따로 불러오면 댓글 N개에 2N 번 이상의
+# 쿼리가 발생하므로, 필요한 댓글을 작성자와 JOIN 해 한 번에 불러온 뒤 메모리에서
+# 부모/자식 트리를 구성해 prefetched_replies 에 채워 둡니다.
+# (CommentSerializer.get_replies 가 prefetched_replies 를 사용)
+#
+# 대댓글이 수천 개인 댓글이 있어도 목록 응답이 커지지 않도록, 최상위 댓글에는
+# 대댓글 수(prefetched_replies_count)와 작성 순으로 앞의 REPLY_PREVIEW_SIZE 개만 채웁니다.
+# 나머지 대댓글은 replies 엔드포인트에서 커서 페이지네이션으로 조회합니다.
+#
+# 댓글은 2단계(댓글 - 대댓글)까지만 허용되므로(CommentCreateSerializer.validate_parent)
+# 대댓글의 대댓글은 구성하지 않습니다. 대댓글은 작성 순(created_at, id)으로 정렬합니다.
+#
+# 좋아요 수는 Comment.likes_count 컬럼을 사용하고, 내 좋아요 여부(is_liked)는
+# attach_like_state 가 페이지의 댓글/대댓글 전체에 대해 Like 를 한 번만 조회해 채웁니다.
+
+REPLY_PREVIEW_SIZE = 3
+
+
+def load_thread(post_id, reply_preview=REPLY_PREVIEW_SIZE):
+    """
+    게시물의 삭제되지 않은 최상위 댓글과 댓글별 앞쪽 대댓글을 쿼리 한 번으로 불러옵니다.
+
+    최상위 댓글과 그 대댓글을 하나의 스레드(COALESCE(parent_id, id))로 묶어
+    윈도 함수로 스레드 안의 순번과 크기를 구하고, 순번이 reply_preview + 1 이하인
+    행(최상위 댓글 자신 + 앞쪽 대댓글)만 가져옵니다.
+
+    Args:
+        post_id (int): 게시물 ID
+        reply_preview (int): 최상위 댓글별로 포함할 대댓글 수
+
+    Returns:
+        list[Comment]: 작성 순으로 정렬된 최상위 댓글
+            (각 댓글에 prefetched_replies, prefetched_replies_count 포함)
+    """
+    thread = Coalesce("parent_id", "id")
+    comments = list(
+        Comment.objects.filter(post_id=post_id, is_deleted=False)
+        .select_related("author")
+        .annotate(
+            thread_rank=Window(
+                RowNumber(),
+                partition_by=[thread],
+                order_by=[
+                    F("parent_id").asc(nulls_first=True),
+                    F("created_at").asc(),
+                    F("id").asc(),
+                ],
+            ),
+            thread_size=Window(Count("id"), partition_by=[thread]),
+        )
+        .filter(thread_rank__lte=max(reply_preview, 0) + 1)
+        .order_by("created_at", "id")
+    )
+    by_id = {comment.pk: comment for comment in comments}
+    top_level = []
+    for comment in comments:
+        if comment.parent_id is None:
+            comment.prefetched_replies = []
+            comment.prefetched_replies_count = comment.thread_size - 1
+            top_level.append(comment)
+    for comment in comments:
+        parent = by_id.get(comment.parent_id)
+        # 삭제된 댓글의 대댓글은 최상위 목록에 나타나지 않음 (기존 동작과 동일)
+        if parent is not None and parent.parent_id is None:
+            parent.prefetched_replies.append(comment)
+    return top_level
+
+
+def attach_replies(comments, reply_preview=REPLY_PREVIEW_SIZE):
+    """
+    이미 불러온 댓글 목록(페이지)의 최상위 댓글에 대댓글 수와 앞쪽 대댓글을
+    쿼리 한 번으로 채웁니다.
+
+    Args:
+        comments (list[Comment]): 댓글 목록
+        reply_preview (int): 최상위 댓글별로 포함할 대댓글 수
+
+    Returns:
+        list[Comment]: 전달받은 댓글 목록
+    """
+    parents = {comment.pk: comment for comment in comments if comment.parent_id is None}
+    for comment in parents.values():
+        comment.prefetched_replies = []
+        comment.prefetched_replies_count = 0
+    if not parents:
+        return comments
+
+    # 대댓글이 없으면 행이 없으므로 prefetched_replies_count 는 0 그대로
+    # 미리보기가 0개여도 대댓글 수를 구하기 위해 각 스레드의 첫 행은 가져옴
+    replies = (
+        Comment.objects.filter(parent_id__in=parents, is_deleted=False)
+        .select_related("author")
+        .annotate(
+            reply_rank=Window(
+                RowNumber(),
+                partition_by=[F("parent_id")],
+                order_by=[F("created_at").asc(), F("id").asc()],
+            ),
+            sibling_count=Window(Count("id"), partition_by=[F("parent_id")]),
+        )
+        .filter(reply_rank__lte=max(reply_preview, 1))
+        .order_by("created_at", "id")
+    )
+    for reply in replies:
+        parent = parents[reply.parent_id]
+        parent.prefetched_replies_count = reply.sibling_count
+        if reply.reply_rank <= reply_preview:
+            parent.prefetched_replies.append(reply)
+    return comments
+
+
+def attach_like_state(comments, user):
+    """
+    댓글 목록과 그 대댓글(prefetched_replies)에 사용자의 좋아요 여부(is_liked)를
+    쿼리 한 번으로 채웁니다.
+
+    Args:
+        comments (list[Comment]): 댓글 목록
+        user (User): 요청 사용자 (AnonymousUser 가능)
+
+    Returns:
+        list[Comment]: 전달받은 댓글 목록
+    """
+    targets = []
+    for comment in comments:
+        targets.append(comment)
+        targets.extend(getattr(comment, "prefetched_replies", []))
+
+    liked_ids = set()
+    if targets and user is not None and user.is_authenticated:
+        liked_ids = set(
+            Like.objects.filter(
+                content_type=ContentType.objects.get_for_model(Comment),
+                user=user,
+                object_id__in=[comment.pk for comment in targets],
+            ).values_list("object_id", flat=True)
+        )
+    for comment in targets:
+        comment.is_liked = comment.pk in liked_ids
+    return comments
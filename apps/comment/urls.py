@@ -13,4 +13,14 @@ urlpatterns = [
         CommentViewSet.as_view({"get": "like_status"}),
         name="comment-like-status",
     ),
+    path(
+        "<int:pk>/replies",
+        CommentViewSet.as_view({"get": "replies"}),
+        name="comment-replies",
+    ),
+    path(
+        "<int:pk>/likers",
+        CommentViewSet.as_view({"get": "likers"}),
+        name="comment-likers",
+    ),
 ]
@@ -1,4 +1,5 @@
 from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
 from django.shortcuts import get_object_or_404
 from django_filters import rest_framework as django_filters
 from drf_yasg import openapi
@@ -11,9 +12,16 @@ from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from apps.like.likers import paginate_likers
 from apps.like.models import Like
+from apps.like.toggle import add_like, remove_like
 from apps.post.models import Post
 from utils.exceptions import CustomAPIException
+from utils.pagination import (
+    INVALID_CURSOR,
+    CreatedAtCursorPagination,
+    CursorPaginationModeMixin,
+)
 
 from .models import Comment
 from .serializers import (
@@ -21,6 +29,7 @@ from .serializers import (
     CommentSerializer,
     CommentUpdateSerializer,
 )
+from .threads import attach_like_state, attach_replies, load_thread
 
 
 class CommentPagination(PageNumberPagination):
@@ -31,6 +40,13 @@ class CommentPagination(PageNumberPagination):
     max_page_size = 100
 
 
+class ReplyCursorPagination(CreatedAtCursorPagination):
+    """대댓글 커서 페이지네이션 (작성 순, (parent, created_at) 인덱스 사용)"""
+
+    page_size = 20
+    ascending = True
+
+
 class CommentFilter(django_filters.FilterSet):
     """댓글 필터"""
 
@@ -46,8 +62,13 @@ class CommentFilter(django_filters.FilterSet):
         fields = ["content", "created_at", "created_at_end", "parent"]
 
 
-class CommentViewSet(viewsets.ModelViewSet):
-    """댓글 뷰셋 (댓글/대댓글 통합)"""
+class CommentViewSet(CursorPaginationModeMixin, viewsets.ModelViewSet):
+    """
+    댓글 뷰셋 (댓글/대댓글 통합)
+
+    목록은 ?pagination=cursor 로 (created_at, id) 커서 페이지네이션을 사용할 수 있습니다.
+    최상위 댓글에는 대댓글 수와 앞쪽 대댓글만 포함되며, 나머지는 replies 액션으로 조회합니다.
+    """
 
     http_method_names = ["get", "post", "patch", "delete"]
     queryset = Comment.objects.filter(is_deleted=False)
@@ -66,7 +87,7 @@ class CommentViewSet(viewsets.ModelViewSet):
 
     def get_queryset(self):
         """post_id에 해당하는 게시물의 댓글만 필터링합니다."""
-        queryset = super().get_queryset()
+        queryset = super().get_queryset().select_related("author")
         post_id = self.kwargs.get("post_id")
         if post_id:
             queryset = queryset.filter(post_id=post_id)
@@ -103,11 +124,14 @@ class CommentViewSet(viewsets.ModelViewSet):
                         "data": None,
                     }
                 )
+        else:
+            parent = None
+
+        # 댓글 생성과 게시물 comments_count 갱신(signals)을 한 트랜잭션으로 처리
+        with transaction.atomic():
             comment = serializer.save(
                 author=self.request.user, post=post, parent=parent
             )
-        else:
-            comment = serializer.save(author=self.request.user, post=post)
         return comment
 
     @swagger_auto_schema(
@@ -131,13 +155,18 @@ class CommentViewSet(viewsets.ModelViewSet):
             queryset = self.filter_queryset(self.get_queryset())
             page = self.paginate_queryset(queryset)
             if page is not None:
+                # 페이지의 최상위 댓글에 대댓글과 내 좋아요 여부를 한 번에 채움
+                comments = attach_like_state(attach_replies(page), request.user)
                 serializer = self.get_serializer(
-                    page, many=True, context={"request": request}
+                    comments, many=True, context={"request": request}
                 )
                 return self.get_paginated_response(serializer.data)
 
+            comments = attach_like_state(attach_replies(list(queryset)), request.user)
             serializer = self.get_serializer(
-                queryset, many=True, context={"request": request}
+                comments,
+                many=True,
+                context={"request": request},
             )
             return Response(serializer.data)
         except Exception as e:
@@ -225,32 +254,65 @@ class CommentViewSet(viewsets.ModelViewSet):
         return super().destroy(request, *args, **kwargs)
 
     @action(detail=True, methods=["post", "delete"], url_path="likes")
-    def likes(self, request, pk=None):
+    def likes(self, request, post_id=None, pk=None):
         """댓글 좋아요/취소 API (POST: 좋아요, DELETE: 좋아요 취소)"""
         comment = self.get_object()
-        user = request.user
-        content_type = ContentType.objects.get_for_model(comment)
 
         if request.method == "POST":
-            # 이미 좋아요가 있으면 아무 변화 없음
-            like, created = Like.objects.get_or_create(
-                content_type=content_type, object_id=comment.id, user=user
-            )
+            # 이미 좋아요가 있으면 아무 변화 없음 (유니크 제약 기준 INSERT ... ON CONFLICT)
+            like_id, likes_count = add_like(comment, request.user)
             return Response(
-                {"status": "liked"},
-                status=status.HTTP_201_CREATED if created else status.HTTP_200_OK,
+                {"status": "liked", "likes_count": likes_count},
+                status=status.HTTP_201_CREATED if like_id else status.HTTP_200_OK,
             )
         elif request.method == "DELETE":
-            deleted, _ = Like.objects.filter(
-                content_type=content_type, object_id=comment.id, user=user
-            ).delete()
+            deleted, likes_count = remove_like(comment, request.user)
             return Response(
-                {"status": "unliked"},
+                {"status": "unliked", "likes_count": likes_count},
                 status=status.HTTP_204_NO_CONTENT if deleted else status.HTTP_200_OK,
             )
 
+    @swagger_auto_schema(
+        operation_summary="대댓글 목록 조회",
+        operation_description=(
+            "댓글의 대댓글을 작성 순으로 조회합니다. "
+            "응답의 next/previous 커서로 다음/이전 페이지를 조회합니다."
+        ),
+        tags=["comments"],
+        responses={
+            200: openapi.Response(
+                description="대댓글 목록 조회 성공",
+                schema=CommentSerializer(many=True),
+            ),
+            400: openapi.Response(
+                description="잘못된 커서",
+                examples={"application/json": INVALID_CURSOR},
+            ),
+            404: openapi.Response(
+                description="댓글을 찾을 수 없음",
+                examples={"application/json": {"detail": "Not found."}},
+            ),
+        },
+    )
+    @action(detail=True, methods=["get"], url_path="replies")
+    def replies(self, request, post_id=None, pk=None):
+        """대댓글 목록 API ((created_at, id) 커서 페이지네이션)"""
+        comment = get_object_or_404(self.get_queryset(), pk=pk)
+        queryset = Comment.objects.filter(
+            parent=comment, is_deleted=False
+        ).select_related("author")
+
+        paginator = ReplyCursorPagination()
+        page = paginator.paginate_queryset(queryset, request, view=self)
+        serializer = CommentSerializer(
+            attach_like_state(page, request.user),
+            many=True,
+            context=self.get_serializer_context(),
+        )
+        return paginator.get_paginated_response(serializer.data)
+
     @action(detail=True, methods=["get"], url_path="like-status")
-    def like_status(self, request, pk=None):
+    def like_status(self, request, post_id=None, pk=None):
         """댓글 좋아요 상태 조회 API"""
         comment = self.get_object()
         user = request.user
@@ -260,20 +322,13 @@ class CommentViewSet(viewsets.ModelViewSet):
             content_type=content_type, object_id=comment.id, user=user
         ).exists()
 
-        # 좋아요한 사용자 목록
-        liked_users = (
-            Like.objects.filter(content_type=content_type, object_id=comment.id)
-            .select_related("user")
-            .values_list("user__nickname", flat=True)
-        )
+        # 좋아요한 사용자 목록은 likers 에서 페이지 단위로 조회
+        return Response({"is_liked": is_liked, "likes_count": comment.likes_count})
 
-        return Response(
-            {
-                "is_liked": is_liked,
-                "likes_count": comment.likes.count(),
-                "liked_users": list(liked_users),
-            }
-        )
+    @action(detail=True, methods=["get"], url_path="likers")
+    def likers(self, request, post_id=None, pk=None):
+        """댓글 좋아요한 사용자 목록 API (최근 좋아요 순 커서 페이지네이션)"""
+        return paginate_likers(self.get_object(), request, view=self)
 
 
 class CommentView(APIView):
@@ -302,9 +357,9 @@ class CommentView(APIView):
         },
     )
     def get(self, request, post_id):
-        comments = Comment.objects.filter(
-            post_id=post_id, parent=None, is_deleted=False
-        ).order_by("created_at")
+        # 최상위 댓글과 댓글별 앞쪽 대댓글을 쿼리 한 번으로 불러와 트리로 구성
+        # (내 좋아요 여부는 Like 를 한 번 더 조회해 채움)
+        comments = attach_like_state(load_thread(post_id), request.user)
         serializer = CommentSerializer(
             comments, many=True, context={"request": request}
         )
@@ -340,7 +395,8 @@ class CommentView(APIView):
     def post(self, request, post_id):
         serializer = CommentCreateSerializer(data=request.data)
         if serializer.is_valid():
-            serializer.save(author=request.user, post_id=post_id)
+            with transaction.atomic():
+                serializer.save(author=request.user, post_id=post_id)
             return Response(serializer.data, status=status.HTTP_201_CREATED)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
@@ -426,6 +482,5 @@ class CommentDetailView(APIView):
             return Response(
                 {"detail": "권한이 없습니다."}, status=status.HTTP_403_FORBIDDEN
             )
-        comment.is_deleted = True
-        comment.save()
+        comment.soft_delete(request.user)
         return Response(status=status.HTTP_204_NO_CONTENT)
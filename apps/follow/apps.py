@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class FollowConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.follow"
+
+    def ready(self):
+        from . import signals  # noqa: F401
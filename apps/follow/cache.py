@@ -0,0 +1,24 @@
+from django.db import transaction
+
+from utils.generation import CacheGeneration
+
+# 팔로우 세대
+#
+# 팔로우/언팔로우는 Idol.updated_at 을 바꾸지 않지만 아이돌 응답의 is_following,
+# followers_count 를 바꾸므로, 팔로우가 바뀔 때마다 세대를 올려 아이돌 응답의
+# ETag/Last-Modified 에 반영합니다. (IdolViewSet.get_validator_probes)
+
+follow_generation = CacheGeneration(
+    "follows:generation", "follows:generation:changed-at"
+)
+
+
+def follows_changed():
+    """
+    팔로우가 바뀌었음을 기록합니다.
+
+    커밋 전에 다른 요청이 이전 데이터로 새 세대의 검증자를 만들 수 있으므로
+    커밋 후에 한 번 더 올립니다.
+    """
+    follow_generation.bump()
+    transaction.on_commit(follow_generation.bump)
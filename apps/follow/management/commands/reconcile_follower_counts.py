@@ -0,0 +1,65 @@
+from django.core.management.base import BaseCommand
+from django.db.models import OuterRef
+
+from apps.follow.models import Follow
+from apps.idol.models import Idol
+from utils.counters import count_subquery, recount
+
+
+class Command(BaseCommand):
+    """
+    비정규화된 아이돌 팔로워 수(followers_count)를 follow 테이블 기준으로 다시 계산합니다.
+
+    pk 순으로 batch-size 만큼 끊어 배치마다 UPDATE ... SET followers_count =
+    (SELECT COUNT(*) FROM follow_follow ...) 한 문장으로 처리하므로, 운영 중에 실행해도
+    그 사이의 팔로우/언팔로우를 덮어쓰지 않고 대량의 데이터에서도 긴 락을 잡지 않습니다.
+    (기존 데이터는 followers_count 컬럼을 추가하는 마이그레이션에서 같은 방식으로 채움)
+
+    사용 예:
+        python manage.py reconcile_follower_counts
+        python manage.py reconcile_follower_counts --batch-size 500 --dry-run
+    """
+
+    help = "아이돌 팔로워 수 카운터를 재계산합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="한 번에 처리할 행 수 (기본값: 1000)",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="변경 사항을 저장하지 않고 어긋난 행 수만 출력합니다.",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        dry_run = options["dry_run"]
+
+        # 읽은 값을 되돌려 쓰지 않고 UPDATE 한 문장으로 다시 계산 (utils/counters.py)
+        counts = {
+            "followers_count": count_subquery(
+                Follow.objects.filter(idol_id=OuterRef("pk"))
+            )
+        }
+        fixed = 0
+        last_pk = 0
+        while True:
+            pks = list(
+                Idol.objects.filter(pk__gt=last_pk)
+                .order_by("pk")
+                .values_list("pk", flat=True)[:batch_size]
+            )
+            if not pks:
+                break
+            batch = Idol.objects.filter(pk__gt=last_pk, pk__lte=pks[-1])
+            fixed += recount(batch, counts, dry_run=dry_run)
+            last_pk = pks[-1]
+
+        prefix = "[dry-run] " if dry_run else ""
+        self.stdout.write(
+            self.style.SUCCESS(f"{prefix}아이돌 {fixed}건의 팔로워 수를 보정했습니다.")
+        )
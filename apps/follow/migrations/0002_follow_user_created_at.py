@@ -0,0 +1,22 @@
+# Generated by Django 5.2.18 on 2026-10-17 21:30
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("follow", "0001_initial"),
+        ("idol", "0002_idol_followers_count"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="follow",
+            index=models.Index(
+                fields=["user", "-created_at"], name="follow_user_id_79899e_idx"
+            ),
+        ),
+    ]
@@ -22,6 +22,10 @@ class Follow(models.Model):
         verbose_name = "팔로우"
         verbose_name_plural = f"{verbose_name} 목록"
         ordering = ["-created_at"]
+        indexes = [
+            # 내 팔로우 목록 (최근 팔로우 순 커서 페이지네이션)
+            models.Index(fields=["user", "-created_at"]),
+        ]
 
     def __str__(self):
         return f"{self.user.username}가 {self.idol}을 팔로우"
@@ -1,7 +1,9 @@
 # apps/follow/serializers.py
+from drf_yasg.utils import swagger_serializer_method
 from rest_framework import serializers
 
 from apps.follow.models import Follow
+from apps.idol import directory as idol_directory
 from apps.idol.models import Idol
 
 
@@ -12,10 +14,37 @@ class IdolSimpleSerializer(serializers.ModelSerializer):
 
 
 class FollowSerializer(serializers.ModelSerializer):
-    user_id = serializers.IntegerField(source="user.id", read_only=True)
-    idol = IdolSimpleSerializer(read_only=True)
+    user_id = serializers.IntegerField(read_only=True)
+    idol = serializers.SerializerMethodField()
 
     class Meta:
         model = Follow
         fields = ["id", "user_id", "idol", "created_at"]
         read_only_fields = ["id", "user_id", "idol", "created_at"]
+
+    @swagger_serializer_method(serializer_or_field=IdolSimpleSerializer)
+    def get_idol(self, obj):
+        """
+        아이돌 정보는 아이돌 디렉터리 스냅샷에서 찾고, 없으면 obj.idol 을 사용합니다.
+        (목록은 select_related("idol") 로 불러오므로 추가 쿼리 없음)
+        """
+        idol = idol_directory.get_idol(obj.idol_id)
+        if idol is not None:
+            return {field: idol[field] for field in IdolSimpleSerializer.Meta.fields}
+        return IdolSimpleSerializer(obj.idol).data
+
+
+class FollowBulkSerializer(serializers.Serializer):
+    """아이돌 일괄 팔로우/언팔로우 요청 시리얼라이저"""
+
+    MAX_IDOLS = 100
+
+    idol_ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        allow_empty=False,
+        max_length=MAX_IDOLS,
+    )
+
+    def validate_idol_ids(self, value):
+        """중복된 아이돌 ID 를 요청 순서를 유지한 채 제거합니다."""
+        return list(dict.fromkeys(value))
@@ -0,0 +1,30 @@
+from django.db.models import F
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.idol.models import Idol
+
+from .cache import follows_changed
+from .models import Follow
+
+# 관리자 화면, 사용자/아이돌 삭제(CASCADE) 등 ORM 으로 팔로우가 바뀌는 경우의 카운터 갱신
+# (API 의 팔로우/언팔로우는 toggle.follow_idol/unfollow_idol 이 직접 갱신)
+
+
+@receiver(post_save, sender=Follow)
+def increase_followers_count(sender, instance, created, **kwargs):
+    """팔로우가 생성되면 같은 트랜잭션 안에서 아이돌의 followers_count를 1 증가시킵니다."""
+    if created:
+        Idol.objects.filter(pk=instance.idol_id).update(
+            followers_count=F("followers_count") + 1
+        )
+        follows_changed()
+
+
+@receiver(post_delete, sender=Follow)
+def decrease_followers_count(sender, instance, **kwargs):
+    """팔로우가 삭제되면 같은 트랜잭션 안에서 아이돌의 followers_count를 1 감소시킵니다."""
+    Idol.objects.filter(pk=instance.idol_id, followers_count__gt=0).update(
+        followers_count=F("followers_count") - 1
+    )
+    follows_changed()
@@ -1,3 +1,175 @@
+import importlib
+import io
+from unittest import mock
+
+from django.apps import apps
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from apps.follow.models import Follow
+from apps.idol.directory import (
+    PENDING_KEY,
+    get_snapshot,
+    idol_directory_generation,
+)
+from apps.idol.models import Idol
+
+User = get_user_model()
+
+
+class FollowToggleTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            email="follow@example.com",
+            password="password123",
+            name="Follow User",
+            nickname="followuser",
+        )
+        self.client.force_authenticate(user=self.user)
+        self.idol = Idol.objects.create(name="아이돌")
+        self.url = reverse("follow:follow", kwargs={"idol_id": self.idol.id})
+
+    def test_follow_is_idempotent_and_updates_count(self):
+        """팔로우/언팔로우가 한 번만 반영되고 followers_count 가 함께 갱신되는지 테스트"""
+        response = self.client.post(self.url)
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data["data"]["followers_count"], 1)
+        self.assertEqual(
+            response.data["data"]["idol"],
+            {"id": self.idol.id, "name": "아이돌", "en_name": "", "agency": None},
+        )
+
+        response = self.client.post(self.url)
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(Follow.objects.count(), 1)
+        self.idol.refresh_from_db()
+        self.assertEqual(self.idol.followers_count, 1)
+
+        self.assertEqual(self.client.delete(self.url).status_code, 204)
+        self.assertEqual(self.client.delete(self.url).status_code, 404)
+        self.idol.refresh_from_db()
+        self.assertEqual(self.idol.followers_count, 0)
+
+    def test_follow_does_not_reload_follow(self):
+        """팔로우 응답을 RETURNING 으로 받은 값으로 만들어 다시 조회하지 않는지 테스트"""
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(self.url)
+        self.assertEqual(response.status_code, 201)
+        self.assertFalse([q["sql"] for q in queries if q["sql"].startswith("SELECT")])
+        self.assertEqual(response.data["data"]["idol"]["name"], "아이돌")
+
+    def test_follow_missing_idol(self):
+        """없는 아이돌을 팔로우하면 404 를 반환하는지 테스트"""
+        url = reverse("follow:follow", kwargs={"idol_id": 999999})
+        self.assertEqual(self.client.post(url).status_code, 404)
+        self.assertEqual(self.client.delete(url).status_code, 404)
+        self.assertFalse(Follow.objects.exists())
+
+    def test_reconcile_follower_counts(self):
+        """ORM 으로 바뀐 팔로우와 어긋난 카운터가 반영/보정되는지 테스트"""
+        Follow.objects.create(user=self.user, idol=self.idol)
+        self.idol.refresh_from_db()
+        self.assertEqual(self.idol.followers_count, 1)
+
+        Idol.objects.filter(pk=self.idol.pk).update(followers_count=5)
+        with CaptureQueriesContext(connection) as queries:
+            call_command(
+                "reconcile_follower_counts", batch_size=1, stdout=io.StringIO()
+            )
+        # 읽은 값을 되돌려 쓰지 않고 UPDATE 문 안에서 다시 계산
+        updates = [q["sql"] for q in queries if q["sql"].startswith("UPDATE")]
+        self.assertEqual(len(updates), 1)
+        self.assertIn("COUNT(", updates[0])
+        self.idol.refresh_from_db()
+        self.assertEqual(self.idol.followers_count, 1)
+
+        Idol.objects.filter(pk=self.idol.pk).update(followers_count=0)
+        importlib.import_module(
+            "apps.idol.migrations.0002_idol_followers_count"
+        ).backfill_followers_count(apps, None)
+        self.idol.refresh_from_db()
+        self.assertEqual(self.idol.followers_count, 1)
+
+    def test_bulk_follow_and_unfollow(self):
+        """여러 아이돌을 한 번에 팔로우/언팔로우하고 아이돌별 결과를 반환하는지 테스트"""
+        other = Idol.objects.create(name="다른 아이돌")
+        Follow.objects.create(user=self.user, idol=self.idol)
+        url = reverse("follow:follow_bulk")
+        idol_ids = [self.idol.id, other.id, 999999, other.id]
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.post(url, {"idol_ids": idol_ids}, format="json")
+        self.assertEqual(response.status_code, 200)
+        self.assertLessEqual(len(ctx.captured_queries), 5)
+        self.assertEqual(
+            [
+                (row["idol_id"], row["result"], row["followers_count"])
+                for row in response.data["data"]
+            ],
+            [
+                (self.idol.id, "already_following", 1),
+                (other.id, "followed", 1),
+                (999999, "not_found", None),
+            ],
+        )
+
+        response = self.client.delete(url, {"idol_ids": [other.id]}, format="json")
+        self.assertEqual(
+            response.data["data"],
+            [{"idol_id": other.id, "result": "unfollowed", "followers_count": 0}],
+        )
+        response = self.client.delete(url, {"idol_ids": [other.id]}, format="json")
+        self.assertEqual(response.data["data"][0]["result"], "not_following")
+        self.assertEqual(
+            list(Follow.objects.values_list("idol_id", flat=True)), [self.idol.id]
+        )
+
+        response = self.client.post(url, {"idol_ids": []}, format="json")
+        self.assertEqual(response.status_code, 400)
+
+    def test_follow_list_is_paginated_and_joined(self):
+        """팔로우 목록이 아이돌 정보를 포함해 최근 팔로우 순으로 커서 페이지네이션되는지 테스트"""
+        # 커밋 후 스냅샷 파일을 다시 쓰는 콜백까지 실행
+        with self.captureOnCommitCallbacks(execute=True):
+            idols = [self.idol] + [
+                Idol.objects.create(name=f"아이돌 {index}") for index in range(4)
+            ]
+        for idol in idols:
+            Follow.objects.create(user=self.user, idol=idol)
+        url = reverse("follow:follow_list")
+        # 아이돌 정보는 디렉터리 스냅샷에서 찾으므로 스냅샷을 만든 뒤에는 팔로우 쿼리 1번
+        get_snapshot()
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(url, {"page_size": 2})
+        self.assertEqual(len(ctx.captured_queries), 1)
+        self.assertEqual(len(response.data["results"]), 2)
+
+        names = [row["idol"]["name"] for row in response.data["results"]]
+        next_url = response.data["next"]
+        while next_url:
+            response = self.client.get(next_url)
+            names += [row["idol"]["name"] for row in response.data["results"]]
+            next_url = response.data["next"]
+        self.assertEqual(names, [idol.name for idol in reversed(idols)])
+
+    def test_follow_list_query_count_while_directory_change_pending(self):
+        """디렉터리 변경이 커밋을 기다리는 중(스냅샷 사용 불가)에도 팔로우 쿼리 1번인지 테스트"""
+        for index in range(10):
+            idol = Idol.objects.create(name=f"아이돌 {index}")
+            Follow.objects.create(user=self.user, idol=idol)
+        idol_directory_generation.bump()
+        cache.set(PENDING_KEY, True)
 
-# Create your tests here.
+        with mock.patch("apps.idol.directory._checked_at", None):
+            with CaptureQueriesContext(connection) as ctx:
+                response = self.client.get(reverse("follow:follow_list"))
+        self.assertEqual(len(ctx.captured_queries), 1)
+        self.assertEqual(response.data["results"][0]["idol"]["name"], "아이돌 9")
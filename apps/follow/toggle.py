@@ -0,0 +1,201 @@
+from django.db import connection, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from apps.idol.models import Idol
+
+from .cache import follows_changed
+from .models import Follow
+
+# 팔로우 토글
+#
+# 아이돌 조회 -> exists() -> create() 는 세 번 왕복하고, 그 사이에 같은 요청이 겹치면
+# unique_together (user, idol) 위반으로 실패합니다. 아이돌이 있을 때만 INSERT 하는
+# INSERT ... SELECT ... ON CONFLICT DO NOTHING / DELETE 한 문장으로 팔로우를 바꾸고,
+# 실제로 바뀐 경우에만 Idol.followers_count 를 UPDATE ... RETURNING 으로 갱신합니다.
+# (PostgreSQL, SQLite 3.35+ 모두 지원하는 구문)
+#
+# ORM 의 save/delete 를 거치지 않으므로 signals 의 카운터 갱신은 일어나지 않으며,
+# 팔로우가 바뀐 경우 follows_changed() 를 직접 호출합니다.
+
+
+def follow_idol(idol_id, user):
+    """
+    아이돌을 팔로우합니다. 이미 팔로우 중이면 아무것도 바꾸지 않습니다.
+
+    응답에 필요한 아이돌 정보는 팔로워 수 UPDATE ... RETURNING 에서 함께 받으므로
+    팔로우 후 다시 조회하지 않습니다.
+
+    Args:
+        idol_id (int): 아이돌 ID
+        user (User): 팔로우하는 사용자
+
+    Returns:
+        tuple[Follow | None, int | None]: (새로 만든 팔로우 - idol 에 id, name, en_name,
+            agency 만 채워짐 - 또는 None, 아이돌의 팔로워 수 - 아이돌이 없으면 None)
+    """
+    now = timezone.now()
+    created_at = Follow._meta.get_field("created_at").get_db_prep_value(now, connection)
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(
+            f"INSERT INTO {_quote(Follow._meta.db_table)}"
+            " (user_id, idol_id, created_at)"
+            f" SELECT %s, id, %s FROM {_quote(Idol._meta.db_table)} WHERE id = %s"
+            " ON CONFLICT (user_id, idol_id) DO NOTHING"
+            " RETURNING id",
+            [user.pk, created_at, idol_id],
+        )
+        row = cursor.fetchone()
+        if row is None:
+            return None, _update_followers_count(cursor, idol_id, 0)
+        cursor.execute(
+            f"UPDATE {_quote(Idol._meta.db_table)}"
+            " SET followers_count = followers_count + 1"
+            " WHERE id = %s RETURNING followers_count, name, en_name, agency",
+            [idol_id],
+        )
+        followers_count, name, en_name, agency = cursor.fetchone()
+    follows_changed()
+    idol = Idol(
+        pk=int(idol_id),
+        name=name,
+        en_name=en_name,
+        agency=agency,
+        followers_count=followers_count,
+    )
+    follow = Follow(pk=row[0], user=user, idol=idol, created_at=now)
+    return follow, followers_count
+
+
+def unfollow_idol(idol_id, user):
+    """
+    아이돌 팔로우를 취소합니다. 팔로우하지 않은 상태면 아무것도 바꾸지 않습니다.
+
+    Args:
+        idol_id (int): 아이돌 ID
+        user (User): 팔로우를 취소하는 사용자
+
+    Returns:
+        tuple[bool, int | None]: (삭제 여부, 아이돌의 팔로워 수 - 아이돌이 없으면 None)
+    """
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(
+            f"DELETE FROM {_quote(Follow._meta.db_table)}"
+            " WHERE user_id = %s AND idol_id = %s"
+            " RETURNING id",
+            [user.pk, idol_id],
+        )
+        deleted = cursor.fetchone() is not None
+        followers_count = _update_followers_count(cursor, idol_id, -1 if deleted else 0)
+    if deleted:
+        follows_changed()
+    return deleted, followers_count
+
+
+def _quote(name):
+    return connection.ops.quote_name(name)
+
+
+def _update_followers_count(cursor, idol_id, delta):
+    """아이돌의 followers_count 를 delta 만큼 바꾸고 새 값을 반환합니다. (아이돌이 없으면 None)"""
+    table = _quote(Idol._meta.db_table)
+    if delta == 0:
+        cursor.execute(f"SELECT followers_count FROM {table} WHERE id = %s", [idol_id])
+    elif delta > 0:
+        cursor.execute(
+            f"UPDATE {table} SET followers_count = followers_count + %s"
+            " WHERE id = %s RETURNING followers_count",
+            [delta, idol_id],
+        )
+    else:
+        # 음수가 되지 않도록 0 보다 큰 경우에만 감소 (0 이면 현재 값을 다시 조회)
+        cursor.execute(
+            f"UPDATE {table} SET followers_count = followers_count + %s"
+            " WHERE id = %s AND followers_count >= %s RETURNING followers_count",
+            [delta, idol_id, -delta],
+        )
+        row = cursor.fetchone()
+        if row:
+            return row[0]
+        cursor.execute(f"SELECT followers_count FROM {table} WHERE id = %s", [idol_id])
+    row = cursor.fetchone()
+    return row[0] if row else None
+
+
+def follow_idols(idol_ids, user):
+    """
+    여러 아이돌을 한 번에 팔로우합니다. (온보딩 등)
+
+    INSERT ... SELECT 한 문장으로 존재하는 아이돌 중 아직 팔로우하지 않은 아이돌만
+    팔로우하고, 새로 팔로우한 아이돌의 followers_count 를 한 번의 UPDATE 로 올립니다.
+
+    Args:
+        idol_ids (list[int]): 아이돌 ID 목록
+        user (User): 팔로우하는 사용자
+
+    Returns:
+        tuple[set[int], dict[int, int]]: (새로 팔로우한 아이돌 ID,
+            {존재하는 아이돌 ID: 팔로워 수})
+    """
+    if not idol_ids:
+        return set(), {}
+    created_at = Follow._meta.get_field("created_at").get_db_prep_value(
+        timezone.now(), connection
+    )
+    placeholders = ", ".join(["%s"] * len(idol_ids))
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(
+            f"INSERT INTO {_quote(Follow._meta.db_table)}"
+            " (user_id, idol_id, created_at)"
+            f" SELECT %s, id, %s FROM {_quote(Idol._meta.db_table)}"
+            f" WHERE id IN ({placeholders})"
+            " ON CONFLICT (user_id, idol_id) DO NOTHING"
+            " RETURNING idol_id",
+            [user.pk, created_at, *idol_ids],
+        )
+        followed = {row[0] for row in cursor.fetchall()}
+        if followed:
+            Idol.objects.filter(pk__in=followed).update(
+                followers_count=F("followers_count") + 1
+            )
+        counts = dict(
+            Idol.objects.filter(pk__in=idol_ids).values_list("pk", "followers_count")
+        )
+    if followed:
+        follows_changed()
+    return followed, counts
+
+
+def unfollow_idols(idol_ids, user):
+    """
+    여러 아이돌 팔로우를 한 번에 취소합니다.
+
+    Args:
+        idol_ids (list[int]): 아이돌 ID 목록
+        user (User): 팔로우를 취소하는 사용자
+
+    Returns:
+        tuple[set[int], dict[int, int]]: (팔로우를 취소한 아이돌 ID,
+            {존재하는 아이돌 ID: 팔로워 수})
+    """
+    if not idol_ids:
+        return set(), {}
+    placeholders = ", ".join(["%s"] * len(idol_ids))
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(
+            f"DELETE FROM {_quote(Follow._meta.db_table)}"
+            f" WHERE user_id = %s AND idol_id IN ({placeholders})"
+            " RETURNING idol_id",
+            [user.pk, *idol_ids],
+        )
+        unfollowed = {row[0] for row in cursor.fetchall()}
+        if unfollowed:
+            Idol.objects.filter(pk__in=unfollowed, followers_count__gt=0).update(
+                followers_count=F("followers_count") - 1
+            )
+        counts = dict(
+            Idol.objects.filter(pk__in=idol_ids).values_list("pk", "followers_count")
+        )
+    if unfollowed:
+        follows_changed()
+    return unfollowed, counts
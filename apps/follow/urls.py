@@ -1,13 +1,19 @@
 from django.urls import path
 
 from apps import follow
-from apps.follow.views import FollowCreateDestroyView, FollowListView, FollowStatusView
+from apps.follow.views import (
+    FollowBulkView,
+    FollowCreateDestroyView,
+    FollowListView,
+    FollowStatusView,
+)
 
 app_name = "follow"
 
 
 urlpatterns = [
     path("follows", FollowListView.as_view(), name="follow_list"),
+    path("follows/bulk", FollowBulkView.as_view(), name="follow_bulk"),
     path(
         "<int:idol_id>/follow-status",
         FollowStatusView.as_view(),
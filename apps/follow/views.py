@@ -20,12 +20,23 @@ from rest_framework.status import (
 from rest_framework_simplejwt.authentication import JWTAuthentication
 
 from apps.follow.models import Follow
-from apps.follow.serializers import FollowSerializer
+from apps.follow.serializers import FollowBulkSerializer, FollowSerializer
+from apps.follow.toggle import (
+    follow_idol,
+    follow_idols,
+    unfollow_idol,
+    unfollow_idols,
+)
 from apps.idol.models import Idol
+from utils.pagination import CreatedAtCursorPagination
 from utils.responses.follow import (
     FOLLOW_ALREADY_EXISTS,
+    FOLLOW_BULK_CREATE_SUCCESS,
+    FOLLOW_BULK_DELETE_SUCCESS,
+    FOLLOW_BULK_INVALID,
     FOLLOW_CREATE_SUCCESS,
     FOLLOW_DELETE_SUCCESS,
+    FOLLOW_IDOL_NOT_FOUND,
     FOLLOW_NOT_FOUND,
     FOLLOW_STATUS_SUCCESS,
 )
@@ -37,9 +48,13 @@ class FollowListView(ListAPIView):
     serializer_class = FollowSerializer
     permission_classes = [IsAuthenticated]
     authentication_classes = [JWTAuthentication]
+    # (user, -created_at) 인덱스를 타는 키셋 페이지네이션 (최근 팔로우 순)
+    pagination_class = CreatedAtCursorPagination
 
     def get_queryset(self):
-        return Follow.objects.filter(user=self.request.user)
+        # 아이돌 정보는 디렉터리 스냅샷에서 먼저 찾지만, 스냅샷을 쓸 수 없을 때
+        # (변경 커밋 대기 중 등) 1+N 이 되지 않도록 JOIN 해 둠 (FollowSerializer)
+        return Follow.objects.filter(user=self.request.user).select_related("idol")
 
     @swagger_auto_schema(
         tags=["아이돌/팔로우"],
@@ -86,15 +101,21 @@ class FollowCreateDestroyView(GenericAPIView):
     )
     def post(self, request, *args, **kwargs):
         idol_id = self.kwargs.get("idol_id")
-        idol = get_object_or_404(Idol, pk=idol_id)
 
-        if Follow.objects.filter(user=request.user, idol=idol).exists():
+        # 아이돌 확인, 중복 확인, 생성, 팔로워 수 갱신을 한 트랜잭션에서 처리
+        follow, followers_count = follow_idol(idol_id, request.user)
+        if followers_count is None:
+            return Response(FOLLOW_IDOL_NOT_FOUND, status=FOLLOW_IDOL_NOT_FOUND["code"])
+        if follow is None:
             return Response(FOLLOW_ALREADY_EXISTS, status=FOLLOW_ALREADY_EXISTS["code"])
 
-        follow = Follow.objects.create(user=request.user, idol=idol)
+        # 아이돌 정보는 팔로우 토글에서 RETURNING 으로 받아 옴 (다시 조회하지 않음)
         serializer = self.get_serializer(follow)
         return Response(
-            {**FOLLOW_CREATE_SUCCESS, "data": serializer.data},
+            {
+                **FOLLOW_CREATE_SUCCESS,
+                "data": {**serializer.data, "followers_count": followers_count},
+            },
             status=FOLLOW_CREATE_SUCCESS["code"],
         )
 
@@ -104,11 +125,79 @@ class FollowCreateDestroyView(GenericAPIView):
     )
     def delete(self, request, *args, **kwargs):
         idol_id = self.kwargs.get("idol_id")
-        idol = get_object_or_404(Idol, pk=idol_id)
 
-        follow = Follow.objects.filter(user=request.user, idol=idol).first()
-        if not follow:
+        deleted, followers_count = unfollow_idol(idol_id, request.user)
+        if followers_count is None:
+            return Response(FOLLOW_IDOL_NOT_FOUND, status=FOLLOW_IDOL_NOT_FOUND["code"])
+        if not deleted:
             return Response(FOLLOW_NOT_FOUND, status=FOLLOW_NOT_FOUND["code"])
-
-        follow.delete()
         return Response(FOLLOW_DELETE_SUCCESS, status=FOLLOW_DELETE_SUCCESS["code"])
+
+
+class FollowBulkView(GenericAPIView):
+    """
+    POST /api/idols/follows/bulk - 아이돌 일괄 팔로우
+    DELETE /api/idols/follows/bulk - 아이돌 일괄 언팔로우
+
+    온보딩에서 여러 아이돌을 고를 때 아이돌마다 요청하지 않도록 한 번에 처리하고,
+    아이돌별 결과와 팔로워 수를 요청 순서대로 반환합니다.
+    결과: followed / already_following / unfollowed / not_following / not_found
+    """
+
+    serializer_class = FollowBulkSerializer
+    permission_classes = [IsAuthenticated]
+    authentication_classes = [JWTAuthentication]
+
+    @swagger_auto_schema(
+        tags=["아이돌/팔로우"],
+        operation_summary="아이돌 일괄 팔로우",
+    )
+    def post(self, request, *args, **kwargs):
+        return self.apply(
+            request,
+            follow_idols,
+            ("followed", "already_following"),
+            FOLLOW_BULK_CREATE_SUCCESS,
+        )
+
+    @swagger_auto_schema(
+        tags=["아이돌/팔로우"],
+        operation_summary="아이돌 일괄 언팔로우",
+        request_body=FollowBulkSerializer,
+    )
+    def delete(self, request, *args, **kwargs):
+        return self.apply(
+            request,
+            unfollow_idols,
+            ("unfollowed", "not_following"),
+            FOLLOW_BULK_DELETE_SUCCESS,
+        )
+
+    def apply(self, request, operation, results, success):
+        """operation 으로 팔로우를 일괄 변경하고 아이돌별 결과를 응답합니다."""
+        serializer = self.get_serializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(
+                {**FOLLOW_BULK_INVALID, "data": serializer.errors},
+                status=FOLLOW_BULK_INVALID["code"],
+            )
+        idol_ids = serializer.validated_data["idol_ids"]
+
+        changed, counts = operation(idol_ids, request.user)
+        changed_result, unchanged_result = results
+        data = []
+        for idol_id in idol_ids:
+            if idol_id not in counts:
+                result = "not_found"
+            elif idol_id in changed:
+                result = changed_result
+            else:
+                result = unchanged_result
+            data.append(
+                {
+                    "idol_id": idol_id,
+                    "result": result,
+                    "followers_count": counts.get(idol_id),
+                }
+            )
+        return Response({**success, "data": data}, status=success["code"])
@@ -0,0 +1,29 @@
+from django.conf import settings
+from django.core.checks import Tags, Warning, register
+
+# 워커마다 따로 저장되는 캐시 백엔드
+PROCESS_LOCAL_CACHES = (
+    "django.core.cache.backends.locmem.LocMemCache",
+    "django.core.cache.backends.dummy.DummyCache",
+)
+
+
+@register(Tags.caches, deploy=True)
+def check_directory_cache(app_configs, **kwargs):
+    """
+    아이돌 디렉터리/검색 인덱스 세대가 워커 간에 공유되는 캐시에 있는지 확인합니다.
+    (apps/idol/directory.py, apps/idol/search.py)
+    """
+    backend = settings.CACHES.get("default", {}).get("BACKEND")
+    if backend not in PROCESS_LOCAL_CACHES:
+        return []
+    return [
+        Warning(
+            "아이돌 디렉터리 스냅샷은 워커 간에 공유되는 캐시가 필요합니다.",
+            hint=(
+                f"{backend} 는 프로세스마다 세대를 따로 저장하므로 워커들이 "
+                "스냅샷 파일을 계속 다시 씁니다. FileBasedCache 등 공유 캐시를 사용하세요."
+            ),
+            id="idol.W001",
+        )
+    ]
@@ -0,0 +1,302 @@
+import logging
+import mmap
+import os
+import struct
+import tempfile
+import threading
+import time
+
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+from django.db import connection, transaction
+
+from utils.generation import CacheGeneration
+
+logger = logging.getLogger(__name__)
+
+# 아이돌 디렉터리 스냅샷
+#
+# 아이돌 목록은 거의 바뀌지 않지만 대부분의 화면(아이돌 목록, 일정의 idol_name,
+# 팔로우 목록)에서 읽습니다. 아이돌 ID/이름/영문 이름/소속사/이미지 URL/활동 상태만
+# 담은 읽기 전용 스냅샷 파일을 만들어 두고, 각 워커는 이 파일을 mmap 으로 매핑해
+# 복사 없이 함께 읽습니다. (워커 수와 관계없이 페이지 캐시 한 벌)
+#
+# 파일 구조 (리틀 엔디언)
+#   헤더: magic(4s) | 세대(Q) | 아이돌 수(I)
+#   목차: (아이돌 ID(Q), 레코드 위치(I)) * 아이돌 수 - ID 순 정렬, 이진 탐색
+#   레코드: is_active(B) | name | en_name | agency | image_url
+#           (문자열은 길이(H) + UTF-8, 길이가 NULL_LENGTH 이면 None)
+#
+# 아이돌/아이돌 이미지가 바뀌면 세대(idol_directory_generation)를 올리고 커밋 후
+# 스냅샷을 다시 씁니다. 각 워커는 IDOL_DIRECTORY_CHECK_INTERVAL 초마다 세대를 확인해
+# 매핑한 스냅샷이 오래됐으면 새 파일을 매핑하고, 파일이 없으면 직접 만듭니다.
+# 파일도 오래됐으면
+# - 변경이 커밋되기를 기다리는 중(PENDING_KEY)이면 다시 만들지 않고 None 을 반환해
+#   호출하는 쪽이 DB 에서 조회하도록 함 (커밋 후 변경한 프로세스가 파일을 다시 씀)
+# - 그 외(캐시가 비워짐, 커밋 후 쓰기 실패 등)에는 직접 다시 만듭니다.
+# 커밋 후 파일을 다시 쓰면 표시(PENDING_KEY)를 지우고, 트랜잭션이 롤백되면 표시가
+# 만료(IDOL_DIRECTORY_PENDING_TIMEOUT)된 뒤 워커가 다시 만듭니다.
+# 파일은 임시 파일에 쓴 뒤 os.replace 로 교체하므로 이전 파일을 매핑한 워커는
+# 교체 중에도 이전 스냅샷을 그대로 읽습니다.
+#
+# 세대와 표시는 워커 간에 공유되는 캐시(운영: FileBasedCache)에 있어야 합니다.
+# 프로세스별 캐시(LocMemCache)에서는 워커마다 세대가 달라 서로 공유 파일을
+# 계속 다시 쓰므로 check --deploy 에서 경고합니다. (apps/idol/checks.py)
+
+MAGIC = b"IDL1"
+HEADER = struct.Struct("<4sQI")
+ENTRY = struct.Struct("<QI")
+LENGTH = struct.Struct("<H")
+NULL_LENGTH = 0xFFFF
+
+FIELDS = ("name", "en_name", "agency", "image_url")
+
+idol_directory_generation = CacheGeneration(
+    "idols:directory:generation", "idols:directory:generation:changed-at"
+)
+# 커밋 전 변경이 있음 (커밋 후 파일을 다시 쓸 때까지 다른 워커는 DB 에서 조회)
+PENDING_KEY = "idols:directory:pending"
+
+
+def get_directory_path():
+    return str(
+        getattr(
+            settings,
+            "IDOL_DIRECTORY_PATH",
+            os.path.join(tempfile.gettempdir(), "idol-directory.bin"),
+        )
+    )
+
+
+def get_check_interval():
+    return getattr(settings, "IDOL_DIRECTORY_CHECK_INTERVAL", 1)
+
+
+def get_pending_timeout():
+    # 트랜잭션이 롤백되어 커밋 후 쓰기가 없으면 이 시간이 지난 뒤 워커가 다시 만듦
+    return getattr(settings, "IDOL_DIRECTORY_PENDING_TIMEOUT", 30)
+
+
+def encode_snapshot(generation, rows):
+    """
+    아이돌 목록을 스냅샷 바이트로 인코딩합니다.
+
+    Args:
+        generation (int): 스냅샷을 만든 시점의 세대
+        rows (Iterable[dict]): id, name, en_name, agency, image_url, is_active
+
+    Returns:
+        bytes: 스냅샷 파일 내용
+    """
+    rows = sorted(rows, key=lambda row: row["id"])
+    entries = []
+    records = bytearray()
+    for row in rows:
+        entries.append(ENTRY.pack(row["id"], len(records)))
+        records.append(1 if row["is_active"] else 0)
+        for field in FIELDS:
+            value = row.get(field)
+            if value is None:
+                records += LENGTH.pack(NULL_LENGTH)
+                continue
+            encoded = value.encode()
+            records += LENGTH.pack(len(encoded)) + encoded
+    return HEADER.pack(MAGIC, generation, len(rows)) + b"".join(entries) + records
+
+
+class IdolDirectorySnapshot:
+    """
+    스냅샷 버퍼(mmap 또는 bytes) 위의 읽기 전용 뷰
+
+    조회할 때 필요한 부분만 struct.unpack_from 으로 읽으므로 스냅샷 전체를
+    파이썬 객체로 만들지 않습니다.
+
+    Attributes:
+        generation (int): 스냅샷을 만든 시점의 세대
+        count (int): 아이돌 수
+    """
+
+    def __init__(self, buffer):
+        magic, self.generation, self.count = HEADER.unpack_from(buffer, 0)
+        if magic != MAGIC:
+            raise ValueError("아이돌 디렉터리 스냅샷 형식이 아닙니다.")
+        self.buffer = buffer
+        self.records_offset = HEADER.size + ENTRY.size * self.count
+
+    def get(self, idol_id):
+        """
+        아이돌 정보를 반환합니다. 스냅샷에 없으면 None.
+
+        Returns:
+            dict | None: id, name, en_name, agency, image_url, is_active
+        """
+        low, high = 0, self.count
+        while low < high:
+            middle = (low + high) // 2
+            pk, position = ENTRY.unpack_from(
+                self.buffer, HEADER.size + ENTRY.size * middle
+            )
+            if pk < idol_id:
+                low = middle + 1
+            elif pk > idol_id:
+                high = middle
+            else:
+                return self._read_record(pk, self.records_offset + position)
+        return None
+
+    def _read_record(self, pk, offset):
+        row = {"id": pk, "is_active": bool(self.buffer[offset])}
+        offset += 1
+        for field in FIELDS:
+            (length,) = LENGTH.unpack_from(self.buffer, offset)
+            offset += LENGTH.size
+            if length == NULL_LENGTH:
+                row[field] = None
+                continue
+            row[field] = self.buffer[offset : offset + length].decode()
+            offset += length
+        return row
+
+
+def load_rows():
+    """스냅샷에 담을 아이돌 목록을 불러옵니다. (아이돌 쿼리 1번 + 최신 이미지 쿼리 1번)"""
+    from apps.image.querysets import latest_done_images
+
+    from .models import Idol
+
+    rows = list(
+        Idol.objects.order_by().values("id", "name", "en_name", "agency", "is_active")
+    )
+    image_urls = dict(
+        latest_done_images()
+        .filter(content_type=ContentType.objects.get_for_model(Idol))
+        .values_list("object_id", "image_url")
+    )
+    for row in rows:
+        row["image_url"] = image_urls.get(row["id"]) or None
+    return rows
+
+
+def write_snapshot(generation=None):
+    """
+    DB 에서 아이돌 목록을 읽어 스냅샷 파일을 다시 씁니다.
+
+    Args:
+        generation (int, optional): 스냅샷에 기록할 세대 (기본값: 현재 세대)
+
+    Returns:
+        int: 기록한 세대
+    """
+    if generation is None:
+        generation = idol_directory_generation.get()
+    path = get_directory_path()
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    content = encode_snapshot(generation, load_rows())
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix=".idol-directory-")
+    try:
+        with os.fdopen(fd, "wb") as file:
+            file.write(content)
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.unlink(temp_path)
+        raise
+    return generation
+
+
+def map_snapshot():
+    """스냅샷 파일을 매핑합니다. 파일이 없거나 형식이 맞지 않으면 None."""
+    try:
+        with open(get_directory_path(), "rb") as file:
+            buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        return IdolDirectorySnapshot(buffer)
+    except (OSError, ValueError, struct.error):
+        return None
+
+
+_snapshot = None
+_checked_at = None
+_lock = threading.Lock()
+
+
+def get_snapshot():
+    """
+    현재 세대의 스냅샷을 반환합니다.
+    스냅샷이 없거나 커밋을 기다리는 중이면 None (호출하는 쪽에서 DB 로 조회)
+    """
+    global _snapshot, _checked_at
+    snapshot, checked_at = _snapshot, _checked_at
+    if checked_at is not None and time.monotonic() - checked_at < get_check_interval():
+        return snapshot
+    with _lock:
+        generation = idol_directory_generation.get()
+        if _snapshot is None or _snapshot.generation != generation:
+            snapshot = map_snapshot()
+            if snapshot is None:
+                snapshot = _rebuild(generation)
+            elif snapshot.generation != generation:
+                # 커밋을 기다리는 중이면 오래된 파일을 다시 만들지 않고 DB 에서 조회
+                snapshot = None if cache.get(PENDING_KEY) else _rebuild(generation)
+            _snapshot = snapshot
+        _checked_at = time.monotonic()
+        return _snapshot
+
+
+def _rebuild(generation):
+    if connection.in_atomic_block:
+        # 트랜잭션 안에서는 커밋 전 데이터가 다른 워커에 공유되지 않도록
+        # 이 프로세스 메모리에만 만듦
+        return IdolDirectorySnapshot(encode_snapshot(generation, load_rows()))
+    try:
+        write_snapshot(generation)
+    except OSError:
+        logger.exception("아이돌 디렉터리 스냅샷을 쓰지 못했습니다.")
+    return map_snapshot()
+
+
+def get_idol(idol_id):
+    """
+    스냅샷에서 아이돌 정보를 찾습니다.
+
+    Args:
+        idol_id (int): 아이돌 ID
+
+    Returns:
+        dict | None: id, name, en_name, agency, image_url, is_active
+            (스냅샷에 없거나 스냅샷을 쓸 수 없으면 None)
+    """
+    snapshot = get_snapshot()
+    if snapshot is None:
+        return None
+    return snapshot.get(idol_id)
+
+
+def directory_changed():
+    """
+    아이돌 디렉터리가 바뀌었음을 알립니다.
+
+    세대를 올리고 커밋 전임을 표시해, 커밋될 때까지 모든 워커(이 프로세스 포함)가
+    오래된 스냅샷 대신 DB 에서 조회하도록 합니다. 커밋 후에는 세대를 한 번 더 올리고
+    스냅샷 파일을 다시 써서 다른 워커가 커밋된 데이터를 매핑하도록 합니다.
+    """
+    global _checked_at
+    idol_directory_generation.bump()
+    cache.set(PENDING_KEY, True, timeout=get_pending_timeout())
+    _checked_at = None
+    transaction.on_commit(_rebuild_after_commit)
+
+
+def _rebuild_after_commit():
+    global _checked_at
+    idol_directory_generation.bump()
+    _checked_at = None
+    try:
+        write_snapshot()
+    except OSError:
+        logger.exception("아이돌 디렉터리 스냅샷을 쓰지 못했습니다.")
+        return
+    # 커밋된 스냅샷을 썼으므로 다른 워커도 다시 파일을 매핑하도록 표시를 지움
+    # (다른 트랜잭션이 아직 커밋 전이어도, 그 트랜잭션의 커밋 후 세대를 다시 올리고 씀)
+    cache.delete(PENDING_KEY)
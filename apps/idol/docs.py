@@ -2,6 +2,7 @@ from drf_yasg import openapi
 from drf_yasg.utils import force_real_str, swagger_auto_schema
 
 from utils.responses.idol import (
+    IDOL_AUTOCOMPLETE_SUCCESS,
     IDOL_CREATE_SERVER_ERROR,
     IDOL_CREATE_SUCCESS,
     IDOL_CREATE_VALIDATION_FAIL,
@@ -27,6 +28,28 @@ idol_search_docs = swagger_auto_schema(
     tags=["아이돌/검색"],
 )
 
+# 아이돌 이름 자동완성
+idol_autocomplete_docs = swagger_auto_schema(
+    operation_summary="아이돌 이름 자동완성",
+    operation_description=(
+        "입력 중인 검색어로 시작하는 아이돌을 반환합니다. "
+        "한글 이름(입력 중인 글자 포함), 초성(예: ㅇㅇㅂ), 영문 이름으로 찾을 수 있습니다."
+    ),
+    manual_parameters=[
+        openapi.Parameter(
+            "q", openapi.IN_QUERY, description="검색어", type=openapi.TYPE_STRING
+        ),
+        openapi.Parameter(
+            "limit",
+            openapi.IN_QUERY,
+            description="최대 결과 수 (기본값 10, 최대 20)",
+            type=openapi.TYPE_INTEGER,
+        ),
+    ],
+    responses={200: force_real_str(IDOL_AUTOCOMPLETE_SUCCESS)},
+    tags=["아이돌/검색"],
+)
+
 # 아이돌 생성
 idol_create_docs = swagger_auto_schema(
     operation_summary="아이돌 생성",
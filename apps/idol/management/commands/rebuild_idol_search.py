@@ -0,0 +1,59 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from apps.idol.models import Idol
+from apps.idol.search import (
+    SEARCH_KEY_SEPARATOR,
+    build_search_keys,
+    search_index_changed,
+)
+
+
+class Command(BaseCommand):
+    """
+    아이돌 이름 검색 키(search_keys)를 다시 만들고 검색 인덱스 세대를 올립니다.
+
+    검색 키 컬럼을 추가하는 마이그레이션 적용 직후, 검색 키 규칙이 바뀐 경우,
+    또는 queryset.update() 처럼 Idol.save() 를 거치지 않고 이름이 바뀐 경우에 실행합니다.
+
+    사용 예:
+        python manage.py rebuild_idol_search --batch-size 500
+    """
+
+    help = "아이돌 이름 검색 키를 재생성합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="한 번에 처리할 행 수 (기본값: 1000)",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        total = 0
+        last_pk = 0
+        while True:
+            idols = list(
+                Idol.objects.filter(pk__gt=last_pk)
+                .order_by("pk")
+                .only("pk", "name", "en_name", "search_keys")[:batch_size]
+            )
+            if not idols:
+                break
+            last_pk = idols[-1].pk
+
+            for idol in idols:
+                idol.search_keys = SEARCH_KEY_SEPARATOR.join(
+                    build_search_keys(idol.name, idol.en_name)
+                )
+            with transaction.atomic():
+                Idol.objects.bulk_update(idols, ["search_keys"])
+            total += len(idols)
+
+        # 각 프로세스의 검색 인덱스가 다음 세대 확인 때 다시 만들어지도록 함
+        search_index_changed()
+        self.stdout.write(
+            self.style.SUCCESS(f"아이돌 {total}건의 검색 키를 재생성했습니다.")
+        )
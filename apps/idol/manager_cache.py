@@ -0,0 +1,68 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+# 사용자별 담당 아이돌 ID 캐시
+#
+# 일정 등록/수정 권한을 확인할 때마다 Idol.managers 다대다 테이블을 JOIN 하지 않도록
+# 사용자가 담당하는 아이돌 ID 집합을 캐시합니다.
+#
+# - 요청 안에서는 request.user 객체에 저장해 한 번만 불러옴
+#   (Django ModelBackend 의 _perm_cache 처럼 사용자 객체 수명 동안 유지)
+# - 요청 사이에는 공유 캐시에 액세스 토큰 수명 동안 저장
+# - Idol.managers 가 바뀌면(m2m_changed) 관련 사용자의 캐시를 지움
+#   (apps/idol/signals.py, 커밋 후 한 번 더 지움)
+
+CACHE_KEY = "idols:managed:{user_id}"
+USER_ATTR = "_managed_idol_ids"
+
+
+def get_cache_key(user_id):
+    return CACHE_KEY.format(user_id=user_id)
+
+
+def get_cache_timeout():
+    lifetime = settings.SIMPLE_JWT.get("ACCESS_TOKEN_LIFETIME")
+    return int(lifetime.total_seconds()) if lifetime else 300
+
+
+def get_managed_idol_ids(user):
+    """
+    사용자가 담당하는 아이돌 ID 집합을 반환합니다.
+
+    Args:
+        user (User): 요청 사용자 (AnonymousUser 가능)
+
+    Returns:
+        frozenset[int]: 담당 아이돌 ID 집합 (로그인하지 않았으면 빈 집합)
+    """
+    if user is None or not user.is_authenticated:
+        return frozenset()
+    idol_ids = getattr(user, USER_ATTR, None)
+    if idol_ids is not None:
+        return idol_ids
+
+    key = get_cache_key(user.pk)
+    idol_ids = cache.get(key)
+    if idol_ids is None:
+        idol_ids = frozenset(user.managed_idols.values_list("id", flat=True))
+        cache.set(key, idol_ids, timeout=get_cache_timeout())
+    setattr(user, USER_ATTR, idol_ids)
+    return idol_ids
+
+
+def manages_idol(user, idol_id):
+    """사용자가 아이돌의 담당 매니저인지 반환합니다."""
+    return int(idol_id) in get_managed_idol_ids(user)
+
+
+def invalidate_managed_idol_ids(user_ids):
+    """
+    사용자들의 담당 아이돌 ID 캐시를 지웁니다.
+    커밋 전에 다른 요청이 이전 값을 다시 캐시할 수 있으므로 커밋 후에 한 번 더 지웁니다.
+    """
+    keys = [get_cache_key(user_id) for user_id in set(user_ids)]
+    if not keys:
+        return
+    cache.delete_many(keys)
+    transaction.on_commit(lambda: cache.delete_many(keys))
@@ -0,0 +1,32 @@
+# Generated by Django 5.2.18 on 2026-10-17 21:26
+
+from django.db import migrations, models
+from django.db.models import OuterRef
+
+from utils.counters import count_subquery
+
+
+def backfill_followers_count(apps, schema_editor):
+    """기존 아이돌의 팔로워 수를 채웁니다. (reconcile_follower_counts 와 같은 계산)"""
+    Idol = apps.get_model("idol", "Idol")
+    Follow = apps.get_model("follow", "Follow")
+    Idol.objects.update(
+        followers_count=count_subquery(Follow.objects.filter(idol_id=OuterRef("pk")))
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("idol", "0001_initial"),
+        ("follow", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="idol",
+            name="followers_count",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_followers_count, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-17 21:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("idol", "0002_idol_followers_count"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="idol",
+            name="search_keys",
+            field=models.TextField(blank=True, default="", editable=False),
+        ),
+    ]
@@ -4,6 +4,8 @@ from django.db import models
 from apps.image.models import Image
 from apps.user.models import User
 
+from .search import SEARCH_KEY_SEPARATOR, build_search_keys
+
 
 class Idol(models.Model):
     """
@@ -18,6 +20,8 @@ class Idol(models.Model):
         created_at (datetime): 생성 시간
         updated_at (datetime): 수정 시간
         is_active (bool): 활동 상태
+        followers_count (int): 팔로워 수 (팔로우/언팔로우 시 함께 갱신되는 비정규화 값)
+        search_keys (str): 이름 검색 키 (자모 분해, 초성, 영문 이름을 줄바꿈으로 연결, 자동 생성)
     """
 
     name = models.CharField(max_length=100, db_index=True)  # 아이돌 이름
@@ -30,6 +34,8 @@ class Idol(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)  # 생성 시간
     updated_at = models.DateTimeField(auto_now=True)  # 수정 시간
     is_active = models.BooleanField(default=True)  # 활동 상태
+    followers_count = models.PositiveIntegerField(default=0)  # 팔로워 수
+    search_keys = models.TextField(blank=True, default="", editable=False)  # 검색 키
     managers = models.ManyToManyField(User, related_name="managed_idols", blank=True)
     # 아이돌이랑 매니저 다대다 관계 설정
 
@@ -47,12 +53,22 @@ class Idol(models.Model):
         """아이돌의 문자열 표현을 반환합니다."""
         return self.name
 
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get("update_fields")
+        if update_fields is None or {"name", "en_name"} & set(update_fields):
+            self.search_keys = SEARCH_KEY_SEPARATOR.join(
+                build_search_keys(self.name, self.en_name)
+            )
+            if update_fields is not None:
+                kwargs["update_fields"] = {*update_fields, "search_keys"}
+        super().save(*args, **kwargs)
+
     def deactivate(self):
         """아이돌을 비활성화합니다."""
         self.is_active = False
-        self.save(update_fields=["is_active"])
+        self.save(update_fields=["is_active", "updated_at"])
 
     def activate(self):
         """아이돌을 활성화합니다."""
         self.is_active = True
-        self.save(update_fields=["is_active"])
+        self.save(update_fields=["is_active", "updated_at"])
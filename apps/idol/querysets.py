@@ -0,0 +1,21 @@
+from django.db.models import BooleanField, Exists, OuterRef, Value
+
+from apps.follow.models import Follow
+
+
+def with_follow_state(queryset, user):
+    """
+    아이돌 목록/상세 렌더링에 필요한 팔로우 정보를 같은 쿼리에서 불러오도록 구성합니다.
+
+    - 내 팔로우 여부(is_following): Exists 서브쿼리로 annotate
+    - 팔로워 수: Idol.followers_count 컬럼 사용 (팔로우/언팔로우 시 함께 갱신)
+
+    Args:
+        queryset (QuerySet): Idol 쿼리셋
+        user (User): 요청 사용자 (AnonymousUser 가능)
+    """
+    if user is not None and user.is_authenticated:
+        is_following = Exists(Follow.objects.filter(user=user, idol_id=OuterRef("pk")))
+    else:
+        is_following = Value(False, output_field=BooleanField())
+    return queryset.annotate(is_following=is_following)
@@ -0,0 +1,257 @@
+import threading
+import time
+from bisect import bisect_left
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
+
+from utils.generation import CacheGeneration
+
+# 아이돌 이름 검색/자동완성
+#
+# 이름을 다음 형태로 정규화한 검색 키를 만들어 Idol.search_keys 에 저장하고,
+# 인덱스를 만들 때 그대로 읽습니다.
+# (공백 제거, 영문 소문자)
+#
+# - 자모 분해: "아이브" -> "ㅇㅏㅇㅣㅂㅡ"
+#   입력 중인 글자("아입" -> "ㅇㅏㅇㅣㅂ")도 접두사로 일치합니다.
+# - 초성: "아이브" -> "ㅇㅇㅂ"
+# - 영문 이름: "IVE" -> "ive"
+#
+# 모든 아이돌의 검색 키를 메모리 인덱스에 올려 두고 DB 의 LIKE '%...%' 전체 탐색 없이 찾습니다.
+# - 자동완성: 정렬된 검색 키 배열에서 bisect 로 접두사 범위를 찾음 (활동 중인 아이돌만)
+# - 이름 검색/필터: 아이돌별 이름/영문 이름(정규화)에서 부분 일치를 찾아 pk IN (...) 조건으로 변환
+#   자모 분해는 음절 경계를 넘어 일치하므로("안" -> "ㅇㅏㄴ" 이 "아나" 와 일치)
+#   자모/초성 일치는 자동완성에서만 사용
+# 아이돌이 저장/삭제되면 세대(idol_search_generation)를 올리고, 각 프로세스는
+# IDOL_SEARCH_CHECK_INTERVAL 초마다 세대를 확인해 바뀌었으면 인덱스를 다시 만듭니다.
+# (키 입력마다 캐시를 조회하지 않음, apps/idol/directory.py 와 같은 방식)
+
+CHOSUNG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+JUNGSUNG = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+JONGSUNG = [""] + list("ㄱㄲㄳㄴㄵㄶㄷㄹㄺㄻㄼㄽㄾㄿㅀㅁㅂㅄㅅㅆㅇㅈㅊㅋㅌㅍㅎ")
+
+# 한 번에 입력되지 않는 복합 모음/겹받침은 입력 순서대로 나눔 ("과" 입력 중 "고" 와 일치)
+COMPOUND_JAMO = {
+    "ㅘ": "ㅗㅏ",
+    "ㅙ": "ㅗㅐ",
+    "ㅚ": "ㅗㅣ",
+    "ㅝ": "ㅜㅓ",
+    "ㅞ": "ㅜㅔ",
+    "ㅟ": "ㅜㅣ",
+    "ㅢ": "ㅡㅣ",
+    "ㄳ": "ㄱㅅ",
+    "ㄵ": "ㄴㅈ",
+    "ㄶ": "ㄴㅎ",
+    "ㄺ": "ㄹㄱ",
+    "ㄻ": "ㄹㅁ",
+    "ㄼ": "ㄹㅂ",
+    "ㄽ": "ㄹㅅ",
+    "ㄾ": "ㄹㅌ",
+    "ㄿ": "ㄹㅍ",
+    "ㅀ": "ㄹㅎ",
+    "ㅄ": "ㅂㅅ",
+}
+
+# search_keys 컬럼에 검색 키를 이어 붙일 때 쓰는 구분자 (검색어에는 나오지 않는 문자)
+SEARCH_KEY_SEPARATOR = "\n"
+
+HANGUL_BASE = 0xAC00
+HANGUL_LAST = 0xD7A3
+
+idol_search_generation = CacheGeneration(
+    "idols:search:generation", "idols:search:generation:changed-at"
+)
+
+
+def normalize(text):
+    """공백을 제거하고 소문자로 바꿉니다."""
+    return "".join((text or "").lower().split())
+
+
+def decompose(text):
+    """한글 음절을 입력 순서대로 자모로 분해합니다. 한글이 아닌 문자는 그대로 둡니다."""
+    jamo = []
+    for char in normalize(text):
+        code = ord(char) - HANGUL_BASE
+        if 0 <= code <= HANGUL_LAST - HANGUL_BASE:
+            cho, rest = divmod(code, 21 * 28)
+            jung, jong = divmod(rest, 28)
+            parts = CHOSUNG[cho] + JUNGSUNG[jung] + JONGSUNG[jong]
+        else:
+            parts = char
+        jamo.append("".join(COMPOUND_JAMO.get(part, part) for part in parts))
+    return "".join(jamo)
+
+
+def chosung(text):
+    """한글 음절의 초성만 남깁니다. 한글이 없으면 빈 문자열."""
+    initials = []
+    for char in normalize(text):
+        code = ord(char) - HANGUL_BASE
+        if 0 <= code <= HANGUL_LAST - HANGUL_BASE:
+            initials.append(CHOSUNG[code // (21 * 28)])
+        elif char in CHOSUNG:
+            initials.append(char)
+    return "".join(initials)
+
+
+def build_search_keys(name, en_name=""):
+    """
+    아이돌의 검색 키 목록(자모 분해, 초성, 영문 이름)을 만듭니다.
+
+    Args:
+        name (str): 아이돌 이름
+        en_name (str): 아이돌 영문 이름
+
+    Returns:
+        list[str]: 중복을 제거한 검색 키 목록
+    """
+    keys = [decompose(name), chosung(name), normalize(en_name)]
+    return list(dict.fromkeys(key for key in keys if key))
+
+
+def name_search_filter(query):
+    """
+    아이돌 이름 검색 조건을 반환합니다.
+    이름/영문 이름 부분 일치(name__icontains 와 같은 결과, 공백 무시)를 메모리 인덱스에서
+    찾아 pk IN (...) 조건으로 바꿉니다. 검색어가 비어 있으면 조건 없음.
+    """
+    if not normalize(query):
+        return Q()
+    return Q(pk__in=get_autocomplete_index().contains(query))
+
+
+class IdolAutocompleteIndex:
+    """
+    아이돌 검색 키 메모리 인덱스
+
+    활동 중인 아이돌의 (검색 키, 아이돌 ID) 를 검색 키 순으로 정렬한 배열을 만들어 두고,
+    bisect 로 접두사가 시작되는 위치를 찾아 일치하는 아이돌을 반환합니다.
+    부분 일치 검색을 위해 아이돌별 이름/영문 이름을 이어 붙인 문자열도 함께 둡니다.
+    """
+
+    def __init__(self, rows, generation=None):
+        """
+        Args:
+            rows (Iterable[tuple[int, str, str, bool, str]]):
+                (아이돌 ID, 이름, 영문 이름, 활동 상태, 저장된 검색 키(Idol.search_keys))
+                저장된 검색 키가 비어 있으면 이름으로 다시 만듭니다.
+            generation (int, optional): 인덱스를 만든 시점의 세대
+        """
+        self.generation = generation
+        self.idols = {}
+        self.haystacks = {}
+        entries = []
+        for pk, name, en_name, is_active, search_keys in rows:
+            if search_keys:
+                keys = search_keys.split(SEARCH_KEY_SEPARATOR)
+            else:
+                keys = build_search_keys(name, en_name)
+            self.haystacks[pk] = SEARCH_KEY_SEPARATOR.join(
+                [normalize(name), normalize(en_name)]
+            )
+            if not is_active:
+                continue
+            self.idols[pk] = {"id": pk, "name": name, "en_name": en_name}
+            entries.extend((key, pk) for key in keys)
+        entries.sort()
+        self.keys = [key for key, _ in entries]
+        self.ids = [pk for _, pk in entries]
+
+    def search(self, query, limit=10):
+        """
+        검색어로 시작하는 검색 키를 가진 아이돌을 최대 limit 명 반환합니다.
+
+        Args:
+            query (str): 검색어 (이름, 초성, 영문 이름의 앞부분)
+            limit (int): 최대 결과 수
+
+        Returns:
+            list[dict]: {"id", "name", "en_name"} 목록 (검색 키 순)
+        """
+        prefix = decompose(query)
+        if not prefix or limit <= 0:
+            return []
+        results = []
+        seen = set()
+        for position in range(bisect_left(self.keys, prefix), len(self.keys)):
+            if not self.keys[position].startswith(prefix):
+                break
+            pk = self.ids[position]
+            if pk not in seen:
+                seen.add(pk)
+                results.append(self.idols[pk])
+                if len(results) >= limit:
+                    break
+        return results
+
+    def contains(self, query):
+        """
+        이름이나 영문 이름에 검색어가 포함된 아이돌 ID 목록을 반환합니다. (비활성 아이돌 포함)
+
+        Args:
+            query (str): 검색어 (이름, 영문 이름의 일부)
+        """
+        needle = normalize(query)
+        if not needle:
+            return []
+        return [pk for pk, haystack in self.haystacks.items() if needle in haystack]
+
+
+_index = None
+_checked_at = None
+_index_lock = threading.Lock()
+
+
+def get_check_interval():
+    return getattr(settings, "IDOL_SEARCH_CHECK_INTERVAL", 1)
+
+
+def get_autocomplete_index():
+    """
+    현재 세대의 검색 인덱스를 반환합니다. 세대가 바뀌었으면 DB 에서 다시 만듭니다.
+    (프로세스마다 하나, 세대는 IDOL_SEARCH_CHECK_INTERVAL 초마다 한 번만 확인)
+    """
+    from .models import Idol
+
+    global _index, _checked_at
+    index, checked_at = _index, _checked_at
+    if (
+        index is not None
+        and checked_at is not None
+        and time.monotonic() - checked_at < get_check_interval()
+    ):
+        return index
+    with _index_lock:
+        generation = idol_search_generation.get()
+        if _index is None or _index.generation != generation:
+            rows = Idol.objects.values_list(
+                "pk", "name", "en_name", "is_active", "search_keys"
+            )
+            _index = IdolAutocompleteIndex(rows, generation=generation)
+        _checked_at = time.monotonic()
+        return _index
+
+
+def search_index_changed():
+    """
+    아이돌 검색 인덱스가 바뀌었음을 알립니다.
+
+    세대를 올리고 이 프로세스는 다음 조회 때 바로 세대를 확인합니다.
+    커밋 전에 다른 요청이 이전 데이터로 인덱스를 만들 수 있으므로 커밋 후에 한 번 더 올립니다.
+    """
+    _search_index_changed()
+    transaction.on_commit(_search_index_changed)
+
+
+def _search_index_changed():
+    global _checked_at
+    idol_search_generation.bump()
+    _checked_at = None
+
+
+def autocomplete(query, limit=10):
+    """활성 아이돌 중 검색어로 시작하는 이름/초성/영문 이름을 가진 아이돌을 반환합니다."""
+    return get_autocomplete_index().search(query, limit=limit)
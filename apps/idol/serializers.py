@@ -5,7 +5,9 @@
 import django_filters
 from rest_framework import serializers
 
+from apps.idol.directory import get_idol
 from apps.idol.models import Idol
+from apps.image.querysets import LATEST_IMAGE_ATTR, latest_image_url
 
 
 class IdolFilter(django_filters.FilterSet):
@@ -33,6 +35,7 @@ class IdolFilter(django_filters.FilterSet):
 
 class IdolSerializer(serializers.ModelSerializer):
     image_url = serializers.SerializerMethodField()
+    is_following = serializers.SerializerMethodField()
     """아이돌 정보 시리얼라이저"""
 
     class Meta:
@@ -46,14 +49,30 @@ class IdolSerializer(serializers.ModelSerializer):
             "description",
             "profile_image",
             "is_active",
+            "followers_count",
+            "is_following",
             "created_at",
             "updated_at",
             "image_url",
         ]
-        read_only_fields = ["id", "created_at", "updated_at"]
+        read_only_fields = ["id", "followers_count", "created_at", "updated_at"]
+
+    def get_is_following(self, obj):
+        """요청 사용자의 팔로우 여부를 반환합니다. (목록/상세는 with_follow_state 사용)"""
+        if hasattr(obj, "is_following"):
+            return obj.is_following
+        request = self.context.get("request")
+        if request and request.user.is_authenticated:
+            return obj.followers.filter(user=request.user).exists()
+        return False
 
     def get_image_url(self, obj):
-        image = obj.images.first()
-        if image and image.image_url:
-            return image.image_url
-        return None
+        """
+        최신 이미지 URL 을 반환합니다.
+        prefetch 하지 않았으면 아이돌 디렉터리 스냅샷에서 찾고, 없으면 DB 에서 조회합니다.
+        """
+        if not hasattr(obj, LATEST_IMAGE_ATTR):
+            idol = get_idol(obj.pk)
+            if idol is not None:
+                return idol["image_url"]
+        return latest_image_url(obj, "images")
@@ -0,0 +1,73 @@
+from django.contrib.contenttypes.models import ContentType
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from apps.image.models import Image
+from apps.image.signals import image_processed
+
+from .directory import directory_changed
+from .manager_cache import invalidate_managed_idol_ids
+from .models import Idol
+from .search import search_index_changed
+
+# 자동완성 인덱스에 영향을 주는 필드
+SEARCH_FIELDS = {"name", "en_name", "is_active"}
+# 아이돌 디렉터리 스냅샷에 담기는 필드
+DIRECTORY_FIELDS = {"name", "en_name", "agency", "is_active"}
+
+
+@receiver(post_save, sender=Idol)
+@receiver(post_delete, sender=Idol)
+def invalidate_idol_search_index(sender, update_fields=None, **kwargs):
+    """
+    아이돌 이름/영문 이름/활동 상태가 바뀌거나 삭제되면 검색 인덱스 세대를 올립니다.
+    (팔로워 수 갱신처럼 검색과 무관한 update_fields 저장은 무시)
+    """
+    if update_fields is not None and not SEARCH_FIELDS & set(update_fields):
+        return
+    search_index_changed()
+
+
+@receiver(post_save, sender=Idol)
+@receiver(post_delete, sender=Idol)
+def invalidate_idol_directory(sender, update_fields=None, **kwargs):
+    """아이돌 디렉터리 스냅샷에 담긴 필드가 바뀌거나 삭제되면 스냅샷을 다시 만듭니다."""
+    if update_fields is not None and not DIRECTORY_FIELDS & set(update_fields):
+        return
+    directory_changed()
+
+
+@receiver(post_delete, sender=Image)
+@receiver(image_processed)
+def invalidate_idol_directory_on_image(sender, instance, **kwargs):
+    """
+    아이돌 이미지가 처리 완료/삭제되면 스냅샷의 image_url 을 다시 만듭니다.
+    이미지는 작업 처리가 끝나야(image_processed) image_url 이 생기므로 post_save 는 받지 않음
+    (pending 이미지 등록이나 처리 완료 때 스냅샷을 두 번 다시 쓰지 않도록)
+    """
+    if instance.content_type_id == ContentType.objects.get_for_model(Idol).pk:
+        directory_changed()
+
+
+@receiver(m2m_changed, sender=Idol.managers.through)
+def invalidate_managed_idols(sender, instance, action, reverse, pk_set, **kwargs):
+    """
+    아이돌 매니저가 추가/삭제되면 관련 사용자의 담당 아이돌 ID 캐시를 지웁니다.
+
+    idol.managers.add(...) 는 instance 가 아이돌, pk_set 이 사용자 ID 이고
+    user.managed_idols.add(...) (reverse) 는 instance 가 사용자입니다.
+    clear() 는 pk_set 이 없으므로 지우기 전(pre_clear)에 대상 사용자를 찾습니다.
+    """
+    if reverse:
+        if action in ("post_add", "post_remove", "pre_clear"):
+            invalidate_managed_idol_ids([instance.pk])
+    elif action in ("post_add", "post_remove"):
+        invalidate_managed_idol_ids(pk_set or [])
+    elif action == "pre_clear":
+        invalidate_managed_idol_ids(instance.managers.values_list("id", flat=True))
+
+
+@receiver(pre_delete, sender=Idol)
+def invalidate_managed_idols_on_delete(sender, instance, **kwargs):
+    """아이돌을 삭제하면 매니저 관계도 함께 지워지므로(m2m_changed 없음) 캐시를 지웁니다."""
+    invalidate_managed_idol_ids(instance.managers.values_list("id", flat=True))
@@ -1,9 +1,455 @@
+import os
+import tempfile
+from unittest import mock
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from apps.follow.models import Follow
+from apps.follow.toggle import follow_idol
+from apps.idol.checks import check_directory_cache
+from apps.idol.directory import (
+    PENDING_KEY,
+    IdolDirectorySnapshot,
+    encode_snapshot,
+    get_idol,
+    get_snapshot,
+    idol_directory_generation,
+    map_snapshot,
+    write_snapshot,
+)
+from apps.idol.models import Idol
+from apps.idol.search import (
+    IdolAutocompleteIndex,
+    build_search_keys,
+    decompose,
+    idol_search_generation,
+)
+from apps.idol_schedule.models import Schedule
+from apps.idol_schedule.serializers import IdolScheduleSerializer
+from apps.image.models import Image
+from apps.image.signals import image_processed
+from apps.user.models import User
+
+
+class IdolFollowStateTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            email="fan@example.com",
+            password="password123",
+            name="Fan",
+            nickname="fan",
+        )
+        self.client.force_authenticate(user=self.user)
+        self.idols = [Idol.objects.create(name=f"아이돌 {index}") for index in range(3)]
+
+    def test_list_includes_follow_state(self):
+        """아이돌 목록/상세/검색에 팔로우 여부와 팔로워 수가 포함되는지 테스트"""
+        Follow.objects.create(user=self.user, idol=self.idols[1])
+
+        response = self.client.get(reverse("idols:idol-list"))
+        rows = {row["id"]: row for row in response.data}
+        self.assertTrue(rows[self.idols[1].id]["is_following"])
+        self.assertEqual(rows[self.idols[1].id]["followers_count"], 1)
+        self.assertFalse(rows[self.idols[0].id]["is_following"])
+
+        response = self.client.get(
+            reverse("idols:idol-detail", kwargs={"pk": self.idols[1].id})
+        )
+        self.assertTrue(response.data["is_following"])
+
+        response = self.client.get(reverse("idols:idol-search"), {"name": "아이돌 1"})
+        self.assertTrue(response.data[0]["is_following"])
+
+    def test_follow_changes_idol_etag(self):
+        """팔로우하면 아이돌 상세의 ETag 가 바뀌는지 테스트"""
+        url = reverse("idols:idol-detail", kwargs={"pk": self.idols[0].id})
+        etag = self.client.get(url)["ETag"]
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+        follow_idol(self.idols[0].id, self.user)
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.data["is_following"])
+        self.assertEqual(response.data["followers_count"], 1)
+
+
+class IdolSearchKeyTests(TestCase):
+    def test_build_search_keys(self):
+        """자모 분해, 초성, 영문 이름 검색 키를 만드는지 테스트"""
+        self.assertEqual(decompose("아이브"), "ㅇㅏㅇㅣㅂㅡ")
+        self.assertEqual(decompose("과 값"), "ㄱㅗㅏㄱㅏㅂㅅ")
+        self.assertEqual(
+            build_search_keys("아이브", "IVE"), ["ㅇㅏㅇㅣㅂㅡ", "ㅇㅇㅂ", "ive"]
+        )
+        self.assertEqual(build_search_keys("NCT 127", ""), ["nct127"])
+
+    def test_index_prefix_search(self):
+        """입력 중인 글자/초성/영문 이름 접두사로 찾는지 테스트"""
+        index = IdolAutocompleteIndex(
+            [
+                (1, "아이브", "IVE", True, ""),
+                (2, "아이유", "IU", True, ""),
+                (3, "에스파", "aespa", True, ""),
+                (4, "아이즈원", "IZ*ONE", False, ""),
+            ]
+        )
+        self.assertEqual([row["id"] for row in index.search("아입")], [1])
+        self.assertEqual([row["id"] for row in index.search("ㅇㅇ")], [1, 2])
+        self.assertEqual([row["id"] for row in index.search("I")], [2, 1])
+        self.assertEqual([row["id"] for row in index.search("아이", limit=1)], [1])
+        self.assertEqual(index.search(""), [])
+        # 부분 일치 검색은 비활성 아이돌도 포함하고, 자모/초성으로는 찾지 않음
+        self.assertEqual(sorted(index.contains("아이")), [1, 2, 4])
+        self.assertEqual(index.contains("스파"), [3])
+        self.assertEqual(index.contains("z*o"), [4])
+        self.assertEqual(index.contains("ㅇㅣ"), [])
+
+    def test_save_updates_search_keys(self):
+        """이름을 바꿔 저장하면 검색 키도 갱신되는지 테스트"""
+        idol = Idol.objects.create(name="아이브", en_name="IVE")
+        idol.name = "에스파"
+        idol.save(update_fields=["name"])
+        idol.refresh_from_db()
+        self.assertEqual(idol.search_keys.split("\n")[:2], ["ㅇㅔㅅㅡㅍㅏ", "ㅇㅅㅍ"])
+
+
+class IdolAutocompleteTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.url = reverse("idols:idol-autocomplete")
+        self.ive = Idol.objects.create(name="아이브", en_name="IVE")
+        self.iu = Idol.objects.create(name="아이유", en_name="IU")
+        self.aespa = Idol.objects.create(name="에스파", en_name="aespa")
+
+    def ids(self, response):
+        return [row["id"] for row in response.data]
+
+    def test_autocomplete(self):
+        """초성/입력 중인 글자/영문 이름으로 자동완성되는지 테스트"""
+        response = self.client.get(self.url, {"q": "ㅇㅇ"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.ids(response), [self.ive.id, self.iu.id])
+        self.assertEqual(
+            response.data[0], {"id": self.ive.id, "name": "아이브", "en_name": "IVE"}
+        )
+        self.assertEqual(
+            self.ids(self.client.get(self.url, {"q": "아입"})), [self.ive.id]
+        )
+        self.assertEqual(
+            self.ids(self.client.get(self.url, {"q": "AE"})), [self.aespa.id]
+        )
+        self.assertEqual(
+            self.ids(self.client.get(self.url, {"q": "아이", "limit": 1})),
+            [self.ive.id],
+        )
+
+    def test_autocomplete_uses_memory_index(self):
+        """인덱스를 만든 뒤에는 DB 를 조회하지 않는지 테스트"""
+        self.client.get(self.url, {"q": "ㅇ"})
+        with self.assertNumQueries(0):
+            self.client.get(self.url, {"q": "ㅇㅇ"})
+
+    def test_autocomplete_reflects_changes(self):
+        """아이돌 이름 변경/비활성화가 자동완성에 반영되는지 테스트"""
+        self.client.get(self.url, {"q": "ㅇ"})
+        self.ive.name = "르세라핌"
+        self.ive.save()
+        self.iu.deactivate()
+        self.assertEqual(self.ids(self.client.get(self.url, {"q": "ㅇㅇ"})), [])
+        self.assertEqual(
+            self.ids(self.client.get(self.url, {"q": "ㄹㅅ"})), [self.ive.id]
+        )
+
+    def test_search_matches_name_and_en_name(self):
+        """아이돌 검색이 이름/영문 이름 부분 일치로 찾고 자모/초성으로는 찾지 않는지 테스트"""
+        user = User.objects.create_user(
+            email="fan@example.com", password="password123", name="Fan", nickname="fan"
+        )
+        self.client.force_authenticate(user=user)
+        ana = Idol.objects.create(name="아나")
+        url = reverse("idols:idol-search")
+        # 자모 분해가 음절 경계를 넘어 일치하지 않음 ("안" -> "ㅇㅏㄴ" / "아나" -> "ㅇㅏㄴㅏ")
+        self.assertEqual(self.ids(self.client.get(url, {"name": "안"})), [])
+        self.assertEqual(self.ids(self.client.get(url, {"name": "ㅇㅅㅍ"})), [])
+        self.assertEqual(self.ids(self.client.get(url, {"name": "아나"})), [ana.id])
+        response = self.client.get(reverse("idols:idol-list"), {"name": "안"})
+        self.assertEqual(self.ids(response), [])
+        response = self.client.get(url, {"name": "ive"})
+        self.assertEqual(self.ids(response), [self.ive.id])
+        response = self.client.get(url, {"name": "이유"})
+        self.assertEqual(self.ids(response), [self.iu.id])
+
+    def test_generation_checked_once_per_interval(self):
+        """세대 확인 주기 안에서는 키 입력마다 캐시를 조회하지 않는지 테스트"""
+        self.client.get(self.url, {"q": "ㅇ"})
+        with mock.patch.object(cache, "get", wraps=cache.get) as cache_get:
+            self.client.get(self.url, {"q": "ㅇㅇ"})
+            self.client.get(self.url, {"q": "아이"})
+        generation_key = idol_search_generation.key
+        self.assertNotIn(
+            generation_key, [call.args[0] for call in cache_get.call_args_list]
+        )
+
+
+class IdolImagePrefetchTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.url = reverse("idols:idol-list")
+
+    def create_idol(self, index):
+        idol = Idol.objects.create(name=f"아이돌 {index}")
+        for version in ("old", "new"):
+            Image.objects.create(
+                content_object=idol,
+                image_url=f"https://img.example.com/{index}/{version}",
+            )
+        Image.objects.create(content_object=idol, status=Image.Status.PENDING)
+        return idol
+
+    def count_list_queries(self):
+        cache.clear()
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        return len(queries)
+
+    def test_list_uses_latest_done_image(self):
+        """목록/상세가 처리 완료된 최신 이미지를 보여주는지 테스트"""
+        idol = self.create_idol(0)
+        response = self.client.get(self.url)
+        self.assertEqual(response.data[0]["image_url"], "https://img.example.com/0/new")
+        response = self.client.get(reverse("idols:idol-detail", kwargs={"pk": idol.id}))
+        self.assertEqual(response.data["image_url"], "https://img.example.com/0/new")
+
+    def test_list_query_count_is_constant(self):
+        """아이돌 수와 관계없이 목록 쿼리 수가 같은지 테스트"""
+        self.create_idol(0)
+        single = self.count_list_queries()
+        for index in range(1, 5):
+            self.create_idol(index)
+        self.assertEqual(self.count_list_queries(), single)
+
+    def test_list_query_count_while_directory_change_pending(self):
+        """디렉터리 변경이 커밋을 기다리는 중(스냅샷 사용 불가)에도 목록 쿼리 수가 같은지 테스트"""
+
+        def count_pending_queries():
+            idol_directory_generation.bump()
+            cache.set(PENDING_KEY, True)
+            with mock.patch("apps.idol.directory._checked_at", None):
+                with CaptureQueriesContext(connection) as queries:
+                    response = self.client.get(self.url)
+            self.assertEqual(response.status_code, 200)
+            return len(queries)
+
+        self.create_idol(0)
+        single = count_pending_queries()
+        for index in range(1, 10):
+            self.create_idol(index)
+        self.assertEqual(count_pending_queries(), single)
+
+
+class IdolDirectoryTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        # 커밋 후 스냅샷 파일을 다시 쓰는 콜백까지 실행 (커밋 전에는 DB 에서 조회)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.idol = Idol.objects.create(name="아이브", en_name="IVE", agency=None)
+        self.user = User.objects.create_user(
+            email="manager@example.com",
+            password="password123",
+            name="Manager",
+            nickname="manager",
+        )
+
+    def test_encode_and_lookup(self):
+        """스냅샷 인코딩/이진 탐색 조회 테스트"""
+        snapshot = IdolDirectorySnapshot(
+            encode_snapshot(
+                7,
+                [
+                    {
+                        "id": 9,
+                        "name": "에스파",
+                        "en_name": "aespa",
+                        "agency": "SM",
+                        "image_url": "https://img.example.com/9",
+                        "is_active": False,
+                    },
+                    {
+                        "id": 2,
+                        "name": "아이유",
+                        "en_name": "",
+                        "agency": None,
+                        "image_url": None,
+                        "is_active": True,
+                    },
+                ],
+            )
+        )
+        self.assertEqual(snapshot.generation, 7)
+        self.assertEqual(
+            snapshot.get(2),
+            {
+                "id": 2,
+                "name": "아이유",
+                "en_name": "",
+                "agency": None,
+                "image_url": None,
+                "is_active": True,
+            },
+        )
+        self.assertEqual(snapshot.get(9)["agency"], "SM")
+        self.assertFalse(snapshot.get(9)["is_active"])
+        self.assertIsNone(snapshot.get(5))
+
+    def test_write_and_map_snapshot(self):
+        """스냅샷 파일을 쓰고 mmap 으로 읽는지 테스트"""
+        Image.objects.create(
+            content_object=self.idol, image_url="https://img.example.com/ive"
+        )
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "idols.bin")
+            with override_settings(IDOL_DIRECTORY_PATH=path):
+                generation = write_snapshot()
+                snapshot = map_snapshot()
+        self.assertEqual(snapshot.generation, generation)
+        self.assertEqual(
+            snapshot.get(self.idol.id),
+            {
+                "id": self.idol.id,
+                "name": "아이브",
+                "en_name": "IVE",
+                "agency": None,
+                "image_url": "https://img.example.com/ive",
+                "is_active": True,
+            },
+        )
+
+    def test_pending_change_serves_db_until_commit(self):
+        """커밋 전 변경이 있으면 스냅샷을 다시 만들지 않고 DB 조회로 넘기는지 테스트"""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "idols.bin")
+            with override_settings(IDOL_DIRECTORY_PATH=path):
+                write_snapshot()
+                with self.captureOnCommitCallbacks(execute=False) as callbacks:
+                    self.idol.name = "IVE"
+                    self.idol.save(update_fields=["name"])
+                    written_at = os.stat(path).st_mtime_ns
+                    self.assertIsNone(get_snapshot())
+                    self.assertEqual(os.stat(path).st_mtime_ns, written_at)
+                self.assertTrue(cache.get(PENDING_KEY))
+                for callback in callbacks:
+                    callback()
+                # 커밋 후 파일을 다시 쓰면 표시를 지움
+                self.assertIsNone(cache.get(PENDING_KEY))
+                self.assertEqual(get_idol(self.idol.id)["name"], "IVE")
+
+    def test_directory_cache_check(self):
+        """프로세스별 캐시를 쓰면 check --deploy 에서 경고하는지 테스트"""
+        local = {
+            "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+        }
+        with override_settings(CACHES=local):
+            self.assertEqual(
+                [error.id for error in check_directory_cache(None)], ["idol.W001"]
+            )
+        shared = {
+            "default": {
+                "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+                "LOCATION": tempfile.gettempdir(),
+            }
+        }
+        with override_settings(CACHES=shared):
+            self.assertEqual(check_directory_cache(None), [])
+
+    def test_schedule_idol_name_from_snapshot(self):
+        """일정의 idol_name 을 DB 조회 없이 스냅샷에서 찾고, 이름 변경을 반영하는지 테스트"""
+        now = timezone.now()
+        schedules = [
+            Schedule.objects.create(
+                user=self.user,
+                idol=self.idol,
+                title=f"일정 {index}",
+                description="",
+                start_date=now,
+                end_date=now,
+            )
+            for index in range(3)
+        ]
+        schedules = list(Schedule.objects.filter(pk__in=[s.pk for s in schedules]))
+        get_snapshot()
+        with self.assertNumQueries(0):
+            data = IdolScheduleSerializer(schedules, many=True).data
+        self.assertEqual({row["idol_name"] for row in data}, {"아이브"})
+
+        self.idol.name = "IVE"
+        self.idol.save(update_fields=["name"])
+        data = IdolScheduleSerializer(schedules, many=True).data
+        self.assertEqual({row["idol_name"] for row in data}, {"IVE"})
+
+    def test_image_change_updates_etags(self):
+        """아이돌 이미지/이름이 바뀌면 아이돌 상세와 일정 상세의 ETag 가 바뀌는지 테스트"""
+        now = timezone.now()
+        schedule = Schedule.objects.create(
+            user=self.user,
+            idol=self.idol,
+            title="일정",
+            description="",
+            start_date=now,
+            end_date=now,
+        )
+        client = APIClient()
+        idol_url = reverse("idols:idol-detail", kwargs={"pk": self.idol.id})
+        schedule_url = reverse(
+            "idol_schedule:schedule-retrieve-update-delete",
+            kwargs={"idol_id": self.idol.id, "pk": schedule.id},
+        )
+        idol_etag = client.get(idol_url)["ETag"]
+        schedule_etag = client.get(schedule_url)["ETag"]
+
+        image = Image.objects.create(
+            content_object=self.idol, image_url="https://img/new"
+        )
+        image_processed.send(sender=Image, instance=image)
+        response = client.get(idol_url, HTTP_IF_NONE_MATCH=idol_etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["image_url"], "https://img/new")
+
+        self.idol.name = "IVE"
+        self.idol.save(update_fields=["name"])
+        response = client.get(schedule_url, HTTP_IF_NONE_MATCH=schedule_etag)
+        self.assertEqual(response.status_code, 200)
+
+    def test_follow_list_uses_snapshot(self):
+        """팔로우 목록의 아이돌 정보가 스냅샷에서 채워지는지 테스트"""
+        Follow.objects.create(user=self.user, idol=self.idol)
+        client = APIClient()
+        client.force_authenticate(user=self.user)
+        response = client.get(reverse("follow:follow_list"))
+        self.assertEqual(
+            response.data["results"][0]["idol"],
+            {"id": self.idol.id, "name": "아이브", "en_name": "IVE", "agency": None},
+        )
+
+
 # from django.urls import reverse
 # from rest_framework import status
 # from rest_framework.test import APITestCase
 # from rest_framework_simplejwt.tokens import RefreshToken
 #
 # from apps.idol.models import Idol
+
+
 # from apps.user.models import User
 #
 #
@@ -11,6 +11,11 @@ urlpatterns = [
         name="idol-list",
     ),
     path("idols/search", IdolViewSet.as_view({"get": "search"}), name="idol-search"),
+    path(
+        "idols/autocomplete",
+        IdolViewSet.as_view({"get": "autocomplete"}),
+        name="idol-autocomplete",
+    ),
     path(
         "idols<int:pk>",
         IdolViewSet.as_view(
@@ -5,7 +5,10 @@ from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.viewsets import ModelViewSet
 
+from apps.follow.cache import follow_generation
+from apps.idol.directory import idol_directory_generation
 from apps.idol.docs import (
+    idol_autocomplete_docs,
     idol_create_docs,
     idol_delete_docs,
     idol_list_docs,
@@ -14,11 +17,15 @@ from apps.idol.docs import (
     idol_update_docs,
 )
 from apps.idol.models import Idol
+from apps.idol.querysets import with_follow_state
+from apps.idol.search import autocomplete, name_search_filter
 from apps.idol.serializers import IdolSerializer
+from apps.image.querysets import latest_image_prefetch
+from utils.conditional import ConditionalGetMixin
 
 
 class IdolFilter(dj_filters.FilterSet):
-    name = dj_filters.CharFilter(lookup_expr="icontains")
+    name = dj_filters.CharFilter(method="filter_name")
     agency = dj_filters.CharFilter(lookup_expr="icontains")
     debut_date = dj_filters.DateFilter(lookup_expr="gte")
     debut_date_end = dj_filters.DateFilter(field_name="debut_date", lookup_expr="lte")
@@ -27,17 +34,27 @@ class IdolFilter(dj_filters.FilterSet):
         model = Idol
         fields = ["name", "agency", "debut_date", "debut_date_end"]
 
+    def filter_name(self, queryset, name, value):
+        """이름, 영문 이름 부분 일치로 검색합니다. (초성 검색은 자동완성에서 지원)"""
+        return queryset.filter(name_search_filter(value))
 
-class IdolViewSet(ModelViewSet):
+
+AUTOCOMPLETE_DEFAULT_LIMIT = 10
+AUTOCOMPLETE_MAX_LIMIT = 20
+
+
+class IdolViewSet(ConditionalGetMixin, ModelViewSet):
     queryset = Idol.objects.all()
     serializer_class = IdolSerializer
     filter_backends = [DjangoFilterBackend, filters.OrderingFilter]
     filterset_class = IdolFilter
     ordering_fields = ["debut_date", "name", "created_at"]
     ordering = ["name"]
+    # 응답에 사용자별 팔로우 여부(is_following)가 포함됨
+    conditional_vary_on_user = True
 
     def get_permissions(self):
-        if self.action in ["list", "retrieve"]:
+        if self.action in ["list", "retrieve", "autocomplete"]:
             permission_classes = [permissions.AllowAny]
         else:
             permission_classes = [permissions.IsAuthenticated]
@@ -46,14 +63,34 @@ class IdolViewSet(ModelViewSet):
     def get_queryset(self):
         if self.action in ["partial_update", "update", "destroy"]:
             return Idol.objects.all()
-        return Idol.objects.filter(is_active=True)
+        queryset = Idol.objects.filter(is_active=True)
+        if self.action in ["list", "retrieve", "search"]:
+            # 팔로우 여부/팔로워 수를 같은 쿼리에서 불러와 팔로우 버튼을 바로 그림
+            # 최신 이미지는 쿼리 한 번으로 함께 불러옴 (디렉터리 스냅샷을 쓸 수 없어도 1+N 없음)
+            queryset = with_follow_state(queryset, self.request.user).prefetch_related(
+                latest_image_prefetch("images")
+            )
+        return queryset
+
+    def get_validator_probes(self):
+        """
+        아이돌의 MAX(updated_at)/개수에 팔로우 세대와 디렉터리 세대를 더해 검증자를 만듭니다.
+        팔로우/언팔로우와 아이돌 이미지 변경(image_url)은 updated_at 을 바꾸지 않지만
+        각 세대는 바꿉니다.
+        """
+        return super().get_validator_probes() + [
+            (follow_generation.changed_at(), follow_generation.get()),
+            (idol_directory_generation.changed_at(), idol_directory_generation.get()),
+        ]
 
     def perform_create(self, serializer):
         serializer.save(is_active=True)
 
     @idol_list_docs
     def list(self, request, *args, **kwargs):
-        return super().list(request, *args, **kwargs)
+        return self.conditional_get(
+            request, lambda: super(IdolViewSet, self).list(request, *args, **kwargs)
+        )
 
     @idol_create_docs
     def create(self, request, *args, **kwargs):
@@ -61,7 +98,10 @@ class IdolViewSet(ModelViewSet):
 
     @idol_retrieve_docs
     def retrieve(self, request, *args, **kwargs):
-        return super().retrieve(request, *args, **kwargs)
+        return self.conditional_get(
+            request,
+            lambda: super(IdolViewSet, self).retrieve(request, *args, **kwargs),
+        )
 
     @idol_update_docs
     def update(self, request, *args, **kwargs):
@@ -83,6 +123,21 @@ class IdolViewSet(ModelViewSet):
     @action(detail=False, methods=["get"])
     def search(self, request):
         name = request.query_params.get("name", "")
-        idols = self.get_queryset().filter(name__icontains=name)
+        idols = self.get_queryset().filter(name_search_filter(name))
         serializer = self.get_serializer(idols, many=True)
         return Response(serializer.data)
+
+    @idol_autocomplete_docs
+    @action(detail=False, methods=["get"])
+    def autocomplete(self, request):
+        """
+        검색어로 시작하는 아이돌을 메모리 접두사 인덱스에서 찾습니다.
+        (키 입력마다 호출되므로 DB 를 조회하지 않음, apps/idol/search.py 참고)
+        """
+        query = request.query_params.get("q", "")
+        try:
+            limit = int(request.query_params.get("limit", AUTOCOMPLETE_DEFAULT_LIMIT))
+        except ValueError:
+            limit = AUTOCOMPLETE_DEFAULT_LIMIT
+        limit = max(1, min(limit, AUTOCOMPLETE_MAX_LIMIT))
+        return Response(autocomplete(query, limit=limit))
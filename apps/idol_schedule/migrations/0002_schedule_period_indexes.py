@@ -0,0 +1,44 @@
+# Generated by Django 5.2.18 on 2026-10-17 21:51
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+def create_period_index(apps, schema_editor):
+    """
+    PostgreSQL 에서는 기간 겹침 조회용 (idol_id, 일정 기간 범위) GiST 인덱스를 만듭니다.
+    식은 apps/idol_schedule/querysets.py 의 schedule_period() 와 같아야 합니다.
+    그 외 DB 는 (idol, start_date) B-tree 인덱스를 사용합니다.
+    """
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS btree_gist")
+    schema_editor.execute(
+        "CREATE INDEX IF NOT EXISTS idol_schedule_period_gist "
+        "ON idol_schedule_schedule USING gist "
+        "(idol_id, tstzrange(start_date, GREATEST(start_date, end_date), '[]'))"
+    )
+
+
+def drop_period_index(apps, schema_editor):
+    if schema_editor.connection.vendor == "postgresql":
+        schema_editor.execute("DROP INDEX IF EXISTS idol_schedule_period_gist")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("idol", "0003_idol_search_keys"),
+        ("idol_schedule", "0001_initial"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="schedule",
+            index=models.Index(
+                fields=["idol", "start_date"], name="idol_schedu_idol_id_394f59_idx"
+            ),
+        ),
+        migrations.RunPython(create_period_index, drop_period_index),
+    ]
@@ -17,6 +17,13 @@ class Schedule(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            # 아이돌별 기간 조회 (PostgreSQL 은 마이그레이션에서 GiST 범위 인덱스를 추가,
+            # apps/idol_schedule/querysets.py 참고)
+            models.Index(fields=["idol", "start_date"]),
+        ]
+
     def __str__(self):
         return f"[{self.idol.name}] {self.title}"
 
@@ -0,0 +1,102 @@
+from datetime import datetime, time
+
+from django.db import connection
+from django.db.models import BooleanField, DateTimeField, F, Func, Value
+from django.db.models.functions import Greatest
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+
+# 기간이 겹치는 일정 조회
+#
+# 일정 [start_date, end_date] 가 조회 구간 [from, to) 와 겹치려면
+# start_date < to 이고 end_date >= from 이어야 합니다.
+# (start_date__gte / end_date__lte 조건은 구간에 걸쳐 있는 일정을 놓침)
+#
+# - PostgreSQL: 일정 기간 범위 && tstzrange(from, to, '[)')
+#   (idol_id, 일정 기간 범위) GiST 인덱스 사용 (마이그레이션 0002 참고)
+#   종료일이 시작일보다 빠른 행이 있어도 범위를 만들 수 있도록 끝은 GREATEST 로 보정
+# - 그 외(SQLite): 위 비교 조건, (idol, start_date) B-tree 인덱스 사용
+#   종료일은 PostgreSQL 과 같게 GREATEST(start_date, end_date) 로 보정해 비교
+# 구간 시작이 끝보다 늦으면 tstzrange 가 오류를 내므로 뷰에서 400 으로 거절합니다.
+
+
+class TimeRange(Func):
+    """tstzrange(시작, 끝, bounds) - 인덱스 식과 같도록 bounds 는 SQL 에 그대로 씀"""
+
+    function = "tstzrange"
+    output_field = DateTimeField()
+
+    def __init__(self, start, end, bounds="[]", **extra):
+        if bounds not in ("[]", "[)"):
+            raise ValueError(f"지원하지 않는 구간 경계입니다: {bounds}")
+        super().__init__(
+            start, end, template=f"%(function)s(%(expressions)s, '{bounds}')", **extra
+        )
+
+
+class RangeOverlaps(Func):
+    """두 범위가 겹치는지 여부 (PostgreSQL && 연산자)"""
+
+    arg_joiner = " && "
+    template = "(%(expressions)s)"
+    output_field = BooleanField()
+
+
+def schedule_period():
+    """일정 기간 범위 식 - GiST 인덱스 식과 같아야 인덱스를 사용함"""
+    return TimeRange(F("start_date"), Greatest(F("start_date"), F("end_date")))
+
+
+def parse_bound(value):
+    """
+    조회 구간 경계를 datetime 으로 바꿉니다. 날짜만 주면 그날 0시(현재 시간대)입니다.
+
+    Returns:
+        datetime | None: 형식이 맞지 않으면 None
+    """
+    try:
+        parsed = parse_datetime(value)
+        if parsed is None:
+            parsed_date = parse_date(value)
+            if parsed_date is None:
+                return None
+            parsed = datetime.combine(parsed_date, time.min)
+    except ValueError:
+        return None
+    if timezone.is_naive(parsed):
+        parsed = timezone.make_aware(parsed)
+    return parsed
+
+
+def overlapping(queryset, start=None, end=None):
+    """
+    조회 구간 [start, end) 와 기간이 겹치는 일정만 남깁니다.
+
+    Args:
+        queryset (QuerySet): Schedule 쿼리셋
+        start (datetime, optional): 구간 시작 (없으면 제한 없음)
+        end (datetime, optional): 구간 끝, 포함하지 않음 (없으면 제한 없음)
+    """
+    if start is None and end is None:
+        return queryset
+    if start is not None and end is not None:
+        if start > end:
+            raise ValueError("구간 시작이 끝보다 늦습니다.")
+        if start == end:
+            # 빈 구간 [t, t) 과 겹치는 일정은 없음 (PostgreSQL 빈 범위와 같음)
+            return queryset.none()
+    if connection.vendor == "postgresql":
+        # 경계가 None 이면 tstzrange 에서 제한 없음(무한대)으로 처리됨
+        window = TimeRange(
+            Value(start, output_field=DateTimeField()),
+            Value(end, output_field=DateTimeField()),
+            bounds="[)",
+        )
+        return queryset.filter(RangeOverlaps(schedule_period(), window))
+    if end is not None:
+        queryset = queryset.filter(start_date__lt=end)
+    if start is not None:
+        queryset = queryset.alias(
+            period_end=Greatest(F("start_date"), F("end_date"))
+        ).filter(period_end__gte=start)
+    return queryset
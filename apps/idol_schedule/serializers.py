@@ -1,10 +1,25 @@
 from rest_framework import serializers
 
+from apps.idol.directory import get_idol
+
 from .models import Idol, Schedule
 
 
+class IdolNameField(serializers.ReadOnlyField):
+    """일정의 아이돌 이름 - 아이돌 디렉터리 스냅샷에서 찾고, 없으면 DB 에서 조회"""
+
+    def get_attribute(self, instance):
+        return instance
+
+    def to_representation(self, schedule):
+        idol = get_idol(schedule.idol_id)
+        if idol is not None:
+            return idol["name"]
+        return schedule.idol.name
+
+
 class ScheduleSerializer(serializers.ModelSerializer):
-    idol_name = serializers.CharField(source="idol.name", read_only=True)
+    idol_name = IdolNameField()
 
     class Meta:
         model = Schedule
@@ -38,7 +53,7 @@ class ScheduleSerializer(serializers.ModelSerializer):
 
 # 조회 전용 시리얼라이저 (UserScheduleList에서 idol 일정 포함 시 사용)
 class IdolScheduleSerializer(serializers.ModelSerializer):
-    idol_name = serializers.CharField(source="idol.name", read_only=True)
+    idol_name = IdolNameField()
 
     class Meta:
         model = Schedule
@@ -1,3 +1,200 @@
+from datetime import datetime
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from apps.idol.manager_cache import get_managed_idol_ids
+from apps.idol_schedule.models import Idol, Schedule
+from apps.user.models import User
+
+
+class ManagedIdolCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.manager = User.objects.create_user(
+            email="manager@example.com",
+            password="password123",
+            nickname="매니저",
+            name="관리자",
+            is_staff=True,
+        )
+        self.idol = Idol.objects.create(name="아이브")
+        self.idol.managers.add(self.manager)
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.manager)
+        self.url = reverse(
+            "idol_schedule:schedule-list-create", kwargs={"idol_id": self.idol.id}
+        )
+
+    def create_schedule(self, title="팬미팅"):
+        # 요청마다 사용자를 새로 불러오는 실제 인증과 같도록 새 객체로 인증
+        self.client.force_authenticate(user=User.objects.get(pk=self.manager.pk))
+        now = timezone.now()
+        return self.client.post(
+            self.url,
+            {
+                "title": title,
+                "description": "설명",
+                "start_date": now.isoformat(),
+                "end_date": now.isoformat(),
+            },
+            format="json",
+        )
+
+    def manager_queries(self, queries):
+        table = Idol.managers.through._meta.db_table
+        return [query for query in queries if table in query["sql"]]
+
+    def test_create_uses_cached_managed_idols(self):
+        """담당 아이돌 ID 를 한 번만 불러오고 이후 등록은 매니저 테이블을 조회하지 않는지 테스트"""
+        with CaptureQueriesContext(connection) as first:
+            self.assertEqual(self.create_schedule().data["data"]["idol"], self.idol.id)
+        self.assertEqual(len(self.manager_queries(first.captured_queries)), 1)
+
+        with CaptureQueriesContext(connection) as second:
+            self.create_schedule("콘서트")
+        self.assertEqual(self.manager_queries(second.captured_queries), [])
+        self.assertEqual(Schedule.objects.filter(idol=self.idol).count(), 2)
+
+    def test_managers_change_invalidates_cache(self):
+        """매니저 추가/삭제(m2m_changed)가 캐시에 반영되는지 테스트"""
+        self.assertEqual(
+            get_managed_idol_ids(User.objects.get(pk=self.manager.pk)), {self.idol.id}
+        )
+
+        self.idol.managers.remove(self.manager)
+        self.assertEqual(self.create_schedule().status_code, 403)
+
+        other = Idol.objects.create(name="에스파")
+        self.manager.managed_idols.add(self.idol, other)
+        self.assertEqual(
+            get_managed_idol_ids(User.objects.get(pk=self.manager.pk)),
+            {self.idol.id, other.id},
+        )
+
+        self.idol.managers.clear()
+        self.assertEqual(
+            get_managed_idol_ids(User.objects.get(pk=self.manager.pk)), {other.id}
+        )
+
+    def test_only_owner_or_staff_can_edit_schedule(self):
+        """일정 수정은 작성자와 스태프만 가능하고, 담당 매니저라는 이유로는 허용되지 않는지 테스트"""
+        owner = User.objects.create_user(
+            email="owner@example.com",
+            password="password123",
+            nickname="작성자",
+            name="작성자",
+        )
+        now = timezone.now()
+        schedule = Schedule.objects.create(
+            user=owner,
+            idol=self.idol,
+            title="팬미팅",
+            description="설명",
+            start_date=now,
+            end_date=now,
+        )
+        editor = User.objects.create_user(
+            email="editor@example.com",
+            password="password123",
+            nickname="담당",
+            name="담당",
+        )
+        url = reverse(
+            "idol_schedule:schedule-retrieve-update-delete",
+            kwargs={"idol_id": self.idol.id, "pk": schedule.id},
+        )
+        self.client.force_authenticate(user=editor)
+        response = self.client.patch(url, {"title": "콘서트"}, format="json")
+        self.assertEqual(response.status_code, 403)
+
+        self.idol.managers.add(editor)
+        self.client.force_authenticate(user=User.objects.get(pk=editor.pk))
+        response = self.client.patch(url, {"title": "콘서트"}, format="json")
+        self.assertEqual(response.status_code, 403)
+
+        self.client.force_authenticate(user=User.objects.get(pk=owner.pk))
+        response = self.client.patch(url, {"title": "콘서트"}, format="json")
+        self.assertEqual(response.status_code, 200)
+        schedule.refresh_from_db()
+        self.assertEqual(schedule.title, "콘서트")
+
+
+class ScheduleOverlapTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="manager@example.com",
+            password="password123",
+            nickname="매니저",
+            name="관리자",
+        )
+        self.idol = Idol.objects.create(name="아이브")
+        self.url = reverse(
+            "idol_schedule:schedule-list-create", kwargs={"idol_id": self.idol.id}
+        )
+        self.client = APIClient()
+
+    def create(self, title, start, end):
+        tz = timezone.get_current_timezone()
+        return Schedule.objects.create(
+            user=self.user,
+            idol=self.idol,
+            title=title,
+            description="",
+            start_date=datetime(*start, tzinfo=tz),
+            end_date=datetime(*end, tzinfo=tz),
+        )
+
+    def titles(self, params):
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, 200)
+        return [row["title"] for row in response.data["data"]]
+
+    def test_overlapping_window(self):
+        """[from, to) 와 겹치는 일정(구간에 걸친 일정 포함)만 시작일 순으로 조회하는지 테스트"""
+        self.create("이전", (2026, 9, 1), (2026, 9, 30, 23))
+        self.create("시작 걸침", (2026, 9, 28), (2026, 10, 2))
+        self.create("안쪽", (2026, 10, 10), (2026, 10, 10, 2))
+        self.create("전체 포함", (2026, 9, 1), (2026, 12, 1))
+        self.create("끝 걸침", (2026, 10, 31, 22), (2026, 11, 2))
+        self.create("이후", (2026, 11, 1), (2026, 11, 3))
+
+        self.assertEqual(
+            self.titles({"from": "2026-10-01", "to": "2026-11-01"}),
+            ["전체 포함", "시작 걸침", "안쪽", "끝 걸침"],
+        )
+        self.assertEqual(
+            self.titles({"from": "2026-11-01T00:00:00"}),
+            ["전체 포함", "끝 걸침", "이후"],
+        )
+        self.assertEqual(self.titles({"to": "2026-09-28"}), ["이전", "전체 포함"])
+
+    def test_invalid_bound(self):
+        """기간 형식이 잘못되면 400 을 반환하는지 테스트"""
+        response = self.client.get(self.url, {"from": "다음 달"})
+        self.assertEqual(response.status_code, 400)
+
+    def test_reversed_window(self):
+        """from 이 to 보다 늦으면 400, 같으면 빈 구간으로 조회하는지 테스트"""
+        self.create("안쪽", (2026, 10, 10), (2026, 10, 10, 2))
+        response = self.client.get(self.url, {"from": "2026-11-01", "to": "2026-10-01"})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(self.titles({"from": "2026-10-10", "to": "2026-10-10"}), [])
+
+    def test_end_before_start_is_clamped(self):
+        """종료일이 시작일보다 빠른 일정은 시작 시각 하루짜리로 보고 비교하는지 테스트"""
+        self.create("역전", (2026, 10, 10), (2026, 10, 1))
+        self.assertEqual(
+            self.titles({"from": "2026-10-05", "to": "2026-10-20"}), ["역전"]
+        )
+        self.assertEqual(self.titles({"from": "2026-10-11"}), [])
+
+
 # from datetime import datetime, timedelta
 #
 # from rest_framework import status
@@ -3,11 +3,16 @@ from django.db.models import Q
 from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
 from rest_framework import generics, permissions
+from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
 
+from apps.idol.directory import idol_directory_generation
+from apps.idol.manager_cache import manages_idol
+from utils.conditional import ConditionalGetMixin
 from utils.responses import idol_schedule as S
 
 from .models import Idol, Schedule
+from .querysets import overlapping, parse_bound
 from .serializers import ScheduleSerializer
 
 
@@ -22,11 +27,11 @@ class IsIdolManagerOrOwner(permissions.BasePermission):
     def has_object_permission(self, request, view, obj):
         if request.user.is_staff:
             return True
-        return obj.user == request.user
+        return obj.user_id == request.user.id
 
 
 # 일정 목록 조회 및 등록 (아이돌 단위)
-class ScheduleListCreateView(generics.ListCreateAPIView):
+class ScheduleListCreateView(ConditionalGetMixin, generics.ListCreateAPIView):
     serializer_class = ScheduleSerializer
 
     def get_permissions(self):
@@ -52,7 +57,24 @@ class ScheduleListCreateView(generics.ListCreateAPIView):
         if end_date := params.get("end_date"):
             filters &= Q(end_date__lte=end_date)
 
-        return queryset.filter(filters)
+        # 기간 겹침 조회: [from, to) 와 겹치는 일정 (달력 화면 등, 구간에 걸친 일정 포함)
+        bounds = {}
+        for name in ("from", "to"):
+            if value := params.get(name):
+                bounds[name] = parse_bound(value)
+                if bounds[name] is None:
+                    raise ValidationError({name: "날짜 형식이 올바르지 않습니다."})
+        if "from" in bounds and "to" in bounds and bounds["from"] > bounds["to"]:
+            raise ValidationError({"to": "to 는 from 보다 빠를 수 없습니다."})
+        queryset = overlapping(queryset, bounds.get("from"), bounds.get("to"))
+
+        return queryset.filter(filters).order_by("start_date", "id")
+
+    def get_validator_probes(self):
+        # idol_name 은 일정의 updated_at 과 관계없이 바뀌므로 아이돌 디렉터리 세대를 포함
+        return super().get_validator_probes() + [
+            (idol_directory_generation.changed_at(), idol_directory_generation.get())
+        ]
 
     @swagger_auto_schema(
         operation_summary="아이돌 일정 목록 조회",
@@ -88,10 +110,27 @@ class ScheduleListCreateView(generics.ListCreateAPIView):
                 description="종료일 이전",
                 type=openapi.FORMAT_DATE,
             ),
+            openapi.Parameter(
+                "from",
+                openapi.IN_QUERY,
+                description="이 시각 이후까지 이어지는 일정 (기간 겹침 조회 구간 시작, 포함)",
+                type=openapi.TYPE_STRING,
+                format=openapi.FORMAT_DATETIME,
+            ),
+            openapi.Parameter(
+                "to",
+                openapi.IN_QUERY,
+                description="이 시각 전에 시작하는 일정 (기간 겹침 조회 구간 끝, 미포함, from 보다 빠르면 400)",
+                type=openapi.TYPE_STRING,
+                format=openapi.FORMAT_DATETIME,
+            ),
         ],
         responses={200: ScheduleSerializer(many=True)},
     )
     def get(self, request, *args, **kwargs):
+        return self.conditional_get(request, lambda: self.render_list(request))
+
+    def render_list(self, request):
         queryset = self.get_queryset()
         serializer = self.get_serializer(queryset, many=True)
         message = S.SCHEDULE_LIST_SUCCESS if queryset else S.SCHEDULE_LIST_EMPTY
@@ -130,22 +169,23 @@ class ScheduleListCreateView(generics.ListCreateAPIView):
 
     def perform_create(self, serializer):
         idol_id = self.kwargs["idol_id"]
-        try:
-            idol = Idol.objects.get(id=idol_id)
-        except ObjectDoesNotExist:
-            # 존재하지 않는 아이돌 ID로 접근 시 예외 처리
-            raise PermissionDenied(S.SCHEDULE_IDOL_NOT_FOUND["message"])
 
-        # 아이돌 담당 매니저 여부 검증
-        if self.request.user not in idol.managers.all():
+        # 아이돌 담당 매니저 여부 검증 (캐시된 담당 아이돌 ID 집합 사용, 아이돌을 다시 불러오지 않음)
+        if not manages_idol(self.request.user, idol_id):
+            if not Idol.objects.filter(id=idol_id).exists():
+                # 존재하지 않는 아이돌 ID로 접근 시 예외 처리
+                raise PermissionDenied(S.SCHEDULE_IDOL_NOT_FOUND["message"])
             raise PermissionDenied(S.SCHEDULE_PERMISSION_DENIED["message"])
 
-        serializer.save(user=self.request.user, idol=idol)
+        serializer.save(user=self.request.user, idol_id=idol_id)
 
 
 # 일정 상세 조회, 수정, 삭제 (아이돌 단위)
 class ScheduleRetrieveUpdateDeleteView(
-    generics.RetrieveAPIView, generics.DestroyAPIView, generics.UpdateAPIView
+    ConditionalGetMixin,
+    generics.RetrieveAPIView,
+    generics.DestroyAPIView,
+    generics.UpdateAPIView,
 ):
     serializer_class = ScheduleSerializer
 
@@ -160,12 +200,21 @@ class ScheduleRetrieveUpdateDeleteView(
             return Schedule.objects.none()  # Swagger용 빈 쿼리셋 반환
         return Schedule.objects.filter(idol_id=self.kwargs["idol_id"])
 
+    def get_validator_probes(self):
+        # idol_name 은 일정의 updated_at 과 관계없이 바뀌므로 아이돌 디렉터리 세대를 포함
+        return super().get_validator_probes() + [
+            (idol_directory_generation.changed_at(), idol_directory_generation.get())
+        ]
+
     @swagger_auto_schema(
         operation_summary="아이돌 일정 상세 조회",
         tags=["아이돌 일정"],
         responses={200: ScheduleSerializer},
     )
     def get(self, request, *args, **kwargs):
+        return self.conditional_get(request, lambda: self.render_detail(request))
+
+    def render_detail(self, request):
         try:
             instance = self.get_object()
             serializer = self.get_serializer(instance)
@@ -0,0 +1,165 @@
+import logging
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from .models import Image, ImageJob
+from .signals import image_processed
+from .utils import delete_from_cloudinary, process_image, upload_to_cloudinary
+
+logger = logging.getLogger(__name__)
+
+# 이미지 변환/업로드 작업 큐
+#
+# 업로드 요청에서 WebP 변환(LANCZOS 리사이즈, method=6)과 Cloudinary 업로드를 하면
+# 큰 사진 한 장이 gunicorn 워커 하나를 몇 초씩 점유하므로, 요청에서는 원본만 저장하고
+# pending 상태의 Image 와 ImageJob 을 만든 뒤 바로 응답합니다.
+# run_image_jobs 커맨드(워커)가 DB 에서 작업을 가져와 처리하므로 별도 브로커가 필요 없습니다.
+#
+# - 작업을 가져갈 때 available_at 을 임대 만료 시각으로 미뤄 두어, 워커가 처리 중에
+#   종료되더라도 임대가 끝나면 다른 워커가 다시 가져갑니다.
+# - 실패하면 재시도 간격을 두고 다시 시도하고, 최대 횟수를 넘기면 failed 로 표시합니다.
+
+
+def lease_seconds():
+    return getattr(settings, "IMAGE_JOB_LEASE_SECONDS", 300)
+
+
+def max_attempts():
+    return getattr(settings, "IMAGE_JOB_MAX_ATTEMPTS", 3)
+
+
+def enqueue_image(content_type, object_id, folder, file=None, url=None, uploader=None):
+    """
+    원본을 저장하고 pending 상태의 이미지와 처리 작업을 등록합니다.
+
+    Args:
+        content_type (ContentType): 이미지가 연결될 모델
+        object_id (int): 이미지가 연결될 객체의 pk
+        folder (str): Cloudinary 폴더
+        file (UploadedFile, optional): 업로드된 이미지 파일
+        url (str, optional): 업로드할 이미지 주소
+        uploader (User, optional): 업로드 요청 사용자
+
+    Returns:
+        Image: pending 상태의 이미지
+    """
+    with transaction.atomic():
+        image = Image.objects.create(
+            content_type=content_type,
+            object_id=object_id,
+            status=Image.Status.PENDING,
+            uploader=uploader,
+        )
+        job = ImageJob(image=image, folder=folder, source_url=url or "")
+        if file is not None:
+            job.source.save(file.name, file, save=False)
+        job.save()
+    return image
+
+
+def claim_jobs(limit):
+    """처리할 작업을 최대 limit 개 가져오고 임대 시각을 기록합니다."""
+    now = timezone.now()
+    with transaction.atomic():
+        jobs = list(
+            ImageJob.objects.select_for_update(skip_locked=True)
+            .filter(
+                Q(image__status=Image.Status.PENDING)
+                | Q(image__status=Image.Status.PROCESSING),
+                available_at__lte=now,
+            )
+            .select_related("image")
+            .order_by("available_at", "pk")[:limit]
+        )
+        if not jobs:
+            return []
+        job_ids = [job.pk for job in jobs]
+        ImageJob.objects.filter(pk__in=job_ids).update(
+            available_at=now + timedelta(seconds=lease_seconds())
+        )
+        Image.objects.filter(job__pk__in=job_ids).update(status=Image.Status.PROCESSING)
+    return jobs
+
+
+def run_job(job):
+    """작업 하나를 처리합니다. 성공하면 True."""
+    try:
+        if job.source:
+            with job.source.open("rb") as source:
+                image_url, public_id = upload_to_cloudinary(
+                    process_image(source), folder=job.folder
+                )
+        else:
+            # URL 업로드는 Cloudinary 가 직접 가져와 변환
+            image_url, public_id = upload_to_cloudinary(
+                job.source_url, folder=job.folder
+            )
+    except Exception as e:
+        logger.exception(f"이미지 작업 {job.pk} 처리 중 오류 발생")
+        fail_job(job, e)
+        return False
+
+    with transaction.atomic():
+        updated = Image.objects.filter(pk=job.image_id).update(
+            image_url=image_url, public_id=public_id, status=Image.Status.DONE
+        )
+        ImageJob.objects.filter(pk=job.pk).delete()
+    if not updated:
+        # 업로드하는 동안 이미지가 삭제됨 (작업도 함께 삭제됨) - 올린 파일만 정리
+        logger.warning(
+            f"이미지 작업 {job.pk}: 이미지가 삭제되어 업로드한 파일을 지웁니다."
+        )
+        try:
+            delete_from_cloudinary(public_id)
+        except RuntimeError:
+            logger.exception(f"이미지 작업 {job.pk}: Cloudinary 파일 삭제 실패")
+        return False
+
+    image = job.image
+    image.image_url = image_url
+    image.public_id = public_id
+    image.status = Image.Status.DONE
+    image_processed.send(sender=Image, instance=image)
+    return True
+
+
+def fail_job(job, error):
+    """실패한 작업을 재시도 대기 상태로 돌리거나, 최대 횟수를 넘겼으면 failed 로 표시합니다."""
+    job.attempts += 1
+    job.error = str(error)
+    if job.attempts >= max_attempts():
+        status = Image.Status.FAILED
+    else:
+        status = Image.Status.PENDING
+        # 재시도 간격: 30초, 60초, 120초 ...
+        job.available_at = timezone.now() + timedelta(
+            seconds=30 * 2 ** (job.attempts - 1)
+        )
+    # 처리 중에 이미지(와 작업)가 삭제됐을 수 있으므로 save 대신 update 사용 (0건이면 무시)
+    with transaction.atomic():
+        ImageJob.objects.filter(pk=job.pk).update(
+            attempts=job.attempts, error=job.error, available_at=job.available_at
+        )
+        Image.objects.filter(pk=job.image_id).update(status=status)
+
+
+def run_pending_jobs(limit=10):
+    """처리 가능한 작업을 limit 개까지 처리하고 (성공, 실패) 수를 반환합니다."""
+    succeeded = failed = 0
+    for job in claim_jobs(limit):
+        try:
+            done = run_job(job)
+        except Exception:
+            # 작업 하나의 예기치 못한 오류로 워커가 멈추지 않도록 기록만 하고 넘어감
+            # (임대가 끝나면 다시 가져감)
+            logger.exception(f"이미지 작업 {job.pk} 처리 중 예기치 못한 오류 발생")
+            done = False
+        if done:
+            succeeded += 1
+        else:
+            failed += 1
+    return succeeded, failed
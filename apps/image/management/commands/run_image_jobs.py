@@ -0,0 +1,59 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from apps.image.jobs import run_pending_jobs
+
+
+class Command(BaseCommand):
+    """
+    이미지 변환/업로드 작업 워커
+
+    DB 에 등록된 이미지 작업(ImageJob)을 가져와 WebP 변환 후 Cloudinary 에 업로드하고
+    Image.image_url / public_id 를 채웁니다. Redis 같은 별도 브로커 없이 실행됩니다.
+    여러 개를 띄워도 같은 작업을 중복 처리하지 않습니다. (PostgreSQL SKIP LOCKED)
+
+    사용 예:
+        python manage.py run_image_jobs            # 계속 실행 (작업이 없으면 대기)
+        python manage.py run_image_jobs --once     # 지금 처리 가능한 작업만 처리하고 종료
+    """
+
+    help = "대기 중인 이미지 변환/업로드 작업을 처리합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="대기 중인 작업을 모두 처리한 뒤 종료합니다.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=10,
+            help="한 번에 가져올 작업 수 (기본값: 10)",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=2.0,
+            help="작업이 없을 때 다시 확인하기까지 대기할 시간(초) (기본값: 2)",
+        )
+
+    def handle(self, *args, **options):
+        total_succeeded = total_failed = 0
+        while True:
+            succeeded, failed = run_pending_jobs(limit=options["batch_size"])
+            total_succeeded += succeeded
+            total_failed += failed
+            if succeeded or failed:
+                self.stdout.write(f"이미지 작업 성공 {succeeded}건, 실패 {failed}건")
+                continue
+            if options["once"]:
+                break
+            time.sleep(options["interval"])
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"이미지 작업 성공 {total_succeeded}건, 실패 {total_failed}건을 처리했습니다."
+            )
+        )
@@ -0,0 +1,77 @@
+# Generated by Django 5.2.18 on 2026-10-17 21:05
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("image", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="image",
+            name="status",
+            field=models.CharField(
+                choices=[
+                    ("pending", "대기"),
+                    ("processing", "처리 중"),
+                    ("done", "완료"),
+                    ("failed", "실패"),
+                ],
+                db_index=True,
+                default="done",
+                max_length=20,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="image",
+            name="image_url",
+            field=models.URLField(blank=True),
+        ),
+        migrations.CreateModel(
+            name="ImageJob",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("source", models.FileField(blank=True, upload_to="image_jobs/")),
+                ("source_url", models.URLField(blank=True)),
+                ("folder", models.CharField(max_length=100)),
+                ("attempts", models.PositiveSmallIntegerField(default=0)),
+                (
+                    "available_at",
+                    models.DateTimeField(default=django.utils.timezone.now),
+                ),
+                ("error", models.TextField(blank=True)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                (
+                    "image",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="job",
+                        to="image.image",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "이미지 작업",
+                "verbose_name_plural": "이미지 작업 목록",
+                "db_table": "image_job",
+                "indexes": [
+                    models.Index(
+                        fields=["available_at"], name="image_job_availab_b3cfe1_idx"
+                    )
+                ],
+            },
+        ),
+    ]
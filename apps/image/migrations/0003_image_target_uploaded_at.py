@@ -0,0 +1,21 @@
+# Generated by Django 5.2.18 on 2026-10-17 21:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("contenttypes", "0002_remove_content_type_name"),
+        ("image", "0002_image_jobs"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="image",
+            index=models.Index(
+                fields=["content_type", "object_id", "-uploaded_at"],
+                name="image_content_37e216_idx",
+            ),
+        ),
+    ]
@@ -1,11 +1,23 @@
+from django.conf import settings
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
 from django.db import models
+from django.utils import timezone
 
 
 class Image(models.Model):
-    image_url = models.URLField()
+    class Status(models.TextChoices):
+        PENDING = "pending", "대기"
+        PROCESSING = "processing", "처리 중"
+        DONE = "done", "완료"
+        FAILED = "failed", "실패"
+
+    # 업로드가 처리되는 동안(pending/processing)에는 빈 값
+    image_url = models.URLField(blank=True)
     public_id = models.CharField(max_length=255, blank=True, null=True)
+    status = models.CharField(
+        max_length=20, choices=Status.choices, default=Status.DONE, db_index=True
+    )
 
     # GenericForeignKey 구성 요소
     content_type = models.ForeignKey(
@@ -16,6 +28,14 @@ class Image(models.Model):
         "content_type", "object_id"
     )  # 위 둘을 합쳐 실제 객체처럼 동작하게 함
 
+    # 업로드 요청 사용자 (처리 상태 조회 권한 확인용, 이전 이미지는 없음)
+    uploader = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="uploaded_images",
+    )
     uploaded_at = models.DateTimeField(auto_now_add=True)
 
     def __str__(self):
@@ -26,6 +46,10 @@ class Image(models.Model):
         verbose_name = "이미지"
         verbose_name_plural = "이미지 목록"
         ordering = ["-uploaded_at"]
+        indexes = [
+            # 대상별 최신 이미지 조회 (apps/image/querysets.py)
+            models.Index(fields=["content_type", "object_id", "-uploaded_at"]),
+        ]
 
     def get_thumbnail_url(self, width=300, height=300, crop="fill"):
         # 썸네일 URL 동적 생성
@@ -34,3 +58,40 @@ class Image(models.Model):
         return self.image_url.replace(
             "/upload/", f"/upload/w_{width},h_{height},c_{crop}/"
         )
+
+
+class ImageJob(models.Model):
+    """
+    이미지 변환/업로드 작업 (apps/image/jobs.py)
+
+    업로드 요청은 원본을 저장하고 작업만 등록한 뒤 바로 응답하며,
+    run_image_jobs 워커가 WebP 변환과 Cloudinary 업로드를 처리합니다.
+    성공하면 작업은 삭제되고, 최대 재시도 횟수를 넘기면 error 와 함께 남습니다.
+
+    Attributes:
+        image (Image): 결과를 기록할 이미지 (status=pending 으로 생성)
+        source (File): 업로드된 원본 파일 (기본 스토리지에 임시 저장)
+        source_url (str): URL 로 요청된 경우 원본 이미지 주소
+        folder (str): Cloudinary 폴더
+        attempts (int): 시도 횟수
+        available_at (datetime): 이 시각 이후에 처리 (재시도 대기/처리 중 임대 만료 시각)
+        error (str): 마지막 오류 메시지
+    """
+
+    image = models.OneToOneField(Image, on_delete=models.CASCADE, related_name="job")
+    source = models.FileField(upload_to="image_jobs/", blank=True)
+    source_url = models.URLField(blank=True)
+    folder = models.CharField(max_length=100)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    available_at = models.DateTimeField(default=timezone.now)
+    error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = "image_job"
+        verbose_name = "이미지 작업"
+        verbose_name_plural = "이미지 작업 목록"
+        indexes = [models.Index(fields=["available_at"])]
+
+    def __str__(self):
+        return f"이미지 {self.image_id} 작업 ({self.attempts}회 시도)"
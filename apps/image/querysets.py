@@ -0,0 +1,74 @@
+from django.db.models import F, Prefetch, Q, Window
+from django.db.models.functions import RowNumber
+
+from .models import Image
+
+# 대상별 최신 이미지
+#
+# 목록에서 객체마다 images.filter(...).first() 를 호출하면 1+N 쿼리가 됩니다.
+# (content_type, object_id) 별 ROW_NUMBER() 윈도 함수로 순위를 매겨 1위만 남기면
+# 쿼리 한 번으로 객체마다 최신 이미지 1개만 가져옵니다.
+# (GenericRelation 의 prefetch 는 슬라이스된 쿼리셋을 지원하지 않아 윈도 필터 사용,
+#  Image(content_type, object_id, -uploaded_at) 인덱스 사용)
+
+LATEST_IMAGE_ATTR = "latest_images"
+
+
+def latest_done_images():
+    """대상별로 처리 완료된 최신 이미지 1개씩만 남긴 쿼리셋을 반환합니다."""
+    return (
+        Image.objects.filter(status=Image.Status.DONE)
+        .annotate(
+            image_rank=Window(
+                RowNumber(),
+                partition_by=[F("content_type"), F("object_id")],
+                order_by=[F("uploaded_at").desc(), F("id").desc()],
+            )
+        )
+        .filter(image_rank=1)
+    )
+
+
+def latest_image_prefetch(lookup, to_attr=LATEST_IMAGE_ATTR):
+    """
+    객체별 처리 완료된 최신 이미지 1개를 불러오는 Prefetch 를 반환합니다.
+
+    Args:
+        lookup (str): 이미지 GenericRelation 이름 (예: "images", "profile_images")
+        to_attr (str): 결과(리스트)를 저장할 속성 이름
+    """
+    return Prefetch(lookup, queryset=latest_done_images(), to_attr=to_attr)
+
+
+def latest_image_url(obj, lookup, to_attr=LATEST_IMAGE_ATTR):
+    """
+    객체의 최신 이미지 URL 을 반환합니다. 없으면 None.
+    latest_image_prefetch 로 불러온 경우 추가 쿼리 없이 결과를 사용합니다.
+
+    Args:
+        obj (Model): 이미지가 연결된 객체
+        lookup (str): 이미지 GenericRelation 이름
+        to_attr (str): latest_image_prefetch 결과 속성 이름
+    """
+    if hasattr(obj, to_attr):
+        images = getattr(obj, to_attr)
+        image = images[0] if images else None
+    else:
+        image = (
+            getattr(obj, lookup)
+            .filter(status=Image.Status.DONE)
+            .order_by("-uploaded_at", "-id")
+            .first()
+        )
+    if image and image.image_url:
+        return image.image_url
+    return None
+
+
+def accessible_images_filter(user):
+    """
+    사용자가 조회할 수 있는 이미지 조건을 반환합니다.
+    직접 업로드한 이미지와, 업로드 권한 검사(ImageUploadSerializer.validate)와 같은 기준으로
+    사용자가 소유한 대상(본인 프로필, 본인이 작성한 게시물)의 이미지입니다.
+    """
+    return Q(uploader=user) | Q(profile_image=user) | Q(post_image__author=user)
@@ -1,8 +1,9 @@
 from django.contrib.contenttypes.models import ContentType
 from rest_framework import serializers
 
+from apps.image.jobs import enqueue_image
 from apps.image.models import Image
-from apps.image.utils import delete_from_cloudinary, upload_to_cloudinary
+from apps.image.utils import delete_from_cloudinary
 from utils.exceptions import CustomAPIException
 from utils.responses.image import (
     IMAGE_CANNOT_VALIDATE_OWNERSHIP,
@@ -79,37 +80,31 @@ class ImageUploadSerializer(serializers.ModelSerializer):
                 {"image": "이미지 파일 또는 url이 필요합니다."}
             )
 
+        # 변환/업로드는 이미지 작업 워커에서 처리하고, 여기서는 pending 이미지만 등록
         images = []
-
-        # URL 업로드 처리
         for image_url in image_urls:
-            image_url, public_id = upload_to_cloudinary(
-                image_url, folder=validated_data["object_type"]
-            )
             images.append(
-                Image(
-                    image_url=image_url,
-                    public_id=public_id,
-                    content_type=validated_data["content_type"],
-                    object_id=validated_data["object_id"],
+                enqueue_image(
+                    validated_data["content_type"],
+                    validated_data["object_id"],
+                    folder=validated_data["object_type"],
+                    url=image_url,
+                    uploader=self.context["request"].user,
                 )
             )
 
         for image_file in image_files:
-            image_url, public_id = upload_to_cloudinary(
-                image_file, folder=validated_data["object_type"]
-            )
             images.append(
-                Image(
-                    image_url=image_url,
-                    public_id=public_id,
-                    content_type=validated_data["content_type"],
-                    object_id=validated_data["object_id"],
+                enqueue_image(
+                    validated_data["content_type"],
+                    validated_data["object_id"],
+                    folder=validated_data["object_type"],
+                    file=image_file,
+                    uploader=self.context["request"].user,
                 )
             )
 
-        # bulk_create
-        return Image.objects.bulk_create(images)
+        return images
 
     def update(self, instance, validated_data):
         """
@@ -142,3 +137,32 @@ class ImageUploadSerializer(serializers.ModelSerializer):
             delete_from_cloudinary(image.public_id)
         count, _ = images.delete()
         return count
+
+
+class ImageStatusSerializer(serializers.ModelSerializer):
+    """이미지 처리 상태 시리얼라이저"""
+
+    thumbnail_url = serializers.SerializerMethodField()
+    error = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Image
+        fields = [
+            "id",
+            "status",
+            "image_url",
+            "thumbnail_url",
+            "public_id",
+            "uploaded_at",
+            "error",
+        ]
+
+    def get_thumbnail_url(self, obj):
+        return obj.get_thumbnail_url() or None
+
+    def get_error(self, obj):
+        """처리에 실패한 경우 마지막 오류 메시지를 반환합니다."""
+        if obj.status != Image.Status.FAILED:
+            return None
+        job = getattr(obj, "job", None)
+        return job.error if job else None
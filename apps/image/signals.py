@@ -0,0 +1,14 @@
+from django.db.models.signals import post_delete
+from django.dispatch import Signal, receiver
+
+from .models import ImageJob
+
+# 이미지 작업이 끝나 image_url 이 채워졌을 때 (sender=Image, instance=Image)
+image_processed = Signal()
+
+
+@receiver(post_delete, sender=ImageJob)
+def delete_job_source(sender, instance, **kwargs):
+    """작업이 끝나거나 이미지가 삭제되면 임시로 저장한 원본 파일을 지웁니다."""
+    if instance.source:
+        instance.source.delete(save=False)
@@ -1,3 +1,180 @@
+import io
+import tempfile
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db import DatabaseError
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from PIL import Image as PilImage
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from apps.image import jobs
+from apps.image.jobs import run_pending_jobs
+from apps.image.models import Image, ImageJob
+from apps.image.querysets import latest_image_prefetch
+from apps.user.serializers import ProfileSerializer
+
+User = get_user_model()
+
+
+@override_settings(MEDIA_ROOT=tempfile.mkdtemp())
+class ImageJobTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            email="image@example.com",
+            password="password123",
+            name="Image User",
+            nickname="imageuser",
+        )
+        self.client.force_authenticate(user=self.user)
+
+    def upload(self):
+        file = io.BytesIO()
+        PilImage.new("RGB", (100, 100), "blue").save(file, "JPEG")
+        image_file = SimpleUploadedFile(
+            "test.jpg", file.getvalue(), content_type="image/jpeg"
+        )
+        return self.client.post(
+            reverse("image:upload"),
+            {"image": image_file, "object_type": "user", "object_id": self.user.id},
+            format="multipart",
+        )
+
+    def test_upload_returns_pending_image(self):
+        """업로드 요청은 변환/업로드 없이 pending 이미지로 바로 응답하는지 테스트"""
+        with mock.patch("apps.image.jobs.upload_to_cloudinary") as upload:
+            response = self.upload()
+        upload.assert_not_called()
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        data = response.data["data"][0]
+        self.assertEqual(data["status"], Image.Status.PENDING)
+        self.assertEqual(data["image_url"], "")
+        self.assertTrue(ImageJob.objects.filter(image_id=data["id"]).exists())
+
+    def test_worker_completes_job(self):
+        """워커 커맨드가 작업을 처리해 image_url/public_id 를 채우는지 테스트"""
+        image_id = self.upload().data["data"][0]["id"]
+        url = "https://res.cloudinary.com/demo/image/upload/user/a.webp"
+        with mock.patch(
+            "apps.image.jobs.upload_to_cloudinary", return_value=(url, "user/a")
+        ) as upload:
+            call_command("run_image_jobs", "--once", stdout=io.StringIO())
+        uploaded = upload.call_args[0][0]
+        self.assertEqual(uploaded.content_type, "image/webp")
+
+        response = self.client.get(reverse("image:status", kwargs={"pk": image_id}))
+        self.assertEqual(response.data["data"]["status"], Image.Status.DONE)
+        self.assertEqual(response.data["data"]["image_url"], url)
+        self.assertEqual(response.data["data"]["public_id"], "user/a")
+        self.assertFalse(ImageJob.objects.exists())
+
+    def test_status_is_scoped_to_owner(self):
+        """다른 사용자의 이미지 처리 상태는 404 로 응답하는지 테스트"""
+        image_id = self.upload().data["data"][0]["id"]
+        url = reverse("image:status", kwargs={"pk": image_id})
+        self.assertEqual(self.client.get(url).status_code, status.HTTP_200_OK)
+
+        other = User.objects.create_user(
+            email="other@example.com",
+            password="password123",
+            name="Other User",
+            nickname="otheruser",
+        )
+        self.client.force_authenticate(user=other)
+        self.assertEqual(self.client.get(url).status_code, status.HTTP_404_NOT_FOUND)
+
+        # 업로더 정보가 없는 이전 이미지도 소유한 대상이면 조회 가능
+        Image.objects.filter(pk=image_id).update(uploader=None)
+        self.client.force_authenticate(user=self.user)
+        self.assertEqual(self.client.get(url).status_code, status.HTTP_200_OK)
+
+    def test_failed_job_is_retried_then_marked_failed(self):
+        """업로드 실패 시 재시도 대기 후 최대 횟수를 넘기면 failed 로 표시하는지 테스트"""
+        image_id = self.upload().data["data"][0]["id"]
+        job = ImageJob.objects.get(image_id=image_id)
+        with mock.patch(
+            "apps.image.jobs.upload_to_cloudinary", side_effect=RuntimeError("boom")
+        ):
+            for _ in range(3):
+                ImageJob.objects.filter(pk=job.pk).update(available_at=job.created_at)
+                call_command("run_image_jobs", "--once", stdout=io.StringIO())
+
+        response = self.client.get(reverse("image:status", kwargs={"pk": image_id}))
+        self.assertEqual(response.data["data"]["status"], Image.Status.FAILED)
+        self.assertEqual(response.data["data"]["error"], "boom")
+        self.assertEqual(ImageJob.objects.get(pk=job.pk).attempts, 3)
+
+    def test_image_deleted_during_upload(self):
+        """업로드 중에 이미지가 삭제되면 올린 파일을 지우고 워커는 계속 동작하는지 테스트"""
+        image_id = self.upload().data["data"][0]["id"]
+
+        def upload_and_delete(*args, **kwargs):
+            Image.objects.filter(pk=image_id).delete()
+            return "https://res.cloudinary.com/demo/image/upload/user/a.webp", "user/a"
+
+        with (
+            mock.patch(
+                "apps.image.jobs.upload_to_cloudinary", side_effect=upload_and_delete
+            ),
+            mock.patch("apps.image.jobs.delete_from_cloudinary") as destroy,
+        ):
+            self.assertEqual(run_pending_jobs(), (0, 1))
+        destroy.assert_called_once_with("user/a")
+        self.assertFalse(ImageJob.objects.exists())
+
+    def test_unexpected_error_does_not_stop_worker(self):
+        """작업 하나에서 예기치 못한 오류가 나도 나머지 작업을 처리하는지 테스트"""
+        first_id = self.upload().data["data"][0]["id"]
+        self.upload()
+        url = "https://res.cloudinary.com/demo/image/upload/user/a.webp"
+        original_run_job = jobs.run_job
+
+        def run_job(job):
+            if job.image_id == first_id:
+                raise DatabaseError("boom")
+            return original_run_job(job)
+
+        with (
+            mock.patch("apps.image.jobs.run_job", side_effect=run_job),
+            mock.patch(
+                "apps.image.jobs.upload_to_cloudinary", return_value=(url, "user/a")
+            ),
+        ):
+            self.assertEqual(run_pending_jobs(), (1, 1))
+
+
+class LatestImagePrefetchTests(TestCase):
+    def test_profiles_prefetch_latest_image(self):
+        """사용자 목록이 최신 프로필 이미지를 쿼리 두 번으로 불러오는지 테스트"""
+        for index in range(3):
+            user = User.objects.create_user(
+                email=f"profile{index}@example.com",
+                password="password123",
+                name=f"Profile {index}",
+                nickname=f"profile{index}",
+            )
+            for version in ("old", "new"):
+                Image.objects.create(
+                    content_object=user,
+                    image_url=f"https://img.example.com/{index}/{version}",
+                )
+
+        users = User.objects.order_by("id").prefetch_related(
+            latest_image_prefetch("profile_images")
+        )
+        with self.assertNumQueries(2):
+            data = ProfileSerializer(users, many=True).data
+        self.assertEqual(
+            [row["image_url"] for row in data],
+            [f"https://img.example.com/{index}/new" for index in range(3)],
+        )
+
+
 # # tests/image/test_views.py
 #
 # import io
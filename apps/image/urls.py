@@ -1,9 +1,10 @@
 from django.urls import path
 
-from .views import ImageUploadView
+from .views import ImageStatusView, ImageUploadView
 
 app_name = "image"
 
 urlpatterns = [
     path("upload", ImageUploadView.as_view(), name="upload"),
+    path("<int:pk>/status", ImageStatusView.as_view(), name="status"),
 ]
@@ -1,5 +1,10 @@
+import io
+import os
+
 import cloudinary.uploader
 from cloudinary.exceptions import Error as CloudinaryError
+from django.core.files.uploadedfile import UploadedFile
+from PIL import Image
 
 
 def upload_to_cloudinary(file, folder="uploads"):
@@ -23,6 +28,38 @@ def upload_to_cloudinary(file, folder="uploads"):
         raise RuntimeError(f"Cloudinary 업로드 실패: {str(e)}")
 
 
+def process_image(image_file: UploadedFile) -> UploadedFile:
+    """
+    이미지 파일을 처리합니다.
+    - 이미지 크기 조정
+    - WebP 포맷으로 변환
+    - 이미지 품질 최적화
+    """
+    # 이미지 열기
+    img = Image.open(image_file)
+
+    # 이미지가 RGBA 모드인 경우 RGB로 변환
+    if img.mode in ("RGBA", "LA"):
+        background = Image.new("RGB", img.size, (255, 255, 255))
+        background.paste(img, mask=img.split()[-1])
+        img = background
+
+    # 이미지 크기 조정 (최대 1920x1080)
+    max_size = (1920, 1080)
+    img.thumbnail(max_size, Image.Resampling.LANCZOS)
+
+    # 이미지를 바이트로 변환
+    output = io.BytesIO()
+    img.save(output, format="WEBP", quality=85, method=6)  # method=6은 최고 압축률
+    output.seek(0)
+
+    # 파일명 생성 (WebP 확장자로 변경)
+    filename = os.path.splitext(image_file.name)[0] + ".webp"
+
+    # UploadedFile 객체 생성
+    return UploadedFile(file=output, name=filename, content_type="image/webp")
+
+
 def generate_thumbnail_url(original_url, width=300, height=300, crop="fill"):
     """
     Cloudinary 이미지 URL을 기반으로 썸네일 URL을 생성합니다.
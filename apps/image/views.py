@@ -1,14 +1,21 @@
 from drf_yasg.utils import swagger_auto_schema
 from rest_framework import status
-from rest_framework.generics import GenericAPIView
+from rest_framework.generics import GenericAPIView, RetrieveAPIView
 from rest_framework.parsers import FormParser, MultiPartParser
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework_simplejwt.authentication import JWTAuthentication
 
-from utils.responses.image import UPLOAD_SUCCESS
+from utils.exceptions import CustomAPIException
+from utils.responses.image import (
+    IMAGE_NOT_FOUND,
+    IMAGE_STATUS_SUCCESS,
+    UPLOAD_ACCEPTED,
+)
 
-from .serializers import ImageUploadSerializer
+from .models import Image
+from .querysets import accessible_images_filter
+from .serializers import ImageStatusSerializer, ImageUploadSerializer
 
 
 class ImageUploadView(GenericAPIView):
@@ -23,10 +30,14 @@ class ImageUploadView(GenericAPIView):
     @swagger_auto_schema(
         tags=["이미지"],
         operation_summary="이미지 업로드",
-        operation_description="이미지를 업로드하고 썸네일을 생성합니다.",
+        operation_description=(
+            "이미지 업로드를 접수하고 pending 상태의 이미지를 반환합니다. "
+            "WebP 변환과 업로드는 백그라운드 작업으로 처리되며, "
+            "images/{id}/status 로 처리 상태와 이미지 주소를 확인합니다."
+        ),
         request_body=ImageUploadSerializer,
         responses={
-            201: "업로드 성공",
+            202: "업로드 접수",
             400: "유효하지 않은 요청",
         },
     )
@@ -36,16 +47,13 @@ class ImageUploadView(GenericAPIView):
         )
         serializer.is_valid(raise_exception=True)
         images = serializer.save()
-        custom_response = UPLOAD_SUCCESS
-        custom_response["data"] = [
+        return Response(
             {
-                "image_url": image.image_url,
-                "thumbnail_url": image.get_thumbnail_url(),
-                "public_id": image.public_id,
-            }
-            for image in images
-        ]
-        return Response(custom_response, status=status.HTTP_201_CREATED)
+                **UPLOAD_ACCEPTED,
+                "data": ImageStatusSerializer(images, many=True).data,
+            },
+            status=status.HTTP_202_ACCEPTED,
+        )
 
     @swagger_auto_schema(
         tags=["이미지"],
@@ -71,3 +79,36 @@ class ImageUploadView(GenericAPIView):
             },
             status=status.HTTP_200_OK,
         )
+
+
+class ImageStatusView(RetrieveAPIView):
+    serializer_class = ImageStatusSerializer
+    permission_classes = [IsAuthenticated]
+    authentication_classes = [JWTAuthentication]
+    queryset = Image.objects.select_related("job")
+
+    def get_queryset(self):
+        if getattr(self, "swagger_fake_view", False):
+            return Image.objects.none()
+        # 본인이 업로드했거나 소유한 대상의 이미지만 조회 (그 외에는 404)
+        return (
+            super().get_queryset().filter(accessible_images_filter(self.request.user))
+        )
+
+    @swagger_auto_schema(
+        tags=["이미지"],
+        operation_summary="이미지 처리 상태 조회",
+        operation_description=(
+            "업로드한 이미지의 처리 상태(pending/processing/done/failed)와 주소를 조회합니다. "
+            "본인이 업로드했거나 소유한 대상(프로필, 게시물)의 이미지만 조회할 수 있습니다."
+        ),
+        responses={200: ImageStatusSerializer, 404: "이미지를 찾을 수 없습니다."},
+    )
+    def get(self, request, *args, **kwargs):
+        image = self.get_queryset().filter(pk=kwargs["pk"]).first()
+        if image is None:
+            raise CustomAPIException(IMAGE_NOT_FOUND)
+        return Response(
+            {**IMAGE_STATUS_SUCCESS, "data": self.get_serializer(image).data},
+            status=status.HTTP_200_OK,
+        )
@@ -0,0 +1,38 @@
+from django.contrib.contenttypes.models import ContentType
+
+from utils.pagination import CreatedAtCursorPagination
+
+from .models import Like
+from .serializers import LikerSerializer
+
+# 좋아요한 사용자 목록
+#
+# 인기 게시물은 좋아요가 수만 개이므로 like_status 에 전체 목록을 싣지 않고,
+# (content_type, object_id, -created_at) 인덱스를 타는 커서 페이지네이션으로
+# 최근 좋아요한 사용자부터 페이지 단위로 조회합니다.
+
+
+class LikerCursorPagination(CreatedAtCursorPagination):
+    """좋아요한 사용자 커서 페이지네이션 (최근 좋아요 순)"""
+
+    page_size = 20
+
+
+def paginate_likers(target, request, view=None):
+    """
+    대상에 좋아요한 사용자를 커서 페이지네이션한 응답을 반환합니다.
+
+    Args:
+        target (Model): 좋아요 대상 (Post, Comment 등)
+        request (Request): 요청 (cursor, page_size 쿼리 파라미터 사용)
+        view (APIView, optional): 요청을 처리하는 뷰
+
+    Returns:
+        Response: {"next", "previous", "results"} 응답
+    """
+    queryset = Like.objects.filter(
+        content_type=ContentType.objects.get_for_model(target), object_id=target.pk
+    ).select_related("user")
+    paginator = LikerCursorPagination()
+    page = paginator.paginate_queryset(queryset, request, view=view)
+    return paginator.get_paginated_response(LikerSerializer(page, many=True).data)
@@ -0,0 +1,83 @@
+# Generated by Django 5.2.18 on 2026-10-17 21:19
+
+from django.conf import settings
+from django.db import migrations, models, transaction
+from django.db.models import Count, F, Min
+
+BATCH_SIZE = 1000
+
+
+def remove_duplicate_likes(apps, schema_editor):
+    """
+    유니크 제약을 추가하기 전에 (content_type, object_id, user) 가 같은 중복 좋아요를
+    가장 먼저 만든 행만 남기고 삭제합니다. 삭제한 만큼 대상의 likes_count 도 줄입니다.
+    중복 묶음을 BATCH_SIZE 개씩 나눠 배치마다 커밋합니다.
+    """
+    Like = apps.get_model("like", "Like")
+    ContentType = apps.get_model("contenttypes", "ContentType")
+
+    duplicates = (
+        Like.objects.values("content_type_id", "object_id", "user_id")
+        .annotate(keep_id=Min("id"), total=Count("id"))
+        .filter(total__gt=1)
+        .order_by("keep_id")
+    )
+    last_keep_id = 0
+    while True:
+        groups = list(duplicates.filter(keep_id__gt=last_keep_id)[:BATCH_SIZE])
+        if not groups:
+            return
+        last_keep_id = groups[-1]["keep_id"]
+
+        with transaction.atomic():
+            for group in groups:
+                removed, _ = (
+                    Like.objects.filter(
+                        content_type_id=group["content_type_id"],
+                        object_id=group["object_id"],
+                        user_id=group["user_id"],
+                    )
+                    .exclude(id=group["keep_id"])
+                    .delete()
+                )
+                content_type = ContentType.objects.get(pk=group["content_type_id"])
+                try:
+                    model = apps.get_model(content_type.app_label, content_type.model)
+                except LookupError:
+                    continue
+                if "likes_count" in {field.name for field in model._meta.fields}:
+                    model.objects.filter(
+                        pk=group["object_id"], likes_count__gte=removed
+                    ).update(likes_count=F("likes_count") - removed)
+
+
+class Migration(migrations.Migration):
+
+    # 중복 제거를 배치 단위로 커밋하기 위해 마이그레이션 전체를 한 트랜잭션으로 묶지 않음
+    atomic = False
+
+    dependencies = [
+        ("comment", "0002_comment_likes_count"),
+        ("contenttypes", "0002_remove_content_type_name"),
+        ("like", "0001_initial"),
+        ("post", "0004_trending"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunPython(remove_duplicate_likes, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="like",
+            index=models.Index(
+                fields=["user", "content_type", "object_id"],
+                name="like_like_user_id_c1c775_idx",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="like",
+            constraint=models.UniqueConstraint(
+                fields=("content_type", "object_id", "user"),
+                name="like_unique_target_user",
+            ),
+        ),
+    ]
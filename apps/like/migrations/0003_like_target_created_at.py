@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-17 21:24
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("contenttypes", "0002_remove_content_type_name"),
+        ("like", "0002_like_unique_target_user"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="like",
+            index=models.Index(
+                fields=["content_type", "object_id", "-created_at"],
+                name="like_like_content_8489e0_idx",
+            ),
+        ),
+    ]
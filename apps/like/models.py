@@ -37,6 +37,19 @@ class Like(models.Model):
     class Meta:
         verbose_name = "좋아요"
         verbose_name_plural = "좋아요"
+        constraints = [
+            # 같은 대상에 한 사용자의 좋아요는 하나 (대상별 조회에도 사용되는 인덱스)
+            models.UniqueConstraint(
+                fields=["content_type", "object_id", "user"],
+                name="like_unique_target_user",
+            ),
+        ]
+        indexes = [
+            # 사용자가 좋아요한 대상 조회 (목록의 is_liked 일괄 조회 등)
+            models.Index(fields=["user", "content_type", "object_id"]),
+            # 대상별 좋아요한 사용자 목록 (최근 좋아요 순 커서 페이지네이션)
+            models.Index(fields=["content_type", "object_id", "-created_at"]),
+        ]
 
     def __str__(self):
         """좋아요의 문자열 표현을 반환합니다."""
@@ -10,3 +10,31 @@ class LikeSerializer(serializers.ModelSerializer):
         model = Like
         fields = ["id", "user", "post", "created_at"]
         read_only_fields = ["user", "created_at"]
+
+
+class LikeTargetSerializer(serializers.Serializer):
+    """좋아요 대상 (type, id)"""
+
+    type = serializers.ChoiceField(choices=["posts", "comments"])
+    id = serializers.IntegerField(min_value=1)
+
+
+class LikeBulkStatusSerializer(serializers.Serializer):
+    """좋아요 상태 일괄 조회 요청 Serializer"""
+
+    MAX_ITEMS = 100
+
+    items = LikeTargetSerializer(many=True, allow_empty=False, max_length=MAX_ITEMS)
+
+
+class LikerSerializer(serializers.ModelSerializer):
+    """좋아요한 사용자 Serializer"""
+
+    user_id = serializers.IntegerField(read_only=True)
+    nickname = serializers.CharField(source="user.nickname", read_only=True)
+    liked_at = serializers.DateTimeField(source="created_at", read_only=True)
+
+    class Meta:
+        model = Like
+        fields = ["user_id", "nickname", "liked_at"]
+        read_only_fields = fields
@@ -0,0 +1,47 @@
+from django.db.models import F
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import Signal, receiver
+from django.utils import timezone
+
+from .models import Like
+
+# toggle.add_like/remove_like 가 좋아요를 바꿨을 때
+# (sender=Like, content_type, object_id, user, liked)
+# ORM save/delete 를 거치지 않아 post_save/post_delete 가 발생하지 않으며,
+# 대상의 likes_count 는 이미 갱신된 상태입니다.
+like_toggled = Signal()
+
+
+def _target_queryset(like):
+    """
+    좋아요 대상 모델에 likes_count 컬럼이 있으면 (대상 행의 쿼리셋, 함께 갱신할 값) 을 반환합니다.
+    대상에 activity_at 컬럼이 있으면 같은 UPDATE 에서 활동 시각도 갱신합니다.
+    """
+    model_class = like.content_type.model_class()
+    if model_class is None:
+        return None, {}
+    field_names = {field.name for field in model_class._meta.concrete_fields}
+    if "likes_count" not in field_names:
+        return None, {}
+    extra = {"activity_at": timezone.now()} if "activity_at" in field_names else {}
+    return model_class._default_manager.filter(pk=like.object_id), extra
+
+
+@receiver(post_save, sender=Like)
+def increase_likes_count(sender, instance, created, **kwargs):
+    """좋아요가 생성되면 같은 트랜잭션 안에서 대상의 likes_count를 1 증가시킵니다."""
+    if not created:
+        return
+    queryset, extra = _target_queryset(instance)
+    if queryset is not None:
+        queryset.update(likes_count=F("likes_count") + 1, **extra)
+
+
+@receiver(post_delete, sender=Like)
+def decrease_likes_count(sender, instance, **kwargs):
+    """좋아요가 삭제되면 같은 트랜잭션 안에서 대상의 likes_count를 1 감소시킵니다."""
+    queryset, extra = _target_queryset(instance)
+    if queryset is not None:
+        queryset.filter(likes_count__gt=0).update(
+            likes_count=F("likes_count") - 1, **extra
+        )
@@ -1,3 +1,138 @@
+from django.contrib.auth import get_user_model
+from django.contrib.contenttypes.models import ContentType
+from django.db import IntegrityError, connection, transaction
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from apps.comment.models import Comment
+from apps.like.models import Like
+from apps.like.toggle import add_like, remove_like
+from apps.post.models import Post
+
+User = get_user_model()
+
+
+class LikeToggleTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            email="like@example.com",
+            password="password123",
+            name="Like User",
+            nickname="likeuser",
+        )
+        self.client.force_authenticate(user=self.user)
+        self.post = Post.objects.create(
+            title="좋아요", content="내용", author=self.user
+        )
+        self.comment = Comment.objects.create(
+            post=self.post, author=self.user, content="댓글"
+        )
+
+    def test_like_is_unique_per_user_and_target(self):
+        """같은 사용자가 같은 대상에 좋아요를 두 번 저장할 수 없는지 테스트"""
+        content_type = ContentType.objects.get_for_model(Post)
+        Like.objects.create(
+            user=self.user, content_type=content_type, object_id=self.post.id
+        )
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            Like.objects.create(
+                user=self.user, content_type=content_type, object_id=self.post.id
+            )
+
+    def test_toggle_is_idempotent_and_returns_count(self):
+        """좋아요 추가/취소를 반복해도 한 번만 반영되고 새 좋아요 수를 반환하는지 테스트"""
+        like_id, likes_count = add_like(self.comment, self.user)
+        self.assertIsNotNone(like_id)
+        self.assertEqual(likes_count, 1)
+        self.assertEqual(add_like(self.comment, self.user), (None, 1))
+        self.assertEqual(Like.objects.count(), 1)
+
+        self.assertEqual(remove_like(self.comment, self.user), (True, 0))
+        self.assertEqual(remove_like(self.comment, self.user), (False, 0))
+        self.comment.refresh_from_db()
+        self.assertEqual(self.comment.likes_count, 0)
+
+    def test_like_actions_return_likes_count(self):
+        """좋아요 API 응답에 갱신된 좋아요 수가 포함되는지 테스트"""
+        url = reverse("post-likes", kwargs={"pk": self.post.id})
+        response = self.client.post(url)
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data["likes_count"], 1)
+
+        response = self.client.post(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["likes_count"], 1)
+
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.likes_count, 1)
+
+    def test_bulk_like_status(self):
+        """여러 대상의 좋아요 여부/수를 대상 종류별 쿼리 한 번으로 조회하는지 테스트"""
+        other_post = Post.objects.create(title="다른", content="내용", author=self.user)
+        add_like(self.post, self.user)
+        add_like(self.comment, self.user)
+        url = reverse("like:like-status-bulk")
+        items = [
+            {"type": "posts", "id": self.post.id},
+            {"type": "posts", "id": other_post.id},
+            {"type": "comments", "id": self.comment.id},
+            {"type": "posts", "id": 999999},
+        ]
+
+        ContentType.objects.get_for_models(Post, Comment)
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.post(url, {"items": items}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(ctx.captured_queries), 2)
+        self.assertEqual(
+            [(row["liked"], row["likes_count"]) for row in response.data["data"]],
+            [(True, 1), (False, 0), (True, 1), (False, None)],
+        )
+
+        response = self.client.post(
+            url, {"items": [{"type": "users", "id": 1}]}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_likers_are_cursor_paginated(self):
+        """좋아요한 사용자 목록이 최근 좋아요 순으로 커서 페이지네이션되는지 테스트"""
+        users = [self.user] + [
+            User.objects.create_user(
+                email=f"liker{index}@example.com",
+                password="password123",
+                name=f"Liker {index}",
+                nickname=f"liker{index}",
+            )
+            for index in range(4)
+        ]
+        for user in users:
+            add_like(self.comment, user)
+        url = reverse(
+            "comment-likers", kwargs={"post_id": self.post.id, "pk": self.comment.id}
+        )
+
+        nicknames = []
+        next_url = url + "?page_size=2"
+        while next_url:
+            response = self.client.get(next_url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            nicknames += [row["nickname"] for row in response.data["results"]]
+            next_url = response.data["next"]
+        self.assertEqual(nicknames, [user.nickname for user in reversed(users)])
+
+        response = self.client.get(
+            reverse(
+                "comment-like-status",
+                kwargs={"post_id": self.post.id, "pk": self.comment.id},
+            )
+        )
+        self.assertEqual(response.data, {"is_liked": True, "likes_count": 5})
+
+
 # from django.contrib.auth import get_user_model
 # from django.urls import reverse
 # from rest_framework import status
@@ -0,0 +1,127 @@
+from django.contrib.contenttypes.models import ContentType
+from django.db import connection, transaction
+from django.utils import timezone
+
+from .models import Like
+from .signals import like_toggled
+
+# 좋아요 토글
+#
+# get_or_create 는 SELECT 후 INSERT 하므로 동시에 요청하면 중복 행이 생길 수 있습니다.
+# (content_type, object_id, user) 유니크 제약을 기준으로 INSERT ... ON CONFLICT DO NOTHING /
+# DELETE 한 문장으로 토글하고, 실제로 바뀐 경우에만 대상의 likes_count 를
+# UPDATE ... RETURNING 으로 갱신해 새 좋아요 수를 같은 왕복에서 돌려받습니다.
+# (PostgreSQL, SQLite 3.35+ 모두 지원하는 구문)
+#
+# ORM 의 save/delete 를 거치지 않으므로 Like 의 post_save/post_delete 시그널 대신
+# like_toggled 시그널을 보냅니다. (카운터는 여기서 직접 갱신)
+
+
+def add_like(target, user):
+    """
+    좋아요를 추가합니다. 이미 좋아요한 상태면 아무것도 바꾸지 않습니다.
+
+    Args:
+        target (Model): 좋아요 대상 (Post, Comment 등)
+        user (User): 좋아요를 누른 사용자
+
+    Returns:
+        tuple[int | None, int | None]: (새로 만든 좋아요 ID 또는 None, 대상의 좋아요 수)
+    """
+    content_type = ContentType.objects.get_for_model(target)
+    created_at = Like._meta.get_field("created_at").get_db_prep_value(
+        timezone.now(), connection
+    )
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(
+            f"INSERT INTO {_quote(Like._meta.db_table)}"
+            " (user_id, content_type_id, object_id, created_at)"
+            " VALUES (%s, %s, %s, %s)"
+            " ON CONFLICT (content_type_id, object_id, user_id) DO NOTHING"
+            " RETURNING id",
+            [user.pk, content_type.pk, target.pk, created_at],
+        )
+        row = cursor.fetchone()
+        like_id = row[0] if row else None
+        likes_count = _update_likes_count(cursor, target, 1 if like_id else 0)
+    if like_id:
+        _send_toggled(content_type, target, user, liked=True)
+    return like_id, likes_count
+
+
+def remove_like(target, user):
+    """
+    좋아요를 취소합니다. 좋아요하지 않은 상태면 아무것도 바꾸지 않습니다.
+
+    Args:
+        target (Model): 좋아요 대상 (Post, Comment 등)
+        user (User): 좋아요를 취소한 사용자
+
+    Returns:
+        tuple[bool, int | None]: (삭제 여부, 대상의 좋아요 수)
+    """
+    content_type = ContentType.objects.get_for_model(target)
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(
+            f"DELETE FROM {_quote(Like._meta.db_table)}"
+            " WHERE content_type_id = %s AND object_id = %s AND user_id = %s"
+            " RETURNING id",
+            [content_type.pk, target.pk, user.pk],
+        )
+        deleted = cursor.fetchone() is not None
+        likes_count = _update_likes_count(cursor, target, -1 if deleted else 0)
+    if deleted:
+        _send_toggled(content_type, target, user, liked=False)
+    return deleted, likes_count
+
+
+def _quote(name):
+    return connection.ops.quote_name(name)
+
+
+def _update_likes_count(cursor, target, delta):
+    """
+    대상의 likes_count 를 delta 만큼 바꾸고 새 값을 반환합니다.
+    대상에 likes_count 컬럼이 없으면 None, activity_at 컬럼이 있으면 함께 갱신합니다.
+    """
+    opts = target._meta
+    columns = {field.name: field.column for field in opts.concrete_fields}
+    if "likes_count" not in columns:
+        return None
+    table = _quote(opts.db_table)
+    likes_count = _quote(columns["likes_count"])
+    pk = _quote(opts.pk.column)
+
+    if delta == 0:
+        cursor.execute(
+            f"SELECT {likes_count} FROM {table} WHERE {pk} = %s", [target.pk]
+        )
+    else:
+        assignments = [f"{likes_count} = {likes_count} + %s"]
+        params = [delta]
+        if "activity_at" in columns:
+            assignments.append(f"{_quote(columns['activity_at'])} = %s")
+            params.append(
+                opts.get_field("activity_at").get_db_prep_value(
+                    timezone.now(), connection
+                )
+            )
+        # 감소할 때는 음수가 되지 않도록 0 보다 큰 경우에만 갱신 (시그널과 동일)
+        condition = f" AND {likes_count} > 0" if delta < 0 else ""
+        cursor.execute(
+            f"UPDATE {table} SET {', '.join(assignments)}"
+            f" WHERE {pk} = %s{condition} RETURNING {likes_count}",
+            params + [target.pk],
+        )
+    row = cursor.fetchone()
+    return row[0] if row else 0
+
+
+def _send_toggled(content_type, target, user, liked):
+    like_toggled.send(
+        sender=Like,
+        content_type=content_type,
+        object_id=target.pk,
+        user=user,
+        liked=liked,
+    )
@@ -1,6 +1,6 @@
 from django.urls import path
 
-from .views import LikeStatusView, LikeView
+from .views import LikeBulkStatusView, LikeStatusView, LikeView
 
 app_name = "like"
 
@@ -17,6 +17,12 @@ urlpatterns = [
         LikeView.as_view(),
         name="comment-likes",
     ),
+    # 좋아요 상태 일괄 조회
+    path(
+        "likes/status",
+        LikeBulkStatusView.as_view(),
+        name="like-status-bulk",
+    ),
     # 통합 좋아요 상태 조회
     path(
         "<str:type>/<int:id>/like-status",
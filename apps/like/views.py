@@ -1,4 +1,5 @@
 from django.contrib.contenttypes.models import ContentType
+from django.db.models import Exists, OuterRef
 from django.shortcuts import get_object_or_404
 from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
@@ -12,7 +13,8 @@ from apps.post.models import Post
 from utils.exceptions import CustomAPIException
 
 from .models import Like
-from .serializers import LikeSerializer
+from .serializers import LikeBulkStatusSerializer, LikeSerializer
+from .toggle import add_like, remove_like
 
 
 class LikeView(APIView):
@@ -36,19 +38,15 @@ class LikeView(APIView):
         # posts 또는 comments 구분
         if "posts" in request.path:
             target = get_object_or_404(Post, id=id)
-            content_type = ContentType.objects.get_for_model(Post)
         elif "comments" in request.path:
             target = get_object_or_404(Comment, id=id)
-            content_type = ContentType.objects.get_for_model(Comment)
         else:
             return Response(
                 {"code": 400, "message": "잘못된 요청입니다.", "data": None}, status=400
             )
 
-        like, created = Like.objects.get_or_create(
-            user=request.user, content_type=content_type, object_id=id
-        )
-        if not created:
+        like_id, likes_count = add_like(target, request.user)
+        if not like_id:
             return Response(
                 {
                     "code": 400,
@@ -58,7 +56,11 @@ class LikeView(APIView):
                 status=400,
             )
         return Response(
-            {"code": 201, "message": "좋아요 생성 성공.", "data": {"like_id": like.id}},
+            {
+                "code": 201,
+                "message": "좋아요 생성 성공.",
+                "data": {"like_id": like_id, "likes_count": likes_count},
+            },
             status=201,
         )
 
@@ -73,23 +75,21 @@ class LikeView(APIView):
         },
     )
     def delete(self, request, id):
+        # 대상은 조회하지 않고 pk 만으로 좋아요 삭제와 likes_count 갱신
         if "posts" in request.path:
-            content_type = ContentType.objects.get_for_model(Post)
+            target = Post(pk=id)
         elif "comments" in request.path:
-            content_type = ContentType.objects.get_for_model(Comment)
+            target = Comment(pk=id)
         else:
             return Response(
                 {"code": 400, "message": "잘못된 요청입니다.", "data": None}, status=400
             )
-        like = Like.objects.filter(
-            user=request.user, content_type=content_type, object_id=id
-        ).first()
-        if not like:
+        deleted, _ = remove_like(target, request.user)
+        if not deleted:
             return Response(
                 {"code": 404, "message": "좋아요를 찾을 수 없습니다.", "data": None},
                 status=404,
             )
-        like.delete()
         return Response(
             {"code": 204, "message": "좋아요 삭제 성공.", "data": None}, status=204
         )
@@ -168,3 +168,106 @@ class LikeStatusView(APIView):
                 },
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR,
             )
+
+
+class LikeBulkStatusView(APIView):
+    """좋아요 여부/좋아요 수 일괄 조회"""
+
+    permission_classes = [IsAuthenticated]
+    http_method_names = ["post"]
+
+    # 요청 type -> 좋아요 대상 모델
+    TARGET_MODELS = {"posts": Post, "comments": Comment}
+
+    @swagger_auto_schema(
+        operation_summary="좋아요 여부(상태) 일괄 조회",
+        operation_description=(
+            "게시글/댓글 목록의 좋아요 여부와 좋아요 수를 한 번에 반환합니다. "
+            f"한 번에 최대 {LikeBulkStatusSerializer.MAX_ITEMS}개까지 조회할 수 있으며, "
+            "존재하지 않거나 삭제된 대상은 likes_count 가 null 로 반환됩니다."
+        ),
+        tags=["좋아요"],
+        request_body=LikeBulkStatusSerializer,
+        responses={
+            200: openapi.Response(
+                description="좋아요 조회 성공.",
+                examples={
+                    "application/json": {
+                        "code": 200,
+                        "message": "좋아요 조회 성공.",
+                        "data": [
+                            {
+                                "type": "posts",
+                                "id": 1,
+                                "liked": True,
+                                "likes_count": 12,
+                            },
+                            {
+                                "type": "comments",
+                                "id": 3,
+                                "liked": False,
+                                "likes_count": 0,
+                            },
+                        ],
+                    }
+                },
+            ),
+            400: openapi.Response(
+                description="잘못된 요청입니다.",
+                examples={
+                    "application/json": {
+                        "code": 400,
+                        "message": "잘못된 요청입니다.",
+                        "data": {"items": ["이 필드는 필수 항목입니다."]},
+                    }
+                },
+            ),
+        },
+    )
+    def post(self, request):
+        serializer = LikeBulkStatusSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(
+                {
+                    "code": 400,
+                    "message": "잘못된 요청입니다.",
+                    "data": serializer.errors,
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        items = serializer.validated_data["items"]
+
+        # 대상 종류별로 좋아요 수(likes_count 컬럼)와 내 좋아요 여부(Exists)를 한 번에 조회
+        content_types = ContentType.objects.get_for_models(*self.TARGET_MODELS.values())
+        states = {}
+        for type_name, model in self.TARGET_MODELS.items():
+            ids = {item["id"] for item in items if item["type"] == type_name}
+            if not ids:
+                continue
+            is_liked = Exists(
+                Like.objects.filter(
+                    content_type=content_types[model],
+                    object_id=OuterRef("pk"),
+                    user=request.user,
+                )
+            )
+            rows = (
+                model._default_manager.filter(pk__in=ids, is_deleted=False)
+                .annotate(is_liked=is_liked)
+                .values_list("pk", "likes_count", "is_liked")
+            )
+            for pk, likes_count, liked in rows:
+                states[(type_name, pk)] = (liked, likes_count)
+
+        data = []
+        for item in items:
+            liked, likes_count = states.get((item["type"], item["id"]), (False, None))
+            data.append(
+                {
+                    "type": item["type"],
+                    "id": item["id"],
+                    "liked": liked,
+                    "likes_count": likes_count,
+                }
+            )
+        return Response({"code": 200, "message": "좋아요 조회 성공.", "data": data})
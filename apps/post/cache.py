@@ -0,0 +1,119 @@
+import hashlib
+
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+
+from apps.comment.models import Comment
+from apps.like.models import Like
+from utils.generation import CacheGeneration
+
+from .models import Post
+from .view_counter import view_counter
+
+# 게시물 목록/상세 응답 캐시
+#
+# 캐시 키에 "세대(generation)" 번호를 넣고, Post/Comment/Like 가 저장·삭제될 때마다
+# 세대 번호를 올려 이전 세대의 캐시를 한 번에 무효화합니다. (키를 일일이 지우지 않음)
+# 캐시에는 모든 사용자가 공유하는 본문만 저장하고, 사용자별 값(is_liked)과
+# 아직 반영되지 않은 조회수는 응답 직전에 덮어씁니다.
+
+generation = CacheGeneration(
+    "posts:response-cache:generation", "posts:response-cache:changed-at"
+)
+
+
+def get_generation():
+    return generation.get()
+
+
+def bump_generation():
+    """게시물 응답 캐시 세대를 올려 기존 캐시를 모두 무효화합니다."""
+    generation.bump()
+
+
+def get_changed_at():
+    """
+    마지막으로 세대가 바뀐 시각을 반환합니다.
+
+    좋아요/댓글 수, 조회수처럼 Post.updated_at 을 바꾸지 않는 변경도 포함하므로
+    Last-Modified 계산에 함께 사용합니다. 기록이 없으면 현재 시각.
+    """
+    return generation.changed_at()
+
+
+def make_key(action, request):
+    """세대 번호, 액션, 경로, 쿼리 파라미터로 캐시 키를 만듭니다."""
+    params = "&".join(
+        f"{name}={value}"
+        for name, values in sorted(request.query_params.lists())
+        for value in values
+    )
+    raw = f"{request.get_host()}|{request.path}|{params}"
+    digest = hashlib.md5(raw.encode()).hexdigest()
+    return f"posts:response-cache:{get_generation()}:{action}:{digest}"
+
+
+def get_cached(key):
+    return cache.get(key)
+
+
+def set_cached(key, data):
+    timeout = getattr(settings, "POST_RESPONSE_CACHE_TIMEOUT", 60)
+    cache.set(key, data, timeout=timeout)
+
+
+def overlay_user_fields(data, user):
+    """
+    공유 캐시 본문에 사용자별 값을 덮어씁니다.
+
+    - is_liked: 본문에 포함된 게시물들에 대해 Like 를 한 번만 조회
+      (상세 응답의 댓글/대댓글은 댓글 좋아요를 한 번 더 조회)
+    - views: 저장된 조회수 + 아직 반영되지 않은 증가분
+    """
+    if isinstance(data, dict) and isinstance(data.get("results"), list):
+        rows = data["results"]
+    elif isinstance(data, list):
+        rows = data
+    else:
+        rows = [data]
+    rows = [row for row in rows if isinstance(row, dict) and "id" in row]
+
+    liked_ids = set()
+    if user is not None and user.is_authenticated and rows:
+        liked_ids = set(
+            Like.objects.filter(
+                content_type=ContentType.objects.get_for_model(Post),
+                user=user,
+                object_id__in=[row["id"] for row in rows],
+            ).values_list("object_id", flat=True)
+        )
+
+    for row in rows:
+        if "is_liked" in row:
+            row["is_liked"] = row["id"] in liked_ids
+        if "views" in row:
+            row["views"] = row["views"] + view_counter.pending(row["id"])
+        if isinstance(row.get("comments"), list):
+            overlay_comment_likes(row["comments"], user)
+    return data
+
+
+def overlay_comment_likes(comments, user):
+    """공유 캐시 본문의 댓글/대댓글 is_liked 를 Like 한 번 조회로 덮어씁니다."""
+    rows = []
+    for comment in comments:
+        rows.append(comment)
+        rows.extend(comment.get("replies") or [])
+
+    liked_ids = set()
+    if user is not None and user.is_authenticated and rows:
+        liked_ids = set(
+            Like.objects.filter(
+                content_type=ContentType.objects.get_for_model(Comment),
+                user=user,
+                object_id__in=[row["id"] for row in rows],
+            ).values_list("object_id", flat=True)
+        )
+    for row in rows:
+        row["is_liked"] = row["id"] in liked_ids
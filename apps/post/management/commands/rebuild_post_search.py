@@ -0,0 +1,53 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from apps.post.models import Post
+from apps.post.search import build_search_document, index_post
+
+
+class Command(BaseCommand):
+    """
+    게시물 전문 검색 문서(search_document)를 다시 만듭니다.
+
+    queryset.update() 처럼 Post.save() 를 거치지 않고 제목/내용이 바뀐 경우에 실행합니다.
+    (기존 데이터는 검색 컬럼을 추가하는 마이그레이션에서 채움)
+
+    사용 예:
+        python manage.py rebuild_post_search --batch-size 500
+    """
+
+    help = "게시물 전문 검색 문서를 재생성합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="한 번에 처리할 행 수 (기본값: 1000)",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        total = 0
+        last_pk = 0
+        while True:
+            posts = list(
+                Post.objects.filter(pk__gt=last_pk)
+                .order_by("pk")
+                .only("pk", "title", "content", "search_document")[:batch_size]
+            )
+            if not posts:
+                break
+            last_pk = posts[-1].pk
+
+            for post in posts:
+                post.search_document = build_search_document(post.title, post.content)
+            with transaction.atomic():
+                Post.objects.bulk_update(posts, ["search_document"])
+                for post in posts:
+                    index_post(post)
+            total += len(posts)
+
+        self.stdout.write(
+            self.style.SUCCESS(f"게시물 {total}건의 검색 문서를 재생성했습니다.")
+        )
@@ -0,0 +1,86 @@
+from django.contrib.contenttypes.models import ContentType
+from django.core.management.base import BaseCommand
+from django.db.models import OuterRef
+
+from apps.comment.models import Comment
+from apps.like.models import Like
+from apps.post.models import Post
+from utils.counters import count_subquery, recount
+
+
+class Command(BaseCommand):
+    """
+    비정규화된 카운터(likes_count, comments_count)를 실제 데이터 기준으로 다시 계산합니다.
+
+    pk 순으로 batch-size 만큼 끊어 배치마다 UPDATE ... SET 카운터 = (SELECT COUNT(*) ...)
+    한 문장으로 처리하므로, 운영 중에 실행해도 그 사이의 좋아요/댓글 증감을 덮어쓰지 않고
+    대량의 데이터에서도 긴 락을 잡지 않습니다.
+    (기존 데이터는 카운터 컬럼을 추가하는 마이그레이션에서 같은 방식으로 채움)
+
+    사용 예:
+        python manage.py reconcile_counters
+        python manage.py reconcile_counters --batch-size 500 --dry-run
+    """
+
+    help = "게시물/댓글의 좋아요 수, 댓글 수 카운터를 재계산합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="한 번에 처리할 행 수 (기본값: 1000)",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="변경 사항을 저장하지 않고 어긋난 행 수만 출력합니다.",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        dry_run = options["dry_run"]
+
+        post_fixed = self.reconcile(
+            Post, ["likes_count", "comments_count"], batch_size, dry_run
+        )
+        comment_fixed = self.reconcile(Comment, ["likes_count"], batch_size, dry_run)
+
+        prefix = "[dry-run] " if dry_run else ""
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{prefix}게시물 {post_fixed}건, 댓글 {comment_fixed}건의 카운터를 보정했습니다."
+            )
+        )
+
+    def reconcile(self, model, fields, batch_size, dry_run):
+        """모델의 카운터를 batch_size 단위로 재계산하고 보정한 행 수를 반환합니다."""
+        counts = self.count_expressions(model, fields)
+        fixed = 0
+        last_pk = 0
+        while True:
+            pks = list(
+                model.objects.filter(pk__gt=last_pk)
+                .order_by("pk")
+                .values_list("pk", flat=True)[:batch_size]
+            )
+            if not pks:
+                return fixed
+            # 읽은 값을 되돌려 쓰지 않고 UPDATE 한 문장으로 다시 계산 (utils/counters.py)
+            batch = model.objects.filter(pk__gt=last_pk, pk__lte=pks[-1])
+            fixed += recount(batch, counts, dry_run=dry_run)
+            last_pk = pks[-1]
+
+    def count_expressions(self, model, fields):
+        """필드별 실제 개수를 구하는 상관 서브쿼리 식을 {필드명: 식} 형태로 반환합니다."""
+        counts = {}
+        if "likes_count" in fields:
+            content_type = ContentType.objects.get_for_model(model)
+            counts["likes_count"] = count_subquery(
+                Like.objects.filter(content_type=content_type, object_id=OuterRef("pk"))
+            )
+        if "comments_count" in fields:
+            counts["comments_count"] = count_subquery(
+                Comment.objects.filter(post_id=OuterRef("pk"), is_deleted=False)
+            )
+        return counts
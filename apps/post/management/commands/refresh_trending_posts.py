@@ -0,0 +1,61 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from apps.post.trending import refresh_trending
+
+
+class Command(BaseCommand):
+    """
+    인기 게시물 랭킹(TrendingPost)을 갱신합니다.
+
+    기본적으로 마지막 갱신 이후 활동(수정, 좋아요/댓글, 조회수 반영)이 있었던 게시물만
+    다시 계산합니다. 가중치나 감쇠 값을 바꾼 뒤에는 --full 로 전체를 다시 계산합니다.
+    posts/trending 조회는 랭킹 테이블만 읽으므로 --loop 로 계속 실행하거나
+    cron 등 스케줄러로 POST_TRENDING_REFRESH_INTERVAL 주기마다 실행해야 합니다.
+
+    사용 예:
+        python manage.py refresh_trending_posts
+        python manage.py refresh_trending_posts --full --batch-size 500
+        python manage.py refresh_trending_posts --loop    # 주기마다 계속 갱신
+    """
+
+    help = "인기 게시물 랭킹을 갱신합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--full",
+            action="store_true",
+            help="활동 여부와 관계없이 전체 게시물을 다시 계산합니다.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="한 번에 처리할 행 수 (기본값: 1000)",
+        )
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="종료하지 않고 --interval 초마다 계속 갱신합니다.",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=getattr(settings, "POST_TRENDING_REFRESH_INTERVAL", 60),
+            help="--loop 에서 갱신 간격(초) (기본값: POST_TRENDING_REFRESH_INTERVAL)",
+        )
+
+    def handle(self, *args, **options):
+        full = options["full"]
+        while True:
+            refreshed = refresh_trending(full=full, batch_size=options["batch_size"])
+            self.stdout.write(
+                self.style.SUCCESS(f"게시물 {refreshed}건의 인기 점수를 갱신했습니다.")
+            )
+            if not options["loop"]:
+                break
+            # 전체 재계산은 처음 한 번만
+            full = False
+            time.sleep(options["interval"])
@@ -0,0 +1,50 @@
+# Generated by Django 5.2.18 on 2026-10-17 20:45
+
+from django.db import migrations, models
+from django.db.models import OuterRef
+
+from utils.counters import count_subquery
+
+
+def backfill_counters(apps, schema_editor):
+    """기존 게시물의 좋아요 수/댓글 수를 채웁니다. (reconcile_counters 와 같은 계산)"""
+    Post = apps.get_model("post", "Post")
+    Comment = apps.get_model("comment", "Comment")
+    Like = apps.get_model("like", "Like")
+    ContentType = apps.get_model("contenttypes", "ContentType")
+    counts = {
+        "comments_count": count_subquery(
+            Comment.objects.filter(post_id=OuterRef("pk"), is_deleted=False)
+        )
+    }
+    # 컨텐츠 타입이 아직 없으면 좋아요도 없음
+    content_type = ContentType.objects.filter(app_label="post", model="post").first()
+    if content_type is not None:
+        counts["likes_count"] = count_subquery(
+            Like.objects.filter(content_type=content_type, object_id=OuterRef("pk"))
+        )
+    Post.objects.update(**counts)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("post", "0001_initial"),
+        ("comment", "0001_initial"),
+        ("like", "0001_initial"),
+        ("contenttypes", "0002_remove_content_type_name"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="post",
+            name="comments_count",
+            field=models.PositiveIntegerField(default=0, verbose_name="댓글 수"),
+        ),
+        migrations.AddField(
+            model_name="post",
+            name="likes_count",
+            field=models.PositiveIntegerField(default=0, verbose_name="좋아요 수"),
+        ),
+        migrations.RunPython(backfill_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,94 @@
+# Generated by Django 5.2.18 on 2026-10-17 21:05
+
+from django.db import OperationalError, migrations, models
+
+from apps.post.search import build_search_document
+
+
+def create_search_indexes(apps, schema_editor):
+    """검색용 인덱스를 DB 종류에 맞게 생성합니다. (apps/post/search.py 참고)"""
+    vendor = schema_editor.connection.vendor
+    if vendor == "postgresql":
+        schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        schema_editor.execute(
+            "CREATE INDEX IF NOT EXISTS post_search_document_gin ON post_post "
+            "USING gin (to_tsvector('simple', search_document))"
+        )
+        # PostFilter / SearchFilter 의 icontains(UPPER(...) LIKE UPPER(...)) 용 trigram 인덱스
+        for column in ("title", "content"):
+            schema_editor.execute(
+                f"CREATE INDEX IF NOT EXISTS post_{column}_trgm ON post_post "
+                f"USING gin (UPPER({column}::text) gin_trgm_ops)"
+            )
+    elif vendor == "sqlite":
+        try:
+            schema_editor.execute(
+                "CREATE VIRTUAL TABLE IF NOT EXISTS post_search USING fts5(document)"
+            )
+        except OperationalError:
+            # FTS5 가 없는 SQLite 빌드에서는 icontains 검색으로 동작
+            pass
+
+
+def backfill_search_documents(apps, schema_editor):
+    """
+    기존 게시물의 검색 문서를 채웁니다. (rebuild_post_search 와 같은 계산)
+    PostgreSQL 의 search_vector 는 마이그레이션 0005 에서 이 문서로 채웁니다.
+    """
+    Post = apps.get_model("post", "Post")
+    connection = schema_editor.connection
+    fts = (
+        connection.vendor == "sqlite"
+        and "post_search" in connection.introspection.table_names()
+    )
+    last_pk = 0
+    while True:
+        posts = list(
+            Post.objects.filter(pk__gt=last_pk)
+            .order_by("pk")
+            .only("pk", "title", "content")[:1000]
+        )
+        if not posts:
+            return
+        last_pk = posts[-1].pk
+        for post in posts:
+            post.search_document = build_search_document(post.title, post.content)
+        Post.objects.bulk_update(posts, ["search_document"])
+        if fts:
+            with connection.cursor() as cursor:
+                cursor.executemany(
+                    "INSERT OR REPLACE INTO post_search(rowid, document) VALUES (%s, %s)",
+                    [(post.pk, post.search_document) for post in posts],
+                )
+
+
+def drop_search_indexes(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == "postgresql":
+        for name in (
+            "post_search_document_gin",
+            "post_title_trgm",
+            "post_content_trgm",
+        ):
+            schema_editor.execute(f"DROP INDEX IF EXISTS {name}")
+    elif vendor == "sqlite":
+        schema_editor.execute("DROP TABLE IF EXISTS post_search")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("post", "0002_post_comments_count_post_likes_count"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="post",
+            name="search_document",
+            field=models.TextField(
+                blank=True, default="", editable=False, verbose_name="검색 문서"
+            ),
+        ),
+        migrations.RunPython(create_search_indexes, drop_search_indexes),
+        migrations.RunPython(backfill_search_documents, migrations.RunPython.noop),
+    ]
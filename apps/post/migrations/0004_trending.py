@@ -0,0 +1,51 @@
+# Generated by Django 5.2.18 on 2026-10-17 21:02
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("post", "0003_post_search"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="post",
+            name="activity_at",
+            field=models.DateTimeField(
+                auto_now=True, db_index=True, verbose_name="마지막 활동 시각"
+            ),
+        ),
+        migrations.CreateModel(
+            name="TrendingPost",
+            fields=[
+                (
+                    "post",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="trending",
+                        serialize=False,
+                        to="post.post",
+                        verbose_name="게시물",
+                    ),
+                ),
+                ("score", models.FloatField(verbose_name="인기 점수")),
+                ("refreshed_at", models.DateTimeField(verbose_name="계산 시각")),
+            ],
+            options={
+                "verbose_name": "인기 게시물",
+                "verbose_name_plural": "인기 게시물",
+                "indexes": [
+                    models.Index(
+                        fields=["-score"], name="post_trendi_score_251390_idx"
+                    ),
+                    models.Index(
+                        fields=["-refreshed_at"], name="post_trendi_refresh_9f2bca_idx"
+                    ),
+                ],
+            },
+        ),
+    ]
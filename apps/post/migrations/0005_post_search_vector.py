@@ -0,0 +1,73 @@
+# Generated by Django 5.2.18 on 2026-10-17 22:13
+
+import django.contrib.postgres.search
+from django.db import migrations
+
+
+def create_search_vector_trigger(apps, schema_editor):
+    """
+    PostgreSQL: search_vector 를 쓰기 시 갱신하는 트리거와 GIN 인덱스를 만듭니다.
+    (apps/post/search.py 참고, 그 외 DB 에서는 search_vector 를 사용하지 않음)
+
+    Django 의 save() 는 search_vector 를 NULL 로 함께 쓰므로, 문서가 바뀌었거나
+    값이 비어 있으면 다시 계산합니다. (조회수/좋아요 수 갱신에서는 다시 계산하지 않음)
+    """
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("""
+        CREATE OR REPLACE FUNCTION post_search_vector_update() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'INSERT'
+                OR NEW.search_vector IS NULL
+                OR NEW.search_document IS DISTINCT FROM OLD.search_document THEN
+                NEW.search_vector := to_tsvector('simple', NEW.search_document);
+            END IF;
+            RETURN NEW;
+        END
+        $$ LANGUAGE plpgsql
+        """)
+    schema_editor.execute(
+        "CREATE TRIGGER post_search_vector_update BEFORE INSERT OR UPDATE ON post_post "
+        "FOR EACH ROW EXECUTE FUNCTION post_search_vector_update()"
+    )
+    schema_editor.execute(
+        "UPDATE post_post SET search_vector = to_tsvector('simple', search_document)"
+    )
+    schema_editor.execute(
+        "CREATE INDEX IF NOT EXISTS post_search_vector_gin ON post_post "
+        "USING gin (search_vector)"
+    )
+    # 저장된 컬럼으로 검색하므로 식 인덱스는 더 이상 사용하지 않음
+    schema_editor.execute("DROP INDEX IF EXISTS post_search_document_gin")
+
+
+def drop_search_vector_trigger(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(
+        "CREATE INDEX IF NOT EXISTS post_search_document_gin ON post_post "
+        "USING gin (to_tsvector('simple', search_document))"
+    )
+    schema_editor.execute("DROP INDEX IF EXISTS post_search_vector_gin")
+    schema_editor.execute(
+        "DROP TRIGGER IF EXISTS post_search_vector_update ON post_post"
+    )
+    schema_editor.execute("DROP FUNCTION IF EXISTS post_search_vector_update()")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("post", "0004_trending"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="post",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False, null=True, verbose_name="검색 벡터"
+            ),
+        ),
+        migrations.RunPython(create_search_vector_trigger, drop_search_vector_trigger),
+    ]
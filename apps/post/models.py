@@ -4,6 +4,7 @@ import requests
 from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.contrib.contenttypes.fields import GenericRelation
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
@@ -12,6 +13,9 @@ from apps.image.models import Image
 from apps.like.models import Like
 from apps.user.models import User
 
+from .search import build_search_document, index_post
+from .view_counter import view_counter
+
 ## from utils.models import Image  # 임시 주석처리: image 앱 도입 전까지
 
 
@@ -29,6 +33,11 @@ class Post(models.Model):
         created_at (datetime): 생성 시간
         updated_at (datetime): 수정 시간
         views (int): 조회수
+        likes_count (int): 좋아요 수 (Like 생성/삭제 시 함께 갱신되는 비정규화 값)
+        comments_count (int): 삭제되지 않은 댓글 수 (비정규화 값)
+        activity_at (datetime): 마지막 활동 시각 (수정, 좋아요/댓글, 조회수 반영 시 갱신)
+        search_document (str): 전문 검색용 bigram 토큰 문서 (제목/내용에서 자동 생성)
+        search_vector (tsvector): search_document 의 tsvector (PostgreSQL 트리거가 쓰기 시 갱신)
         author (User): 작성자
         is_deleted (bool): 삭제 여부
         deleted_at (datetime): 삭제 시간
@@ -48,6 +57,11 @@ class Post(models.Model):
     created_at = models.DateTimeField(auto_now_add=True, verbose_name=_("생성일"))
     updated_at = models.DateTimeField(auto_now=True, verbose_name=_("수정일"))
     views = models.PositiveIntegerField(default=0, verbose_name=_("조회수"))
+    likes_count = models.PositiveIntegerField(default=0, verbose_name=_("좋아요 수"))
+    comments_count = models.PositiveIntegerField(default=0, verbose_name=_("댓글 수"))
+    activity_at = models.DateTimeField(
+        auto_now=True, db_index=True, verbose_name=_("마지막 활동 시각")
+    )
     is_deleted = models.BooleanField(default=False, verbose_name=_("삭제여부"))
     deleted_at = models.DateTimeField(null=True, blank=True)
     deleted_by = models.ForeignKey(
@@ -57,12 +71,29 @@ class Post(models.Model):
         blank=True,
         related_name="deleted_posts",
     )
+    search_document = models.TextField(
+        blank=True, default="", editable=False, verbose_name=_("검색 문서")
+    )
+    # PostgreSQL 에서만 채워짐 (마이그레이션 0005 의 트리거, 그 외 DB 에서는 NULL)
+    search_vector = SearchVectorField(
+        null=True, editable=False, verbose_name=_("검색 벡터")
+    )
     likes = GenericRelation(
         Like, related_query_name="post_likes", verbose_name="좋아요"
     )
 
     def save(self, *args, **kwargs):
+        update_fields = kwargs.get("update_fields")
+        search_changed = update_fields is None or bool(
+            {"title", "content"} & set(update_fields)
+        )
+        if search_changed:
+            self.search_document = build_search_document(self.title, self.content)
+            if update_fields is not None:
+                kwargs["update_fields"] = {*update_fields, "search_document"}
         super().save(*args, **kwargs)
+        if search_changed:
+            index_post(self)
 
     class Meta:
         verbose_name = _("게시물")
@@ -78,9 +109,17 @@ class Post(models.Model):
         return f"{self.author.nickname}의 게시물: {self.title}"
 
     def increase_views(self):
-        """조회수를 1 증가시킵니다."""
-        self.views += 1
-        self.save(update_fields=["views"])
+        """
+        조회수를 1 증가시킵니다.
+
+        바로 UPDATE 하지 않고 view_counter 버퍼에 쌓은 뒤 주기적으로 일괄 반영합니다.
+        """
+        view_counter.record(self.pk)
+
+    @property
+    def current_views(self):
+        """DB에 저장된 조회수 + 아직 반영되지 않은 증가분"""
+        return self.views + view_counter.pending(self.pk)
 
     def soft_delete(self, user):
         """
@@ -105,3 +144,39 @@ class Post(models.Model):
         self.is_deleted = True
         self.deleted_at = timezone.now()
         self.save()
+
+
+class TrendingPost(models.Model):
+    """
+    인기 게시물 랭킹
+
+    조회수/좋아요/댓글 수와 작성 시각으로 계산한 점수를 저장합니다.
+    refresh_trending_posts 가 마지막 실행 이후 활동이 있는 게시물만 다시 계산합니다.
+    (apps/post/trending.py)
+
+    Attributes:
+        post (Post): 게시물
+        score (float): 인기 점수 (높을수록 인기)
+        refreshed_at (datetime): 점수를 계산한 시각
+    """
+
+    post = models.OneToOneField(
+        Post,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="trending",
+        verbose_name=_("게시물"),
+    )
+    score = models.FloatField(verbose_name=_("인기 점수"))
+    refreshed_at = models.DateTimeField(verbose_name=_("계산 시각"))
+
+    class Meta:
+        verbose_name = _("인기 게시물")
+        verbose_name_plural = _("인기 게시물")
+        indexes = [
+            models.Index(fields=["-score"]),
+            models.Index(fields=["-refreshed_at"]),
+        ]
+
+    def __str__(self):
+        return f"{self.post_id}: {self.score:.4f}"
@@ -0,0 +1,96 @@
+from django.contrib.contenttypes.models import ContentType
+from django.db.models import BooleanField, Count, Exists, OuterRef, Prefetch, Q, Value
+
+from apps.comment.models import Comment
+from apps.comment.threads import REPLY_PREVIEW_SIZE
+from apps.image.models import Image
+from apps.like.models import Like
+
+from .models import Post
+
+
+def with_feed_data(queryset, user, comment_preview=None):
+    """
+    게시물 목록/상세 렌더링에 필요한 데이터를 한 번에 불러오도록 쿼리셋을 구성합니다.
+
+    - 작성자: select_related 로 JOIN
+    - 내 좋아요 여부(is_liked): annotate (좋아요 수는 Post.likes_count 컬럼 사용)
+    - 대표 이미지(prefetched_images): prefetch
+    - 댓글: comment_preview 가 없으면 최상위 댓글 전체와 대댓글 수/앞쪽 대댓글
+      (top_level_comments),
+      있으면 게시물별 최신 댓글 N개(comment_preview)만 prefetch
+
+    페이지 크기와 관계없이 고정된 개수의 쿼리로 시리얼라이즈할 수 있습니다.
+
+    Args:
+        queryset (QuerySet): Post 쿼리셋
+        user (User): 요청 사용자 (AnonymousUser 가능)
+        comment_preview (int, optional): 게시물별로 미리 불러올 최신 댓글 수
+    """
+    content_type = ContentType.objects.get_for_model(Post)
+
+    if user is not None and user.is_authenticated:
+        is_liked = Exists(
+            Like.objects.filter(
+                content_type=content_type, object_id=OuterRef("pk"), user=user
+            )
+        )
+    else:
+        is_liked = Value(False, output_field=BooleanField())
+
+    if comment_preview is None:
+        # 대댓글은 댓글별 대댓글 수와 앞쪽 REPLY_PREVIEW_SIZE 개만 포함
+        replies = Comment.objects.filter(is_deleted=False).select_related("author")
+        top_level_comments = (
+            Comment.objects.filter(parent=None, is_deleted=False)
+            .select_related("author")
+            .annotate(
+                prefetched_replies_count=Count(
+                    "child_comments", filter=Q(child_comments__is_deleted=False)
+                )
+            )
+            .prefetch_related(
+                Prefetch(
+                    "child_comments",
+                    queryset=replies.order_by("created_at", "id")[:REPLY_PREVIEW_SIZE],
+                    to_attr="prefetched_replies",
+                )
+            )
+        )
+        comments = Prefetch(
+            "comments",
+            queryset=top_level_comments.order_by("created_at"),
+            to_attr="top_level_comments",
+        )
+    elif comment_preview <= 0:
+        comments = None
+    else:
+        # 슬라이스된 Prefetch 는 ROW_NUMBER() 윈도 함수 한 번으로 게시물별 N개를 가져옴
+        latest_comments = (
+            Comment.objects.filter(parent=None, is_deleted=False)
+            .select_related("author")
+            .order_by("-created_at", "-id")
+        )
+        comments = Prefetch(
+            "comments",
+            queryset=latest_comments[:comment_preview],
+            to_attr="comment_preview",
+        )
+
+    prefetches = [
+        Prefetch(
+            "image",
+            queryset=Image.objects.filter(status=Image.Status.DONE).order_by(
+                "-uploaded_at"
+            ),
+            to_attr="prefetched_images",
+        )
+    ]
+    if comments is not None:
+        prefetches.append(comments)
+
+    return (
+        queryset.select_related("author")
+        .annotate(is_liked=is_liked)
+        .prefetch_related(*prefetches)
+    )
@@ -0,0 +1,136 @@
+import re
+
+from django.db import connection
+from django.db.models import BooleanField, FloatField, Q
+from django.db.models.expressions import RawSQL
+
+# 게시물 전문 검색
+#
+# 한국어는 조사가 붙거나("아이브가") 띄어쓰기 없이 이어 쓰는 경우가 많아 단어 단위
+# 토큰으로는 검색이 잘 되지 않습니다. 그래서 제목/내용을 2글자 단위(bigram)로 잘라
+# Post.search_document 에 저장하고, 검색어도 같은 방식으로 잘라 모든 토큰이 포함된
+# 게시물을 찾습니다.
+#
+# - PostgreSQL: 저장된 tsvector 컬럼(search_vector) GIN 인덱스 + ts_rank
+#   search_vector 는 쓰기 시 트리거가 to_tsvector('simple', search_document) 로 갱신
+#   (마이그레이션 0005, 조회할 때마다 to_tsvector 를 다시 계산하지 않음)
+# - SQLite: FTS5 가상 테이블(post_search) + bm25 (로컬 실행용)
+#   게시물을 저장하면 index_post, 삭제하면 unindex_post 로 반영
+# - 그 외/검색어가 1글자인 경우: title, content icontains
+
+SQLITE_FTS_TABLE = "post_search"
+
+_WORD_RE = re.compile(r"\w+")
+
+
+def tokenize(text):
+    """텍스트를 소문자 bigram 토큰 목록으로 변환합니다. 1글자 단어는 그대로 둡니다."""
+    tokens = []
+    for word in _WORD_RE.findall((text or "").lower()):
+        if len(word) == 1:
+            tokens.append(word)
+        else:
+            tokens.extend(word[i : i + 2] for i in range(len(word) - 1))
+    return tokens
+
+
+def build_search_document(*texts):
+    """검색 인덱스에 저장할 문서를 만듭니다."""
+    return " ".join(token for text in texts for token in tokenize(text))
+
+
+def _query_tokens(query):
+    """검색어 토큰을 반환합니다. bigram 으로 찾을 수 없는 1글자 단어가 있으면 None."""
+    words = _WORD_RE.findall((query or "").lower())
+    if not words or any(len(word) == 1 for word in words):
+        return None
+    return list(dict.fromkeys(tokenize(query)))
+
+
+def _column(model, name):
+    quote = connection.ops.quote_name
+    return f"{quote(model._meta.db_table)}.{quote(name)}"
+
+
+_sqlite_fts_available = None
+
+
+def sqlite_fts_available():
+    """SQLite FTS5 검색 테이블이 있는지 확인합니다. (프로세스당 한 번)"""
+    global _sqlite_fts_available
+    if _sqlite_fts_available is None:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = %s",
+                [SQLITE_FTS_TABLE],
+            )
+            _sqlite_fts_available = cursor.fetchone() is not None
+    return _sqlite_fts_available
+
+
+def search_posts(queryset, query):
+    """
+    게시물 쿼리셋을 검색어로 필터링하고 관련도(search_rank) 높은 순으로 정렬합니다.
+
+    Args:
+        queryset (QuerySet): Post 쿼리셋
+        query (str): 검색어 (제목/내용 대상)
+    """
+    tokens = _query_tokens(query)
+    vendor = connection.vendor
+
+    if tokens and vendor == "postgresql":
+        document = _column(queryset.model, "search_vector")
+        tsquery = "plainto_tsquery('simple', %s)"
+        params = (" ".join(tokens),)
+        queryset = queryset.filter(
+            RawSQL(f"{document} @@ {tsquery}", params, output_field=BooleanField())
+        ).annotate(
+            search_rank=RawSQL(
+                f"ts_rank({document}, {tsquery})", params, output_field=FloatField()
+            )
+        )
+    elif tokens and vendor == "sqlite" and sqlite_fts_available():
+        match = " ".join(f'"{token}"' for token in tokens)
+        pk = _column(queryset.model, "id")
+        queryset = queryset.filter(
+            RawSQL(
+                f"{pk} IN (SELECT rowid FROM {SQLITE_FTS_TABLE} "
+                f"WHERE {SQLITE_FTS_TABLE} MATCH %s)",
+                (match,),
+                output_field=BooleanField(),
+            )
+        ).annotate(
+            # bm25 는 관련도가 높을수록 작은 값이므로 부호를 바꿔 사용
+            search_rank=RawSQL(
+                f"SELECT -bm25({SQLITE_FTS_TABLE}) FROM {SQLITE_FTS_TABLE} "
+                f"WHERE {SQLITE_FTS_TABLE} MATCH %s AND rowid = {pk}",
+                (match,),
+                output_field=FloatField(),
+            )
+        )
+    else:
+        return queryset.filter(
+            Q(title__icontains=query) | Q(content__icontains=query)
+        ).order_by("-created_at")
+
+    return queryset.order_by("-search_rank", "-created_at")
+
+
+def index_post(post):
+    """SQLite FTS5 테이블에 게시물 문서를 반영합니다. PostgreSQL 은 인덱스가 자동 갱신됩니다."""
+    if connection.vendor != "sqlite" or not sqlite_fts_available():
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"INSERT OR REPLACE INTO {SQLITE_FTS_TABLE}(rowid, document) VALUES (%s, %s)",
+            [post.pk, post.search_document],
+        )
+
+
+def unindex_post(pk):
+    """SQLite FTS5 테이블에서 삭제된 게시물 문서를 지웁니다."""
+    if connection.vendor != "sqlite" or not sqlite_fts_available():
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {SQLITE_FTS_TABLE} WHERE rowid = %s", [pk])
@@ -1,5 +1,6 @@
 from rest_framework import serializers
 
+from apps.image.models import Image
 from apps.post.models import Post
 
 
@@ -12,9 +13,9 @@ class PostSerializer(serializers.ModelSerializer):
 
     author = serializers.CharField(source="author.nickname", read_only=True)
     comments = serializers.SerializerMethodField()
-    likes_count = serializers.SerializerMethodField()
     is_liked = serializers.SerializerMethodField()
     image_url = serializers.SerializerMethodField()
+    views = serializers.IntegerField(source="current_views", read_only=True)
 
     class Meta:
         model = Post
@@ -29,6 +30,7 @@ class PostSerializer(serializers.ModelSerializer):
             "views",
             "comments",
             "likes_count",
+            "comments_count",
             "is_liked",
             "is_deleted",
         ]
@@ -39,16 +41,24 @@ class PostSerializer(serializers.ModelSerializer):
             "updated_at",
             "views",
             "likes_count",
+            "comments_count",
             "is_liked",
             "is_deleted",
         ]
 
-    def get_likes_count(self, obj):
-        """좋아요 수를 반환합니다."""
-        return obj.likes.count()
+    def to_representation(self, instance):
+        data = super().to_representation(instance)
+        if self.context.get("shared_cache"):
+            # 응답 캐시에 저장할 공유 본문: 사용자별 값/미반영 조회수는 응답 직전에 덮어씀
+            data["views"] = instance.views
+            data["is_liked"] = False
+        return data
 
     def get_is_liked(self, obj):
         """현재 사용자가 좋아요를 눌렀는지 여부를 반환합니다."""
+        # with_feed_data 로 annotate 된 값이 있으면 추가 쿼리 없이 사용
+        if hasattr(obj, "is_liked"):
+            return obj.is_liked
         request = self.context.get("request")
         if request and request.user.is_authenticated:
             return obj.likes.filter(user=request.user).exists()
@@ -57,19 +67,66 @@ class PostSerializer(serializers.ModelSerializer):
     def get_comments(self, obj):
         """댓글 목록을 반환합니다."""
         from apps.comment.serializers import CommentSerializer
-
-        comments = obj.comments.filter(parent=None, is_deleted=False).order_by(
-            "created_at"
-        )
+        from apps.comment.threads import attach_like_state
+
+        if hasattr(obj, "top_level_comments"):
+            comments = obj.top_level_comments
+        else:
+            comments = obj.comments.filter(parent=None, is_deleted=False).order_by(
+                "created_at"
+            )
+        # 공유 캐시에 저장될 응답이면 사용자별 좋아요 여부는 캐시 조회 시 덮어씀
+        request = self.context.get("request")
+        if request is not None and not self.context.get("shared_cache"):
+            comments = attach_like_state(list(comments), request.user)
         return CommentSerializer(comments, many=True, context=self.context).data
 
     def get_image_url(self, obj):
-        post_image = obj.image.first()
+        if hasattr(obj, "prefetched_images"):
+            post_image = obj.prefetched_images[0] if obj.prefetched_images else None
+        else:
+            post_image = obj.image.filter(status=Image.Status.DONE).first()
         if post_image and hasattr(post_image, "image_url") and post_image.image_url:
             return post_image.image_url
         return None
 
 
+class PostCardSerializer(PostSerializer):
+    """
+    게시물 목록/검색용 카드 시리얼라이저
+
+    댓글 트리 대신 카운터와 최신 댓글 미리보기(comment_preview)만 포함합니다.
+    전체 댓글은 게시물 상세 조회나 댓글 API 로 조회합니다.
+    """
+
+    comments = None
+    comment_preview = serializers.SerializerMethodField()
+
+    class Meta(PostSerializer.Meta):
+        fields = [
+            "id",
+            "author",
+            "title",
+            "content",
+            "image_url",
+            "created_at",
+            "updated_at",
+            "views",
+            "likes_count",
+            "comments_count",
+            "is_liked",
+            "is_deleted",
+            "comment_preview",
+        ]
+
+    def get_comment_preview(self, obj):
+        """최신 댓글 미리보기를 반환합니다. (with_feed_data 의 comment_preview 사용)"""
+        from apps.comment.serializers import CommentPreviewSerializer
+
+        comments = getattr(obj, "comment_preview", [])
+        return CommentPreviewSerializer(comments, many=True, context=self.context).data
+
+
 class PostCreateSerializer(serializers.ModelSerializer):
     """
     게시물 생성 시리얼라이저
@@ -0,0 +1,44 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.comment.models import Comment
+from apps.image.signals import image_processed
+from apps.like.models import Like
+from apps.like.signals import like_toggled
+
+from .cache import bump_generation
+from .models import Post
+from .search import unindex_post
+
+
+@receiver(post_save, sender=Post)
+@receiver(post_delete, sender=Post)
+@receiver(post_save, sender=Comment)
+@receiver(post_delete, sender=Comment)
+@receiver(post_save, sender=Like)
+@receiver(post_delete, sender=Like)
+@receiver(like_toggled, sender=Like)
+def invalidate_post_response_cache(sender, **kwargs):
+    """
+    게시물/댓글/좋아요가 바뀌면 게시물 응답 캐시 세대를 올립니다.
+    (soft_delete/restore 도 save 를 거치므로 함께 처리됨)
+
+    커밋 전에 다른 요청이 이전 데이터를 새 세대로 캐시할 수 있으므로
+    커밋 후에 한 번 더 올립니다.
+    """
+    bump_generation()
+    transaction.on_commit(bump_generation)
+
+
+@receiver(post_delete, sender=Post)
+def unindex_deleted_post(sender, instance, **kwargs):
+    """삭제된 게시물을 SQLite 검색 테이블에서 지웁니다. (PostgreSQL 은 행과 함께 삭제됨)"""
+    unindex_post(instance.pk)
+
+
+@receiver(image_processed)
+def invalidate_post_response_cache_on_image(sender, instance, **kwargs):
+    """게시물 이미지 처리가 끝나면 image_url 이 보이도록 게시물 응답 캐시를 무효화합니다."""
+    if instance.content_type.model_class() is Post:
+        bump_generation()
@@ -1,23 +1,38 @@
+import importlib
 import io
 import os
+from types import SimpleNamespace
+from unittest import mock
 
+from django.apps import apps
 from django.contrib.auth import get_user_model
 from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
 from django.core.files.uploadedfile import SimpleUploadedFile
-from django.test import TestCase
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from PIL import Image
 from rest_framework import status
 from rest_framework.test import APIClient
 
+from apps.comment.models import Comment
 from apps.image.models import Image as ImageModel
 from apps.like.models import Like
 
-from .models import Post
+from . import cache as response_cache
+from .models import Post, TrendingPost
+from .search import SQLITE_FTS_TABLE
+from .trending import refresh_trending
+from .view_counter import view_counter
 
 User = get_user_model()
 
 
+# 조회수 반영 타이머 스레드는 테스트 트랜잭션 밖의 연결을 쓰므로 끄고 필요한 테스트에서만 확인
+@override_settings(POST_VIEWS_FLUSH_IN_BACKGROUND=False)
 class PostTests(TestCase):
     def setUp(self):
         """테스트를 위한 기본 설정"""
@@ -51,6 +66,10 @@ class PostTests(TestCase):
         # ContentType 설정
         self.post_content_type = ContentType.objects.get_for_model(Post)
 
+        # 다른 테스트에서 쌓인 조회수 버퍼/응답 캐시 초기화
+        view_counter.clear()
+        cache.clear()
+
     def create_test_image(self):
         """테스트용 이미지 파일을 생성합니다."""
         file = io.BytesIO()
@@ -218,5 +237,462 @@ class PostTests(TestCase):
         url = reverse("post-detail", kwargs={"pk": self.post.id})
         response = self.client.get(url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["views"], initial_views + 1)
+        view_counter.flush()
         self.post.refresh_from_db()
         self.assertEqual(self.post.views, initial_views + 1)
+
+    def _count_list_queries(self):
+        url = reverse("post-list")
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(url, {"page_size": 100})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return len(ctx.captured_queries)
+
+    def _create_feed_post(self, index):
+        post = Post.objects.create(
+            title=f"피드 {index}", content="내용", author=self.other_user
+        )
+        Like.objects.create(
+            content_type=self.post_content_type, object_id=post.id, user=self.user
+        )
+        ImageModel.objects.create(
+            image_url=f"http://example.com/{index}.webp",
+            content_type=self.post_content_type,
+            object_id=post.id,
+        )
+        comment = Comment.objects.create(post=post, author=self.user, content="댓글")
+        Comment.objects.create(
+            post=post, author=self.other_user, content="대댓글", parent=comment
+        )
+        return post
+
+    def test_list_posts_constant_queries(self):
+        """게시물 목록 조회 쿼리 수가 페이지 크기와 무관한지 테스트"""
+        for index in range(2):
+            self._create_feed_post(index)
+        small_page = self._count_list_queries()
+
+        for index in range(2, 12):
+            self._create_feed_post(index)
+        large_page = self._count_list_queries()
+
+        self.assertEqual(small_page, large_page)
+
+    def test_list_posts_feed_fields(self):
+        """목록 응답이 annotate 된 좋아요/이미지/댓글 정보를 포함하는지 테스트"""
+        post = self._create_feed_post(0)
+        response = self.client.get(reverse("post-list"))
+        item = next(row for row in response.data["results"] if row["id"] == post.id)
+        self.assertEqual(item["likes_count"], 1)
+        self.assertTrue(item["is_liked"])
+        self.assertEqual(item["author"], self.other_user.nickname)
+        self.assertEqual(item["image_url"], "http://example.com/0.webp")
+        self.assertEqual(item["comments_count"], 2)
+        self.assertNotIn("comments", item)
+        self.assertEqual(len(item["comment_preview"]), 1)
+
+    def test_list_posts_comment_preview_size(self):
+        """목록의 댓글 미리보기가 최신 N개만 포함하는지 테스트"""
+        comments = [
+            Comment.objects.create(post=self.post, author=self.user, content=f"{i}")
+            for i in range(5)
+        ]
+        response = self.client.get(reverse("post-list"), {"comment_preview": 2})
+        item = response.data["results"][0]
+        self.assertEqual(
+            [row["id"] for row in item["comment_preview"]],
+            [comments[4].id, comments[3].id],
+        )
+
+        response = self.client.get(reverse("post-list"), {"comment_preview": 0})
+        self.assertEqual(response.data["results"][0]["comment_preview"], [])
+
+    def test_retrieve_post_includes_comment_tree(self):
+        """상세 조회는 댓글/대댓글 전체 트리를 포함하는지 테스트"""
+        comment = Comment.objects.create(
+            post=self.post, author=self.user, content="댓글"
+        )
+        Comment.objects.create(
+            post=self.post, author=self.other_user, content="대댓글", parent=comment
+        )
+        response = self.client.get(reverse("post-detail", kwargs={"pk": self.post.id}))
+        self.assertEqual(len(response.data["comments"]), 1)
+        self.assertEqual(len(response.data["comments"][0]["replies"]), 1)
+
+    def test_like_updates_likes_count(self):
+        """좋아요/취소 시 likes_count 컬럼이 함께 갱신되는지 테스트"""
+        url = reverse("post-likes", kwargs={"pk": self.post.id})
+        self.client.post(url)
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.likes_count, 1)
+
+        self.client.delete(url)
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.likes_count, 0)
+
+    def test_comment_updates_comments_count(self):
+        """댓글 생성/소프트 삭제 시 comments_count 컬럼이 함께 갱신되는지 테스트"""
+        comment = Comment.objects.create(
+            post=self.post, author=self.user, content="댓글"
+        )
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.comments_count, 1)
+
+        comment.soft_delete(self.user)
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.comments_count, 0)
+
+    def test_reconcile_counters_command(self):
+        """reconcile_counters 명령이 어긋난 카운터를 보정하는지 테스트"""
+        Like.objects.create(
+            content_type=self.post_content_type, object_id=self.post.id, user=self.user
+        )
+        Comment.objects.create(post=self.post, author=self.user, content="댓글")
+        Post.objects.filter(pk=self.post.pk).update(likes_count=7, comments_count=0)
+
+        out = io.StringIO()
+        call_command("reconcile_counters", batch_size=1, dry_run=True, stdout=out)
+        self.assertIn("게시물 1건", out.getvalue())
+        self.assertEqual(Post.objects.get(pk=self.post.pk).likes_count, 7)
+
+        with CaptureQueriesContext(connection) as queries:
+            call_command("reconcile_counters", batch_size=1, stdout=io.StringIO())
+        # 읽은 값을 되돌려 쓰지 않고 UPDATE 문 안에서 다시 계산
+        updates = [q["sql"] for q in queries if q["sql"].startswith("UPDATE")]
+        self.assertTrue(updates)
+        self.assertTrue(all("COUNT(" in sql for sql in updates))
+
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.likes_count, 1)
+        self.assertEqual(self.post.comments_count, 1)
+
+    def test_counter_migration_backfills_existing_rows(self):
+        """카운터 컬럼 마이그레이션이 기존 게시물/댓글의 카운터를 채우는지 테스트"""
+        comment = Comment.objects.create(
+            post=self.post, author=self.user, content="댓글"
+        )
+        Like.objects.create(
+            content_type=self.post_content_type, object_id=self.post.id, user=self.user
+        )
+        Like.objects.create(
+            content_type=ContentType.objects.get_for_model(Comment),
+            object_id=comment.id,
+            user=self.user,
+        )
+        Post.objects.update(likes_count=0, comments_count=0)
+        Comment.objects.update(likes_count=0)
+
+        importlib.import_module(
+            "apps.post.migrations.0002_post_comments_count_post_likes_count"
+        ).backfill_counters(apps, None)
+        importlib.import_module(
+            "apps.comment.migrations.0002_comment_likes_count"
+        ).backfill_likes_count(apps, None)
+
+        self.post.refresh_from_db()
+        comment.refresh_from_db()
+        self.assertEqual((self.post.likes_count, self.post.comments_count), (1, 1))
+        self.assertEqual(comment.likes_count, 1)
+
+    def test_list_posts_cursor_pagination(self):
+        """커서 페이지네이션으로 전체 게시물을 중복 없이 순회하는지 테스트"""
+        for index in range(11):
+            Post.objects.create(title=f"커서 {index}", content="내용", author=self.user)
+
+        response = self.client.get(
+            reverse("post-list"), {"pagination": "cursor", "page_size": 5}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn("count", response.data)
+        self.assertIsNone(response.data["previous"])
+
+        pages = [[row["id"] for row in response.data["results"]]]
+        while response.data["next"]:
+            response = self.client.get(response.data["next"])
+            pages.append([row["id"] for row in response.data["results"]])
+
+        seen = [post_id for page in pages for post_id in page]
+        expected = list(
+            Post.objects.order_by("-created_at", "-id").values_list("id", flat=True)
+        )
+        self.assertEqual(seen, expected)
+        self.assertEqual([len(page) for page in pages], [5, 5, 2])
+
+        previous = self.client.get(response.data["previous"])
+        self.assertEqual([row["id"] for row in previous.data["results"]], pages[1])
+
+    def test_list_posts_invalid_cursor(self):
+        """잘못된 커서 요청 시 400을 반환하는지 테스트"""
+        response = self.client.get(
+            reverse("post-list"), {"pagination": "cursor", "cursor": "broken"}
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_cursor_pagination_rejects_ordering(self):
+        """커서 페이지네이션에 ordering 을 함께 주면 무시하지 않고 400을 반환하는지 테스트"""
+        response = self.client.get(
+            reverse("post-list"), {"pagination": "cursor", "ordering": "-views"}
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_view_counter_batches_updates(self):
+        """조회수가 버퍼에 모였다가 flush 시 한 번에 반영되는지 테스트"""
+        other_post = Post.objects.create(
+            title="Other", content="내용", author=self.other_user
+        )
+        self.post.increase_views()
+        self.post.increase_views()
+        other_post.increase_views()
+
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.views, 0)
+        self.assertEqual(self.post.current_views, 2)
+
+        with CaptureQueriesContext(connection) as ctx:
+            flushed = view_counter.flush()
+        self.assertEqual(flushed, 2)
+        self.assertEqual(len(ctx.captured_queries), 1)
+
+        self.post.refresh_from_db()
+        other_post.refresh_from_db()
+        self.assertEqual(self.post.views, 2)
+        self.assertEqual(other_post.views, 1)
+        self.assertEqual(view_counter.pending(self.post.pk), 0)
+
+    @override_settings(
+        POST_VIEWS_FLUSH_IN_BACKGROUND=True, POST_VIEWS_FLUSH_INTERVAL=10
+    )
+    def test_view_counter_schedules_background_flush(self):
+        """이후 요청이 없어도 주기 안에 반영되도록 조회수가 쌓이면 타이머를 한 번만 거는지 테스트"""
+        with mock.patch("apps.post.view_counter.threading.Timer") as timer:
+            timer.return_value.is_alive.return_value = True
+            self.post.increase_views()
+            self.post.increase_views()
+        timer.assert_called_once_with(10, view_counter._flush_in_background)
+        timer.return_value.start.assert_called_once_with()
+
+        view_counter.clear()
+        timer.return_value.cancel.assert_called_once_with()
+
+    def test_generation_bump_without_incr(self):
+        """세대를 incr 없이 올리고(만료 없음) 잠금 키를 남기지 않는지 테스트"""
+        before = response_cache.get_generation()
+        with mock.patch.object(cache, "incr", side_effect=AssertionError):
+            response_cache.bump_generation()
+            middle = response_cache.get_generation()
+            response_cache.bump_generation()
+        self.assertLess(before, middle)
+        self.assertLess(middle, response_cache.get_generation())
+        self.assertIsNone(cache.get(response_cache.generation.lock_key))
+
+    def test_posts_search_title_and_content(self):
+        """검색이 제목과 내용 모두를 대상으로 하고 조사가 붙은 단어도 찾는지 테스트"""
+        in_title = Post.objects.create(
+            title="아이브가 컴백했어요", content="무대 최고", author=self.user
+        )
+        in_content = Post.objects.create(
+            title="오늘의 무대", content="아이브 컴백 무대 후기", author=self.user
+        )
+        Post.objects.create(title="다른 글", content="뉴진스 이야기", author=self.user)
+
+        response = self.client.get(reverse("post-posts_search"), {"q": "아이브 컴백"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        ids = {row["id"] for row in response.data["results"]}
+        self.assertEqual(ids, {in_title.id, in_content.id})
+
+    def test_posts_search_ranks_by_relevance(self):
+        """검색 결과가 관련도 순으로 정렬되는지 테스트"""
+        strong = Post.objects.create(
+            title="컴백 컴백 컴백", content="컴백 소식 컴백", author=self.user
+        )
+        weak = Post.objects.create(
+            title="일상 이야기", content="긴 글 중간에 컴백 이야기", author=self.user
+        )
+        response = self.client.get(reverse("post-posts_search"), {"q": "컴백"})
+        ids = [row["id"] for row in response.data["results"]]
+        self.assertEqual(ids, [strong.id, weak.id])
+
+    def test_posts_search_reflects_updates(self):
+        """게시물 수정 후 검색 결과가 갱신되는지 테스트"""
+        self.post.title = "새로운 제목"
+        self.post.save(update_fields=["title"])
+        response = self.client.get(reverse("post-posts_search"), {"q": "새로운"})
+        ids = [row["id"] for row in response.data["results"]]
+        self.assertEqual(ids, [self.post.id])
+
+    def test_posts_search_removes_deleted_posts(self):
+        """게시물 행이 삭제되면(작성자 탈퇴 등) 검색 테이블의 문서도 지워지는지 테스트"""
+        pk = Post.objects.create(
+            title="콘서트", content="에스파 콘서트", author=self.user
+        ).pk
+        # Post.delete() 는 소프트 삭제이므로 쿼리셋으로 실제 행을 삭제
+        Post.objects.filter(pk=pk).delete()
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"SELECT COUNT(*) FROM {SQLITE_FTS_TABLE} WHERE rowid = %s", [pk]
+            )
+            self.assertEqual(cursor.fetchone()[0], 0)
+
+    def test_posts_search_rejects_cursor(self):
+        """관련도 순 검색에 커서 페이지네이션을 함께 주면 400을 반환하는지 테스트"""
+        url = reverse("post-posts_search")
+        response = self.client.get(url, {"q": "컴백", "pagination": "cursor"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        # 검색어가 없으면 작성일 순이므로 커서 페이지네이션 가능
+        response = self.client.get(url, {"pagination": "cursor"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_search_migration_backfills_existing_posts(self):
+        """검색 컬럼 마이그레이션이 기존 게시물의 검색 문서를 채우는지 테스트"""
+        Post.objects.filter(pk=self.post.pk).update(search_document="")
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {SQLITE_FTS_TABLE}")
+
+        importlib.import_module(
+            "apps.post.migrations.0003_post_search"
+        ).backfill_search_documents(apps, SimpleNamespace(connection=connection))
+
+        response = self.client.get(reverse("post-posts_search"), {"q": self.post.title})
+        ids = [row["id"] for row in response.data["results"]]
+        self.assertEqual(ids, [self.post.id])
+
+    def test_posts_search_single_character(self):
+        """1글자 검색어는 부분 일치로 검색되는지 테스트"""
+        response = self.client.get(reverse("post-posts_search"), {"q": "T"})
+        ids = [row["id"] for row in response.data["results"]]
+        self.assertEqual(ids, [self.post.id])
+
+    def test_list_posts_filter_q(self):
+        """목록 조회의 q 필터가 전문 검색을 사용하는지 테스트"""
+        target = Post.objects.create(
+            title="콘서트", content="에스파 콘서트 후기", author=self.user
+        )
+        response = self.client.get(reverse("post-list"), {"q": "에스파"})
+        ids = [row["id"] for row in response.data["results"]]
+        self.assertEqual(ids, [target.id])
+
+    def test_list_posts_served_from_cache(self):
+        """같은 쿼리의 두 번째 목록 조회는 게시물을 다시 불러오지 않고 캐시에서 응답하는지 테스트"""
+        url = reverse("post-list")
+        first = self.client.get(url)
+        with CaptureQueriesContext(connection) as ctx:
+            second = self.client.get(url)
+        self.assertEqual(first.data, second.data)
+        # 게시물 테이블은 조건부 GET 검증자용 집계(MAX/COUNT) 쿼리만 실행
+        post_table = Post._meta.db_table
+        post_queries = [
+            query["sql"]
+            for query in ctx.captured_queries
+            if f'FROM "{post_table}"' in query["sql"]
+        ]
+        self.assertEqual(len(post_queries), 1)
+        self.assertIn("MAX(", post_queries[0])
+
+    def test_post_cache_invalidated_on_changes(self):
+        """좋아요/댓글 삭제/게시물 삭제 시 캐시된 응답이 갱신되는지 테스트"""
+        list_url = reverse("post-list")
+        detail_url = reverse("post-detail", kwargs={"pk": self.post.id})
+        self.client.get(list_url)
+        self.client.get(detail_url)
+
+        self.client.post(reverse("post-likes", kwargs={"pk": self.post.id}))
+        self.assertEqual(self.client.get(list_url).data["results"][0]["likes_count"], 1)
+        self.assertEqual(self.client.get(detail_url).data["likes_count"], 1)
+
+        comment = Comment.objects.create(post=self.post, author=self.user, content="c")
+        self.assertEqual(self.client.get(detail_url).data["comments_count"], 1)
+        comment.soft_delete(self.user)
+        self.assertEqual(self.client.get(detail_url).data["comments_count"], 0)
+
+        self.post.soft_delete(self.user)
+        self.assertEqual(self.client.get(list_url).data["count"], 0)
+
+    def test_post_cache_overlays_user_fields(self):
+        """캐시된 본문 하나로 사용자별 is_liked 와 미반영 조회수가 응답되는지 테스트"""
+        Like.objects.create(
+            content_type=self.post_content_type, object_id=self.post.id, user=self.user
+        )
+        url = reverse("post-detail", kwargs={"pk": self.post.id})
+        response = self.client.get(url)
+        self.assertTrue(response.data["is_liked"])
+        self.assertEqual(response.data["views"], 1)
+
+        self.client.force_authenticate(user=self.other_user)
+        response = self.client.get(url)
+        self.assertFalse(response.data["is_liked"])
+        self.assertEqual(response.data["views"], 2)
+
+        self.client.force_authenticate(user=None)
+        response = self.client.get(reverse("post-list"))
+        self.assertFalse(response.data["results"][0]["is_liked"])
+        self.assertEqual(response.data["results"][0]["views"], 2)
+
+    def test_post_conditional_get(self):
+        """ETag 가 일치하면 304, 좋아요로 바뀌면 새 본문을 반환하는지 테스트"""
+        url = reverse("post-detail", kwargs={"pk": self.post.id})
+        response = self.client.get(url)
+        etag = response["ETag"]
+        self.assertIn("Last-Modified", response)
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        Like.objects.create(
+            content_type=self.post_content_type, object_id=self.post.id, user=self.user
+        )
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["likes_count"], 1)
+
+    def test_post_list_etag_varies_by_user(self):
+        """is_liked 가 사용자마다 다르므로 목록 ETag 도 사용자마다 다른지 테스트"""
+        url = reverse("post-list")
+        etag = self.client.get(url)["ETag"]
+        self.assertEqual(
+            self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code,
+            status.HTTP_304_NOT_MODIFIED,
+        )
+
+        self.client.force_authenticate(user=self.other_user)
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_trending_ranks_by_engagement(self):
+        """좋아요/댓글이 많은 게시물이 인기 게시물 상위에 오는지 테스트"""
+        popular = Post.objects.create(
+            title="인기", content="내용", author=self.other_user
+        )
+        Like.objects.create(
+            content_type=self.post_content_type, object_id=popular.id, user=self.user
+        )
+        Comment.objects.create(post=popular, author=self.user, content="댓글")
+
+        # 조회는 랭킹 테이블만 읽으므로 갱신 전에는 비어 있음
+        response = self.client.get(reverse("post-posts_trending"), {"limit": 1})
+        self.assertEqual(response.data, [])
+        self.assertFalse(TrendingPost.objects.exists())
+
+        call_command("refresh_trending_posts", stdout=io.StringIO())
+        response = self.client.get(reverse("post-posts_trending"), {"limit": 1})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([row["id"] for row in response.data], [popular.id])
+        self.assertEqual(response.data[0]["likes_count"], 1)
+
+    def test_trending_refresh_is_incremental(self):
+        """마지막 갱신 이후 활동한 게시물만 다시 계산하고 삭제된 게시물은 제외하는지 테스트"""
+        other = Post.objects.create(title="다른", content="내용", author=self.user)
+        self.assertEqual(refresh_trending(), 2)
+        self.assertEqual(refresh_trending(), 0)
+
+        Like.objects.create(
+            content_type=self.post_content_type, object_id=other.id, user=self.user
+        )
+        self.assertEqual(refresh_trending(), 1)
+        before = TrendingPost.objects.get(post=self.post).score
+
+        self.post.soft_delete(self.user)
+        self.assertEqual(refresh_trending(), 1)
+        self.assertFalse(TrendingPost.objects.filter(post=self.post).exists())
+        self.assertTrue(before < TrendingPost.objects.get(post=other).score)
@@ -0,0 +1,101 @@
+import math
+from datetime import datetime
+from datetime import timezone as dt_timezone
+
+from django.db import transaction
+from django.db.models import Max
+from django.utils import timezone
+
+from .models import Post, TrendingPost
+from .view_counter import view_counter
+
+# 인기 게시물 점수
+#
+#   score = log10(조회수 * 1 + 좋아요 * 5 + 댓글 * 10) + (작성 시각 - EPOCH) / DECAY_SECONDS
+#
+# 참여도가 10배인 게시물과 DECAY_SECONDS 만큼 늦게 작성된 게시물이 같은 점수가 되므로
+# 오래된 게시물일수록 점수가 상대적으로 낮아집니다(감쇠). 현재 시각이 식에 들어가지 않아
+# 활동이 없는 게시물의 점수는 바뀌지 않으므로, 마지막 계산 이후 활동이 있었던
+# 게시물(Post.activity_at)만 다시 계산하면 됩니다.
+#
+# 갱신은 refresh_trending_posts 커맨드(--loop 또는 cron)에서만 실행하고,
+# posts/trending 조회는 랭킹 테이블만 읽습니다.
+
+VIEW_WEIGHT = 1
+LIKE_WEIGHT = 5
+COMMENT_WEIGHT = 10
+DECAY_SECONDS = 45000  # 12.5시간
+EPOCH = datetime(2025, 1, 1, tzinfo=dt_timezone.utc)
+
+
+def trending_score(views, likes_count, comments_count, created_at):
+    """게시물 인기 점수를 계산합니다."""
+    engagement = (
+        views * VIEW_WEIGHT
+        + likes_count * LIKE_WEIGHT
+        + comments_count * COMMENT_WEIGHT
+    )
+    age = (created_at - EPOCH).total_seconds()
+    return math.log10(max(engagement, 1)) + age / DECAY_SECONDS
+
+
+def refresh_trending(full=False, batch_size=1000):
+    """
+    인기 게시물 랭킹을 갱신하고 다시 계산한 게시물 수를 반환합니다.
+
+    Args:
+        full (bool): True 면 전체 게시물을 다시 계산 (기본: 마지막 계산 이후 활동한 게시물만)
+        batch_size (int): 한 번에 처리할 게시물 수
+    """
+    # 이 프로세스에 쌓여 있는 조회수부터 반영
+    view_counter.flush()
+
+    # 계산 도중 활동한 게시물이 다음 실행에서 빠지지 않도록 시작 시각을 기준으로 기록
+    started_at = timezone.now()
+    posts = Post.objects.all()
+    if not full:
+        since = TrendingPost.objects.aggregate(last=Max("refreshed_at"))["last"]
+        if since is not None:
+            posts = posts.filter(activity_at__gte=since)
+
+    # 다음 실행은 refreshed_at 최댓값 이후 활동만 보므로, 중간에 실패해도 일부만
+    # 기록되지 않도록 한 트랜잭션으로 처리 (랭킹 테이블만 쓰므로 게시물 쓰기는 막지 않음)
+    refreshed = 0
+    last_pk = 0
+    with transaction.atomic():
+        while True:
+            rows = list(
+                posts.filter(pk__gt=last_pk)
+                .order_by("pk")
+                .values_list(
+                    "pk",
+                    "views",
+                    "likes_count",
+                    "comments_count",
+                    "created_at",
+                    "is_deleted",
+                )[:batch_size]
+            )
+            if not rows:
+                return refreshed
+            last_pk = rows[-1][0]
+
+            ranked = [
+                TrendingPost(
+                    post_id=pk,
+                    score=trending_score(views, likes, comments, created_at),
+                    refreshed_at=started_at,
+                )
+                for pk, views, likes, comments, created_at, is_deleted in rows
+                if not is_deleted
+            ]
+            TrendingPost.objects.bulk_create(
+                ranked,
+                update_conflicts=True,
+                unique_fields=["post"],
+                update_fields=["score", "refreshed_at"],
+            )
+            deleted = [row[0] for row in rows if row[5]]
+            if deleted:
+                TrendingPost.objects.filter(post_id__in=deleted).delete()
+            refreshed += len(rows)
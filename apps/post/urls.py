@@ -19,4 +19,9 @@ urlpatterns = [
         PostViewSet.as_view({"get": "posts_search"}),
         name="post-posts_search",
     ),
+    path(
+        "posts/trending",
+        PostViewSet.as_view({"get": "posts_trending"}),
+        name="post-posts_trending",
+    ),
 ]
@@ -0,0 +1,153 @@
+import atexit
+import logging
+import threading
+import time
+
+from django.apps import apps
+from django.conf import settings
+from django.db import connection
+from django.db.models import Case, F, PositiveIntegerField, Value, When
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+
+class ViewCountBuffer:
+    """
+    게시물 조회수 쓰기 지연(write-behind) 버퍼
+
+    조회할 때마다 같은 행을 UPDATE 하면 인기 게시물에서 행 락 경합이 생기므로,
+    프로세스 메모리에 증가분을 모아 두었다가 일정 주기마다
+    UPDATE ... SET views = views + CASE id WHEN ... END 한 번으로 반영합니다.
+    이후 요청이 없어도 flush_interval 안에 반영되도록, 버퍼에 증가분이 쌓이면
+    백그라운드 타이머(데몬 스레드)를 걸어 둡니다. (POST_VIEWS_FLUSH_IN_BACKGROUND)
+
+    Attributes:
+        model_label (str): 대상 모델 ("app_label.ModelName")
+        field (str): 증가시킬 필드 이름
+        touch_field (str, optional): 반영할 때 현재 시각으로 함께 갱신할 필드 이름
+        batch_size (int): UPDATE 한 번에 포함할 최대 행 수
+    """
+
+    batch_size = 500
+
+    def __init__(self, model_label, field, touch_field=None):
+        self.model_label = model_label
+        self.field = field
+        self.touch_field = touch_field
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._last_flush = time.monotonic()
+        self._timer = None
+
+    @property
+    def flush_interval(self):
+        return getattr(settings, "POST_VIEWS_FLUSH_INTERVAL", 10)
+
+    @property
+    def max_pending(self):
+        return getattr(settings, "POST_VIEWS_FLUSH_MAX_PENDING", 1000)
+
+    @property
+    def flush_in_background(self):
+        return getattr(settings, "POST_VIEWS_FLUSH_IN_BACKGROUND", True)
+
+    def record(self, pk, amount=1):
+        """
+        증가분을 버퍼에 쌓고, 주기가 지났거나 버퍼가 가득 찼으면 반영합니다.
+        이번 호출에서 DB에 반영했으면 True 를 반환합니다.
+        """
+        with self._lock:
+            self._pending[pk] = self._pending.get(pk, 0) + amount
+            should_flush = (
+                time.monotonic() - self._last_flush >= self.flush_interval
+                or len(self._pending) >= self.max_pending
+            )
+            if not should_flush:
+                self._schedule_flush()
+        if should_flush:
+            self.flush()
+        return should_flush
+
+    def _schedule_flush(self):
+        """
+        쌓인 증가분이 flush_interval 안에 반영되도록 타이머를 겁니다. (self._lock 안에서 호출)
+        이미 걸려 있으면 그대로 둡니다. fork 된 워커에는 부모의 타이머 스레드가 없으므로
+        is_alive() 로 확인해 다시 겁니다.
+        """
+        if not self.flush_in_background:
+            return
+        if self._timer is not None and self._timer.is_alive():
+            return
+        self._timer = threading.Timer(self.flush_interval, self._flush_in_background)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _flush_in_background(self):
+        with self._lock:
+            # 반영에 실패해 다시 쌓인 증가분은 새 타이머가 처리하도록 비워 둠
+            self._timer = None
+        try:
+            self.flush()
+        finally:
+            # 타이머 스레드의 DB 연결만 닫음 (스레드마다 연결이 따로 열림)
+            connection.close()
+
+    def pending(self, pk):
+        """아직 DB에 반영되지 않은 증가분을 반환합니다."""
+        return self._pending.get(pk, 0)
+
+    def flush(self):
+        """버퍼에 쌓인 증가분을 배치 UPDATE 로 DB에 반영하고 반영한 행 수를 반환합니다."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            self._last_flush = time.monotonic()
+        if not pending:
+            return 0
+
+        model = apps.get_model(self.model_label)
+        items = list(pending.items())
+        for start in range(0, len(items), self.batch_size):
+            chunk = items[start : start + self.batch_size]
+            delta = Case(
+                *[When(pk=pk, then=Value(amount)) for pk, amount in chunk],
+                default=Value(0),
+                output_field=PositiveIntegerField(),
+            )
+            values = {self.field: F(self.field) + delta}
+            if self.touch_field:
+                values[self.touch_field] = timezone.now()
+            try:
+                model.objects.filter(pk__in=[pk for pk, _ in chunk]).update(**values)
+            except Exception:
+                # 반영하지 못한 증가분은 버리지 않고 다음 주기에 다시 시도
+                logger.exception("조회수 반영 중 오류 발생")
+                with self._lock:
+                    for pk, amount in items[start:]:
+                        self._pending[pk] = self._pending.get(pk, 0) + amount
+                    self._schedule_flush()
+                self._on_flushed(start)
+                return start
+        self._on_flushed(len(items))
+        return len(items)
+
+    def _on_flushed(self, count):
+        """반영된 조회수가 캐시된 응답에도 보이도록 게시물 응답 캐시를 무효화합니다."""
+        if count:
+            from .cache import bump_generation
+
+            bump_generation()
+
+    def clear(self):
+        """반영하지 않고 버퍼를 비우고 걸려 있는 타이머를 취소합니다."""
+        with self._lock:
+            self._pending = {}
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+
+view_counter = ViewCountBuffer("post.Post", "views", touch_field="activity_at")
+
+# 워커 종료 시 남은 증가분 반영
+atexit.register(view_counter.flush)
@@ -2,7 +2,6 @@ import logging
 
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import PermissionDenied, ValidationError
-from django.db.models import F
 from django.shortcuts import get_object_or_404
 from django_filters import rest_framework as django_filters
 from drf_yasg import openapi
@@ -14,20 +13,64 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework_simplejwt.authentication import JWTAuthentication
 
+from apps.like.likers import paginate_likers
 from apps.like.models import Like
+from apps.like.toggle import add_like, remove_like
+from utils.conditional import ConditionalGetMixin, probe
 from utils.exceptions import CustomAPIException
+from utils.pagination import (
+    CURSOR_RELEVANCE_NOT_SUPPORTED,
+    CursorPaginationModeMixin,
+)
 
+from . import cache as response_cache
 from .models import Post
 from .pagination import PostPagination
-from .serializers import PostCreateSerializer, PostSerializer, PostUpdateSerializer
-from .utils import process_image
+from .querysets import with_feed_data
+from .search import search_posts
+from .serializers import (
+    PostCardSerializer,
+    PostCreateSerializer,
+    PostSerializer,
+    PostUpdateSerializer,
+)
+from .view_counter import view_counter
 
 logger = logging.getLogger(__name__)
 
+PAGINATION_MODE_PARAMETER = openapi.Parameter(
+    "pagination",
+    openapi.IN_QUERY,
+    description=(
+        "cursor 로 지정하면 커서 페이지네이션 사용 "
+        "(count 없음, 작성일 순 고정이라 ordering 과 함께 쓰면 400)"
+    ),
+    type=openapi.TYPE_STRING,
+    enum=["cursor"],
+)
+COMMENT_PREVIEW_PARAMETER = openapi.Parameter(
+    "comment_preview",
+    openapi.IN_QUERY,
+    description="게시물별로 포함할 최신 댓글 수 (기본 3, 최대 20, 0이면 미포함)",
+    type=openapi.TYPE_INTEGER,
+)
+CURSOR_PARAMETER = openapi.Parameter(
+    "cursor",
+    openapi.IN_QUERY,
+    description="이전 응답의 next/previous 에 포함된 커서",
+    type=openapi.TYPE_STRING,
+)
+
 
 class PostFilter(django_filters.FilterSet):
-    """게시글 필터"""
+    """
+    게시글 필터
+
+    - q: 제목/내용 전문 검색 (정렬은 ordering 을 따르며, 관련도 순 정렬은 posts/search)
+    - title, content: 부분 일치 (PostgreSQL 에서는 trigram 인덱스 사용)
+    """
 
+    q = django_filters.CharFilter(method="filter_search")
     title = django_filters.CharFilter(lookup_expr="icontains")
     content = django_filters.CharFilter(lookup_expr="icontains")
     created_at = django_filters.DateTimeFilter(lookup_expr="gte")
@@ -37,16 +80,28 @@ class PostFilter(django_filters.FilterSet):
 
     class Meta:
         model = Post
-        fields = ["title", "content", "created_at", "created_at_end"]
+        fields = ["q", "title", "content", "created_at", "created_at_end"]
 
+    def filter_search(self, queryset, name, value):
+        return search_posts(queryset, value)
 
-class PostViewSet(viewsets.ModelViewSet):
+
+class PostViewSet(
+    ConditionalGetMixin, CursorPaginationModeMixin, viewsets.ModelViewSet
+):
     """
     게시물 CRUD API
 
     게시물의 생성, 조회, 수정, 삭제를 처리합니다.
+    목록/검색은 ?pagination=cursor 로 (created_at, id) 커서 페이지네이션을 사용할 수 있습니다.
+    목록/상세 응답은 모든 사용자가 공유하는 본문을 캐시하고(apps/post/cache.py),
+    is_liked 와 미반영 조회수만 요청마다 덮어씁니다.
+    목록/상세는 ETag/Last-Modified 조건부 GET 을 지원합니다.
     """
 
+    cached_actions = ["list", "retrieve"]
+    conditional_vary_on_user = True
+
     http_method_names = ["get", "post", "patch", "delete"]
     filter_backends = [
         django_filters.DjangoFilterBackend,
@@ -67,7 +122,7 @@ class PostViewSet(viewsets.ModelViewSet):
         - 조회(GET): 모든 사용자 가능
         - 생성(POST), 수정(PATCH), 삭제(DELETE): 인증된 사용자만 가능
         """
-        if self.action in ["list", "retrieve"]:
+        if self.action in ["list", "retrieve", "posts_trending"]:
             return [AllowAny()]
 
         if not self.request.user.is_authenticated:
@@ -94,14 +149,87 @@ class PostViewSet(viewsets.ModelViewSet):
             # 필터링, 검색, 정렬 적용
             for backend in list(self.filter_backends):
                 queryset = backend().filter_queryset(self.request, queryset, self)
+
+        if self.action == "list":
+            # 작성자/좋아요/이미지/댓글 미리보기를 미리 불러와 N+1 쿼리를 방지
+            # 캐시되는 공유 본문이므로 사용자별 is_liked 는 계산하지 않음
+            queryset = with_feed_data(
+                queryset, None, comment_preview=self.get_comment_preview_size()
+            )
+        elif self.action == "retrieve":
+            queryset = with_feed_data(queryset, None)
         return queryset
 
+    def get_validator_probes(self):
+        """
+        게시물의 MAX(updated_at)/개수에 응답 캐시 세대를 더해 검증자를 만듭니다.
+        좋아요/댓글 수, 조회수 변경은 updated_at 을 바꾸지 않지만 세대는 바꿉니다.
+        """
+        # 목록은 get_queryset 에서 이미 필터/검색이 적용됨
+        queryset = self.get_queryset()
+        if self.action == "retrieve":
+            queryset = queryset.filter(pk=self.kwargs["pk"])
+        return [
+            probe(queryset),
+            (response_cache.get_changed_at(), response_cache.get_generation()),
+        ]
+
+    def get_cached_detail(self, request):
+        """게시물 상세 공유 본문을 캐시에서 가져오거나 렌더링해 캐시합니다. 삭제된 게시물은 None."""
+        key = response_cache.make_key("retrieve", request)
+        data = response_cache.get_cached(key)
+        if data is None:
+            instance = self.get_object()
+            # 삭제된 게시물인지 확인
+            if instance.is_deleted:
+                return None
+            data = self.get_serializer(instance).data
+            response_cache.set_cached(key, data)
+        return data
+
+    def render_detail(self, request):
+        """상세 공유 본문을 가져오고 조회수를 증가시킨 뒤 사용자별 값을 덮어씁니다."""
+        data = self.get_cached_detail(request)
+        if data is None:
+            return Response(
+                {
+                    "code": 404,
+                    "message": "게시물을 찾을 수 없습니다.",
+                    "data": None,
+                },
+                status=status.HTTP_404_NOT_FOUND,
+            )
+
+        # 해당 게시물을 보는 사용자가 인증된 사용자인지 확인
+        # 캐시에서 응답하더라도 조회수는 증가
+        if request.user.is_authenticated and view_counter.record(data["id"]):
+            # 조회수가 방금 DB에 반영되어 캐시가 무효화되었으므로 다시 불러옴
+            data = self.get_cached_detail(request)
+
+        return Response(response_cache.overlay_user_fields(data, request.user))
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        if self.action in self.cached_actions:
+            context["shared_cache"] = True
+        return context
+
+    def get_comment_preview_size(self):
+        """목록/검색 카드에 포함할 최신 댓글 수를 쿼리 파라미터에서 읽습니다."""
+        try:
+            size = int(self.request.query_params.get("comment_preview", 3))
+        except ValueError:
+            return 3
+        return max(0, min(size, 20))
+
     def get_serializer_class(self):
         """액션에 따라 적절한 시리얼라이저를 반환합니다."""
         if self.action == "create":
             return PostCreateSerializer
         elif self.action in ["update", "partial_update"]:
             return PostUpdateSerializer
+        elif self.action in ["list", "posts_search", "posts_trending"]:
+            return PostCardSerializer
         return PostSerializer
 
     def perform_create(self, serializer):
@@ -157,6 +285,11 @@ class PostViewSet(viewsets.ModelViewSet):
         operation_summary="게시글 목록 조회",
         operation_description="게시글 전체 목록을 조회합니다. (필터 및 검색 가능)",
         tags=["posts"],
+        manual_parameters=[
+            COMMENT_PREVIEW_PARAMETER,
+            PAGINATION_MODE_PARAMETER,
+            CURSOR_PARAMETER,
+        ],
         responses={
             200: openapi.Response(
                 description="게시글 목록 조회 결과입니다.",
@@ -206,8 +339,20 @@ class PostViewSet(viewsets.ModelViewSet):
         },
     )
     def list(self, request, *args, **kwargs):
-        """게시물 목록을 반환합니다."""
-        return super().list(request, *args, **kwargs)
+        """게시물 목록을 반환합니다. (쿼리 파라미터별 응답 캐시, 조건부 GET)"""
+        return self.conditional_get(request, lambda: self.render_list(request))
+
+    def render_list(self, request):
+        """목록 공유 본문을 캐시에서 가져오거나 렌더링하고 사용자별 값을 덮어씁니다."""
+        key = response_cache.make_key("list", request)
+        data = response_cache.get_cached(key)
+        if data is None:
+            response = super().list(request)
+            if response.status_code != status.HTTP_200_OK:
+                return response
+            data = response.data
+            response_cache.set_cached(key, data)
+        return Response(response_cache.overlay_user_fields(data, request.user))
 
     @swagger_auto_schema(
         operation_summary="게시글 검색",
@@ -217,9 +362,12 @@ class PostViewSet(viewsets.ModelViewSet):
             openapi.Parameter(
                 "q",
                 openapi.IN_QUERY,
-                description="검색어 (제목/내용)",
+                description="검색어 (제목/내용, 관련도 순이라 pagination=cursor 와 함께 쓰면 400)",
                 type=openapi.TYPE_STRING,
             ),
+            COMMENT_PREVIEW_PARAMETER,
+            PAGINATION_MODE_PARAMETER,
+            CURSOR_PARAMETER,
         ],
         responses={
             200: openapi.Response(
@@ -274,12 +422,60 @@ class PostViewSet(viewsets.ModelViewSet):
         q = request.query_params.get("q", "")
         queryset = Post.objects.filter(is_deleted=False)
         if q:
-            queryset = queryset.filter(title__icontains=q)
+            # 커서 페이지네이션은 작성일 순으로 다시 정렬하므로 관련도 순 검색과 함께 쓰지 않음
+            if self.use_cursor_pagination():
+                raise CustomAPIException(CURSOR_RELEVANCE_NOT_SUPPORTED)
+            # 제목/내용 전문 검색 후 관련도 순으로 정렬
+            queryset = search_posts(queryset, q)
+        queryset = with_feed_data(
+            queryset, request.user, comment_preview=self.get_comment_preview_size()
+        )
         page = self.paginate_queryset(queryset)
         if page is not None:
-            serializer = PostSerializer(page, many=True, context={"request": request})
+            serializer = PostCardSerializer(
+                page, many=True, context={"request": request}
+            )
             return self.get_paginated_response(serializer.data)
-        serializer = PostSerializer(queryset, many=True, context={"request": request})
+        serializer = PostCardSerializer(
+            queryset, many=True, context={"request": request}
+        )
+        return Response(serializer.data)
+
+    @swagger_auto_schema(
+        operation_summary="인기 게시글 조회",
+        operation_description="조회수/좋아요/댓글 수와 작성 시각으로 계산한 인기 게시글 상위 N개를 조회합니다.",
+        tags=["posts"],
+        manual_parameters=[
+            openapi.Parameter(
+                "limit",
+                openapi.IN_QUERY,
+                description="조회할 게시글 수 (기본 10, 최대 50)",
+                type=openapi.TYPE_INTEGER,
+            ),
+            COMMENT_PREVIEW_PARAMETER,
+        ],
+        responses={200: PostCardSerializer(many=True)},
+    )
+    @action(detail=False, methods=["get"], url_path="trending", name="trending")
+    def posts_trending(self, request):
+        try:
+            limit = int(request.query_params.get("limit", 10))
+        except ValueError:
+            limit = 10
+        limit = max(1, min(limit, 50))
+
+        # 랭킹 테이블의 -score 인덱스 순으로 상위 N개만 조회
+        # (랭킹 갱신은 refresh_trending_posts 커맨드에서 실행, 여기서는 읽기만 함)
+        queryset = with_feed_data(
+            Post.objects.filter(is_deleted=False, trending__isnull=False).order_by(
+                "-trending__score", "-pk"
+            ),
+            request.user,
+            comment_preview=self.get_comment_preview_size(),
+        )[:limit]
+        serializer = PostCardSerializer(
+            queryset, many=True, context={"request": request}
+        )
         return Response(serializer.data)
 
     @swagger_auto_schema(
@@ -399,26 +595,16 @@ class PostViewSet(viewsets.ModelViewSet):
     def retrieve(self, request, *args, **kwargs):
         """게시물을 반환합니다."""
         try:
-            instance = self.get_object()
-            # 삭제된 게시물인지 확인
-            if instance.is_deleted:
-                return Response(
-                    {
-                        "code": 404,
-                        "message": "게시물을 찾을 수 없습니다.",
-                        "data": None,
-                    },
-                    status=status.HTTP_404_NOT_FOUND,
-                )
-
-            # 해당 게시물을 보는 사용자가 인증된 사용자인지 확인
-            if request.user.is_authenticated:
-                instance.views = F("views") + 1
-                instance.save(update_fields=["views"])
-                instance.refresh_from_db()
-
-            serializer = self.get_serializer(instance)
-            return Response(serializer.data)
+            response = self.conditional_get(
+                request, lambda: self.render_detail(request)
+            )
+            if (
+                response.status_code == status.HTTP_304_NOT_MODIFIED
+                and request.user.is_authenticated
+            ):
+                # 본문을 다시 받지 않더라도 조회수는 증가
+                view_counter.record(int(self.kwargs["pk"]))
+            return response
         except Exception as e:
             return Response(
                 {
@@ -541,24 +727,18 @@ class PostViewSet(viewsets.ModelViewSet):
     def likes(self, request, pk=None):
         """게시글 좋아요/취소 API (POST: 좋아요, DELETE: 좋아요 취소)"""
         post = self.get_object()
-        user = request.user
-        content_type = ContentType.objects.get_for_model(post)
 
         if request.method == "POST":
-            # 이미 좋아요가 있으면 아무 변화 없음
-            like, created = Like.objects.get_or_create(
-                content_type=content_type, object_id=post.id, user=user
-            )
+            # 이미 좋아요가 있으면 아무 변화 없음 (유니크 제약 기준 INSERT ... ON CONFLICT)
+            like_id, likes_count = add_like(post, request.user)
             return Response(
-                {"status": "liked"},
-                status=status.HTTP_201_CREATED if created else status.HTTP_200_OK,
+                {"status": "liked", "likes_count": likes_count},
+                status=status.HTTP_201_CREATED if like_id else status.HTTP_200_OK,
             )
         elif request.method == "DELETE":
-            deleted, _ = Like.objects.filter(
-                content_type=content_type, object_id=post.id, user=user
-            ).delete()
+            deleted, likes_count = remove_like(post, request.user)
             return Response(
-                {"status": "unliked"},
+                {"status": "unliked", "likes_count": likes_count},
                 status=status.HTTP_204_NO_CONTENT if deleted else status.HTTP_200_OK,
             )
 
@@ -573,17 +753,10 @@ class PostViewSet(viewsets.ModelViewSet):
             content_type=content_type, object_id=post.id, user=user
         ).exists()
 
-        # 좋아요한 사용자 목록
-        liked_users = (
-            Like.objects.filter(content_type=content_type, object_id=post.id)
-            .select_related("user")
-            .values_list("user__nickname", flat=True)
-        )
+        # 좋아요한 사용자 목록은 likers 에서 페이지 단위로 조회
+        return Response({"is_liked": is_liked, "likes_count": post.likes_count})
 
-        return Response(
-            {
-                "is_liked": is_liked,
-                "likes_count": post.likes.count(),
-                "liked_users": list(liked_users),
-            }
-        )
+    @action(detail=True, methods=["get"], url_path="likers")
+    def likers(self, request, pk=None):
+        """게시글 좋아요한 사용자 목록 API (최근 좋아요 순 커서 페이지네이션)"""
+        return paginate_likers(self.get_object(), request, view=self)
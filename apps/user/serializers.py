@@ -7,6 +7,7 @@ from rest_framework import serializers
 from rest_framework.validators import UniqueValidator
 from rest_framework_simplejwt.tokens import RefreshToken
 
+from apps.image.querysets import latest_image_url
 from utils.exceptions import CustomAPIException
 from utils.responses.user import (
     DUPLICATE_EMAIL,
@@ -124,11 +125,8 @@ class ProfileSerializer(serializers.ModelSerializer):
         ]
 
     def get_image_url(self, obj):
-        profile_image = obj.profile_images.first()
-        if profile_image and profile_image.image_url:
-            # image는 ImageField이기 때문에 .url 속성을 호출하면 저장된 파일의 경로가 자동으로 완전한 URL을 반환
-            return profile_image.image_url
-        return None
+        # 목록에서는 latest_image_prefetch("profile_images") 로 불러오면 추가 쿼리 없음
+        return latest_image_url(obj, "profile_images")
 
 
 # 결과 예시
@@ -6,8 +6,10 @@ from rest_framework.response import Response
 from rest_framework_simplejwt.authentication import JWTAuthentication
 
 from apps.follow.models import Follow
+from apps.idol.directory import idol_directory_generation
 from apps.idol_schedule.models import Schedule
 from apps.idol_schedule.serializers import IdolScheduleSerializer
+from utils.conditional import ConditionalGetMixin, probe
 from utils.responses import user_schedule as R
 
 from .models import UserSchedule
@@ -15,14 +17,30 @@ from .serializers import UserScheduleSerializer
 
 
 # 일정 목록 조회 및 사용자 일정 생성
-class UserScheduleListCreateView(generics.ListCreateAPIView):
+class UserScheduleListCreateView(ConditionalGetMixin, generics.ListCreateAPIView):
     serializer_class = UserScheduleSerializer
     permission_classes = [IsAuthenticated]
     authentication_classes = [JWTAuthentication]
+    conditional_vary_on_user = True
 
     def get_queryset(self):
         return UserSchedule.objects.filter(user=self.request.user)
 
+    def get_validator_probes(self):
+        # 내 일정, 팔로우한 아이돌 일정, 팔로우 목록, 아이돌 디렉터리(idol_name)
+        # 중 하나라도 바뀌면 검증자가 바뀜
+        follows = Follow.objects.filter(user=self.request.user)
+        return [
+            probe(self.get_queryset()),
+            probe(
+                Schedule.objects.filter(
+                    idol_id__in=follows.values_list("idol_id", flat=True)
+                )
+            ),
+            probe(follows, field="created_at"),
+            (idol_directory_generation.changed_at(), idol_directory_generation.get()),
+        ]
+
     @swagger_auto_schema(
         operation_summary="내 일정 목록 조회 (팔로우한 아이돌 일정 포함)",
         tags=["사용자 일정"],
@@ -31,6 +49,9 @@ class UserScheduleListCreateView(generics.ListCreateAPIView):
         },
     )
     def get(self, request, *args, **kwargs):
+        return self.conditional_get(request, lambda: self.render_list(request))
+
+    def render_list(self, request):
         user = request.user
 
         # 1. 사용자 일정
@@ -49,12 +70,8 @@ class UserScheduleListCreateView(generics.ListCreateAPIView):
                 "code": R.SCHEDULE_LIST_SUCCESS["code"],
                 "message": R.SCHEDULE_LIST_SUCCESS["message"],
                 "data": {
-                    "user_schedules": UserScheduleSerializer(
-                        user_schedules, many=True
-                    ).data,
-                    "idol_schedules": IdolScheduleSerializer(
-                        idol_schedules, many=True
-                    ).data,
+                    "user_schedules": user_schedule_data,
+                    "idol_schedules": idol_schedule_data,
                 },
             },
             status=R.SCHEDULE_LIST_SUCCESS["status"],
@@ -12,6 +12,7 @@ https://docs.djangoproject.com/en/5.2/ref/settings/
 
 # 이메일 보낼 때 SSL 인증서 경로 인식 불가 시 설정
 import os
+import tempfile
 from datetime import timedelta
 from pathlib import Path
 
@@ -271,3 +272,41 @@ SWAGGER_SETTINGS = {
         }
     },
 }
+
+# 게시물 조회수 쓰기 지연(write-behind) 설정 - apps/post/view_counter.py
+POST_VIEWS_FLUSH_INTERVAL = 10  # 누적된 조회수를 DB에 반영하는 주기 (초)
+POST_VIEWS_FLUSH_MAX_PENDING = 1000  # 주기 전이라도 이 수 이상의 게시물이 쌓이면 반영
+POST_VIEWS_FLUSH_IN_BACKGROUND = (
+    True  # 이후 요청이 없어도 주기 안에 타이머 스레드로 반영
+)
+
+# 캐시 - 로컬은 프로세스 메모리, 운영은 prod.py 에서 워커 간 공유되는 캐시로 교체
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "wistar",
+    }
+}
+
+# 게시물 목록/상세 응답 캐시 유지 시간 (초) - apps/post/cache.py
+POST_RESPONSE_CACHE_TIMEOUT = 60
+
+# 인기 게시물 랭킹 갱신 주기 (초) - refresh_trending_posts --loop
+POST_TRENDING_REFRESH_INTERVAL = 60
+
+# 아이돌 디렉터리 스냅샷 - apps/idol/directory.py
+# 같은 서버의 워커들이 함께 매핑하는 파일 경로
+# 세대는 CACHES 에 저장되므로 워커가 여럿이면 공유 캐시가 필요함 (check --deploy 경고)
+IDOL_DIRECTORY_PATH = os.path.join(tempfile.gettempdir(), "wistar-idol-directory.bin")
+IDOL_DIRECTORY_CHECK_INTERVAL = 1  # 스냅샷 세대를 확인하는 주기 (초)
+# 커밋 전 변경이 있을 때 워커가 스냅샷을 다시 만들지 않고 DB 에서 조회하는 최대 시간 (초)
+IDOL_DIRECTORY_PENDING_TIMEOUT = 30
+
+# 아이돌 이름 검색/자동완성 인덱스 세대를 확인하는 주기 (초) - apps/idol/search.py
+IDOL_SEARCH_CHECK_INTERVAL = 1
+
+# 이미지 변환/업로드 작업 설정 - apps/image/jobs.py
+IMAGE_JOB_LEASE_SECONDS = (
+    300  # 워커가 작업을 가져간 뒤 다른 워커가 다시 가져가기까지의 시간 (초)
+)
+IMAGE_JOB_MAX_ATTEMPTS = 3  # 이 횟수만큼 실패하면 failed 로 표시
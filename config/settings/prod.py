@@ -28,6 +28,14 @@ DATABASES = {
     }
 }
 
+# gunicorn 워커들이 같은 호스트에서 캐시(게시물 응답 캐시 세대 포함)를 공유하도록 파일 캐시 사용
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+        "LOCATION": ENV.get("CACHE_DIR", "/tmp/wistar_cache"),
+    }
+}
+
 import cloudinary
 
 cloudinary.config(
@@ -0,0 +1,71 @@
+import hashlib
+
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.utils.http import http_date
+
+
+def probe(queryset, field="updated_at"):
+    """쿼리셋의 (MAX(field), COUNT(*)) 를 집계 쿼리 한 번으로 구합니다."""
+    result = queryset.order_by().aggregate(last_modified=Max(field), count=Count("pk"))
+    return result["last_modified"], result["count"]
+
+
+class ConditionalGetMixin:
+    """
+    ETag / Last-Modified 조건부 GET 뷰 믹스인
+
+    get_validator_probes() 가 반환한 (마지막 수정 시각, 값) 목록으로 검증자를 만들고,
+    If-None-Match / If-Modified-Since 가 일치하면 조회/시리얼라이즈 없이 304 를 반환합니다.
+    기본 구현은 목록이면 필터링된 쿼리셋, 상세면 해당 행의 MAX(updated_at)/COUNT 입니다.
+
+    Attributes:
+        conditional_vary_on_user (bool): 응답이 사용자마다 다르면 True (ETag 에 사용자 포함)
+    """
+
+    conditional_vary_on_user = False
+
+    def get_validator_probes(self):
+        queryset = self.filter_queryset(self.get_queryset())
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        if lookup_url_kwarg in self.kwargs:
+            queryset = queryset.filter(
+                **{self.lookup_field: self.kwargs[lookup_url_kwarg]}
+            )
+        return [probe(queryset)]
+
+    def get_validators(self, request):
+        """(ETag, Last-Modified 타임스탬프) 를 반환합니다."""
+        probes = self.get_validator_probes()
+        parts = [request.get_full_path(), repr(probes)]
+        if self.conditional_vary_on_user:
+            parts.append(str(request.user.pk))
+        etag = 'W/"%s"' % hashlib.md5("|".join(parts).encode()).hexdigest()
+
+        last_modified = max(
+            (modified for modified, _ in probes if modified is not None), default=None
+        )
+        timestamp = int(last_modified.timestamp()) if last_modified else None
+        return etag, timestamp
+
+    def conditional_get(self, request, render):
+        """
+        검증자가 일치하면 304 를, 아니면 render() 결과에 ETag/Last-Modified 를 붙여 반환합니다.
+
+        Args:
+            request (Request): 요청
+            render (callable): 전체 응답을 만드는 함수
+        """
+        etag, timestamp = self.get_validators(request)
+        response = get_conditional_response(request, etag=etag, last_modified=timestamp)
+        if response is None:
+            response = render()
+        if response.status_code not in (200, 304):
+            return response
+
+        response["ETag"] = etag
+        if timestamp is not None:
+            response["Last-Modified"] = http_date(timestamp)
+        if self.conditional_vary_on_user:
+            patch_vary_headers(response, ["Authorization"])
+        return response
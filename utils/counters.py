@@ -0,0 +1,41 @@
+from django.db.models import F, Func, IntegerField, Q, Subquery
+
+# 비정규화 카운터 재계산
+#
+# 실제 개수를 읽은 뒤 bulk_update 로 되돌려 쓰면, 그 사이에 커밋된 F() 증감
+# (좋아요/댓글/팔로우)을 덮어써 운영 중에 카운터를 오히려 어긋나게 만듭니다.
+# UPDATE ... SET 카운터 = (SELECT COUNT(*) ...) 한 문장으로 DB 안에서 다시 계산합니다.
+# (reconcile 커맨드와 카운터를 추가하는 마이그레이션의 기존 데이터 채우기에서 사용)
+
+
+def count_subquery(queryset):
+    """
+    queryset 의 행 수를 구하는 상관 서브쿼리 식을 반환합니다. (행이 없으면 0)
+
+    Args:
+        queryset (QuerySet): OuterRef 로 바깥 행에 연결된 쿼리셋
+    """
+    return Subquery(
+        queryset.order_by()
+        .annotate(total=Func(F("pk"), function="COUNT"))
+        .values("total"),
+        output_field=IntegerField(),
+    )
+
+
+def recount(queryset, counts, dry_run=False):
+    """
+    실제 개수와 다른 행의 카운터만 UPDATE 한 문장으로 다시 계산합니다.
+
+    Args:
+        queryset (QuerySet): 보정할 행
+        counts (dict[str, Expression]): {카운터 필드명: count_subquery 식}
+        dry_run (bool): True 면 바꾸지 않고 어긋난 행 수만 셈
+
+    Returns:
+        int: 어긋난(보정한) 행 수
+    """
+    drifted = queryset.exclude(Q(**counts))
+    if dry_run:
+        return drifted.count()
+    return drifted.update(**counts)
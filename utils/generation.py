@@ -0,0 +1,70 @@
+import time
+from datetime import datetime, timezone
+
+from django.core.cache import cache
+
+
+class CacheGeneration:
+    """
+    캐시에 저장되는 "세대(generation)" 번호
+
+    데이터가 바뀔 때마다 세대 번호를 올리고, 캐시 키나 ETag 에 세대 번호를 넣어
+    이전 세대의 응답을 한 번에 무효화합니다. (키를 일일이 지우지 않음)
+    마지막으로 세대가 바뀐 시각도 함께 기록해 Last-Modified 계산에 사용합니다.
+
+    cache.incr 는 FileBasedCache(운영)에서 원자적이지 않고(get + set) 만료 시간을
+    기본값(300초)으로 되돌리므로 사용하지 않습니다. 대신 add 로 잠금 키를 잡고
+    세대를 읽어 timeout=None 으로 다시 씁니다. 새 세대는 max(이전 세대 + 1, 현재 시각(ms))
+    이므로 잠금을 잡지 못하고 진행하더라도 이전 세대로 되돌아가지 않습니다.
+    (FileBasedCache 의 add 도 파일 존재 확인 후 쓰기라 완전히 원자적이지는 않으며,
+    동시에 올린 세대가 같아지는 경우까지 막으려면 Redis/Memcached 처럼
+    add 가 원자적인 캐시를 사용해야 합니다.)
+
+    Attributes:
+        key (str): 세대 번호를 저장하는 캐시 키
+        changed_at_key (str): 마지막 변경 시각을 저장하는 캐시 키
+    """
+
+    lock_timeout = 5  # 잠금 키 유지 시간 (초) - 잠금을 잡은 프로세스가 죽어도 풀리도록
+    lock_wait = 0.5  # 잠금을 기다리는 최대 시간 (초)
+
+    def __init__(self, key, changed_at_key):
+        self.key = key
+        self.changed_at_key = changed_at_key
+        self.lock_key = f"{key}:lock"
+
+    def get(self):
+        generation = cache.get(self.key)
+        if generation is None:
+            # 세대 키가 만료/제거되어도 이전 세대와 겹치지 않도록 현재 시각으로 시작
+            cache.add(self.key, int(time.time() * 1000), timeout=None)
+            generation = cache.get(self.key)
+        return generation
+
+    def bump(self):
+        """세대를 올려 이전 세대의 캐시/검증자를 모두 무효화합니다."""
+        locked = self._acquire()
+        try:
+            current = cache.get(self.key) or 0
+            cache.set(self.key, max(current + 1, int(time.time() * 1000)), timeout=None)
+        finally:
+            if locked:
+                cache.delete(self.lock_key)
+        cache.set(self.changed_at_key, time.time(), timeout=None)
+
+    def _acquire(self):
+        """잠금 키를 잡으면 True, lock_wait 안에 잡지 못하면 False."""
+        deadline = time.monotonic() + self.lock_wait
+        while not cache.add(self.lock_key, True, timeout=self.lock_timeout):
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(0.005)
+        return True
+
+    def changed_at(self):
+        """마지막으로 세대가 바뀐 시각을 반환합니다. 기록이 없으면 현재 시각."""
+        changed_at = cache.get(self.changed_at_key)
+        if changed_at is None:
+            cache.add(self.changed_at_key, time.time(), timeout=None)
+            changed_at = cache.get(self.changed_at_key, time.time())
+        return datetime.fromtimestamp(changed_at, tz=timezone.utc)
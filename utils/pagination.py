@@ -0,0 +1,202 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+
+from django.db.models import Q
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+from utils.exceptions import CustomAPIException
+
+INVALID_CURSOR = {"code": 400, "message": "잘못된 커서입니다.", "data": None}
+CURSOR_ORDERING_NOT_SUPPORTED = {
+    "code": 400,
+    "message": "커서 페이지네이션은 작성일 순으로만 조회할 수 있어 ordering 과 함께 사용할 수 없습니다.",
+    "data": None,
+}
+CURSOR_RELEVANCE_NOT_SUPPORTED = {
+    "code": 400,
+    "message": "커서 페이지네이션은 작성일 순으로만 조회할 수 있어 관련도 순 검색과 함께 사용할 수 없습니다.",
+    "data": None,
+}
+
+
+class CreatedAtCursorPagination(BasePagination):
+    """
+    (created_at, id) 기준 키셋(커서) 페이지네이션
+
+    OFFSET 과 COUNT(*) 없이 마지막으로 본 행의 (created_at, id) 이후만 조회하므로
+    페이지 깊이와 관계없이 -created_at 인덱스를 타고 일정한 속도로 응답합니다.
+    커서는 base64 로 인코딩된 불투명한 문자열이며, 응답에는 count 가 포함되지 않습니다.
+
+    Attributes:
+        page_size (int): 한 페이지에 표시할 항목 수
+        page_size_query_param (str): 페이지 크기를 지정하는 쿼리 파라미터
+        max_page_size (int): 최대 페이지 크기
+        cursor_query_param (str): 커서를 전달하는 쿼리 파라미터
+        ascending (bool): True 면 오래된 순 (기본: 최신순)
+    """
+
+    page_size = 10
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    cursor_query_param = "cursor"
+    ascending = False
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        cursor = self.decode_cursor(request)
+
+        # 정방향 페이지 조건/정렬과, 이전 페이지를 가져올 때 쓰는 역방향 조건/정렬
+        newest_first = ("-created_at", "-pk")
+        oldest_first = ("created_at", "pk")
+        if self.ascending:
+            forward_lookup, forward_order = "gt", oldest_first
+            backward_lookup, backward_order = "lt", newest_first
+        else:
+            forward_lookup, forward_order = "lt", newest_first
+            backward_lookup, backward_order = "gt", oldest_first
+
+        if cursor is None:
+            reverse = False
+            queryset = queryset.order_by(*forward_order)
+        else:
+            created_at, pk, reverse = cursor
+            # 이전 페이지: 커서 앞쪽 항목을 역순으로 가져온 뒤 뒤집음
+            lookup, order = (
+                (backward_lookup, backward_order)
+                if reverse
+                else (forward_lookup, forward_order)
+            )
+            queryset = queryset.filter(
+                Q(**{f"created_at__{lookup}": created_at})
+                | Q(created_at=created_at, **{f"pk__{lookup}": pk})
+            ).order_by(*order)
+
+        rows = list(queryset[: self.page_size + 1])
+        has_more = len(rows) > self.page_size
+        rows = rows[: self.page_size]
+        if reverse:
+            rows.reverse()
+            self.has_next = True
+            self.has_previous = has_more
+        else:
+            self.has_next = has_more
+            self.has_previous = cursor is not None
+
+        self.page = rows
+        return rows
+
+    def get_page_size(self, request):
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        if page_size <= 0:
+            return self.page_size
+        return min(page_size, self.max_page_size)
+
+    def get_paginated_response(self, data):
+        return Response(
+            {
+                "next": self.get_next_link(),
+                "previous": self.get_previous_link(),
+                "results": data,
+            }
+        )
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "previous": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        return self.build_link(self.page[-1], reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        if not self.page:
+            # 빈 페이지에서는 커서 없이 첫 페이지로 돌아감
+            url = self.request.build_absolute_uri()
+            return remove_query_param(url, self.cursor_query_param)
+        return self.build_link(self.page[0], reverse=True)
+
+    def build_link(self, obj, reverse):
+        url = self.request.build_absolute_uri()
+        return replace_query_param(
+            url, self.cursor_query_param, self.encode_cursor(obj, reverse)
+        )
+
+    def encode_cursor(self, obj, reverse):
+        payload = json.dumps(
+            {"c": obj.created_at.isoformat(), "i": obj.pk, "r": int(reverse)},
+            separators=(",", ":"),
+        )
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+    def decode_cursor(self, request):
+        """커서를 (created_at, pk, reverse) 튜플로 복원합니다. 커서가 없으면 None."""
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            padded = encoded + "=" * (-len(encoded) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+            return (
+                datetime.fromisoformat(payload["c"]),
+                int(payload["i"]),
+                bool(payload.get("r", 0)),
+            )
+        except (binascii.Error, ValueError, TypeError, KeyError):
+            raise CustomAPIException(INVALID_CURSOR)
+
+
+class CursorPaginationModeMixin:
+    """
+    ?pagination=cursor 로 요청하면 기본 페이지 번호 방식 대신
+    CreatedAtCursorPagination 을 사용하도록 전환하는 뷰 믹스인 (opt-in)
+
+    커서 페이지네이션은 (created_at, id) 순서로만 동작하므로 ordering 파라미터와 함께
+    요청하면 무시하지 않고 400 으로 거절합니다.
+    """
+
+    cursor_pagination_class = CreatedAtCursorPagination
+    pagination_mode_query_param = "pagination"
+
+    def use_cursor_pagination(self):
+        request = getattr(self, "request", None)
+        if request is None:
+            return False
+        mode = request.query_params.get(self.pagination_mode_query_param)
+        return mode == "cursor"
+
+    def paginate_queryset(self, queryset):
+        if self.use_cursor_pagination() and self.request.query_params.get(
+            api_settings.ORDERING_PARAM
+        ):
+            raise CustomAPIException(CURSOR_ORDERING_NOT_SUPPORTED)
+        return super().paginate_queryset(queryset)
+
+    @property
+    def paginator(self):
+        if not hasattr(self, "_paginator"):
+            if self.use_cursor_pagination():
+                self._paginator = self.cursor_pagination_class()
+            elif self.pagination_class is None:
+                self._paginator = None
+            else:
+                self._paginator = self.pagination_class()
+        return self._paginator
@@ -36,3 +36,24 @@ FOLLOW_NOT_FOUND = {
     "message": "팔로우하지 않았습니다.",
     "data": None,
 }
+
+FOLLOW_IDOL_NOT_FOUND = {
+    "code": 404,
+    "message": "아이돌을 찾을 수 없습니다.",
+    "data": None,
+}
+
+FOLLOW_BULK_CREATE_SUCCESS = {
+    "code": status.HTTP_200_OK,
+    "message": "아이돌 일괄 팔로우 성공",
+}
+
+FOLLOW_BULK_DELETE_SUCCESS = {
+    "code": status.HTTP_200_OK,
+    "message": "아이돌 일괄 언팔로우 성공",
+}
+
+FOLLOW_BULK_INVALID = {
+    "code": 400,
+    "message": "잘못된 아이돌 목록입니다.",
+}
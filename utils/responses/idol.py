@@ -22,6 +22,14 @@ IDOL_SEARCH_NOT_FOUND = {
 }
 
 
+# GET /api/idols/autocomplete?q=ㅇㅇ
+IDOL_AUTOCOMPLETE_SUCCESS = {
+    "code": 200,
+    "message": "아이돌 자동완성 성공",
+    "data": [{"id": 100, "name": "오즈코딩", "en_name": "OZ CODING"}],
+}
+
+
 # GET /api/idols
 IDOL_LIST_SUCCESS = {
     "code": 200,
@@ -4,6 +4,24 @@ UPLOAD_SUCCESS = {
     "data": None,
 }
 
+UPLOAD_ACCEPTED = {
+    "code": 202,
+    "message": "업로드 요청이 접수되었습니다. 처리가 끝나면 이미지 주소가 채워집니다.",
+    "data": None,
+}
+
+IMAGE_STATUS_SUCCESS = {
+    "code": 200,
+    "message": "이미지 처리 상태 조회 성공",
+    "data": None,
+}
+
+IMAGE_NOT_FOUND = {
+    "code": 404,
+    "message": "이미지를 찾을 수 없습니다.",
+    "data": None,
+}
+
 IMAGE_REQUEST_MISSING = {"code": 400, "message": "요청 정보가 없습니다.", "data": None}
 
 # ===== 이미지 관련 =====